@@ -20,6 +20,7 @@ sys.path.append('utils')
 
 import streamlit as st
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.context_builder.entity_matcher import EntityNameMatcher
 from graphrag.query.indexer_adapters import (
     read_indexer_covariates,
     read_indexer_entities,
@@ -28,14 +29,17 @@ from graphrag.query.indexer_adapters import (
     read_indexer_text_units,
 )
 from graphrag.query.input.loaders.dfs import store_entity_semantic_embeddings
+from graphrag.query.llm.embedding_cache import QueryEmbeddingCache
 from graphrag.query.llm.oai.chat_openai import ChatOpenAI
 from graphrag.query.llm.oai.embedding import OpenAIEmbedding
 from graphrag.query.llm.oai.typing import OpenaiApiType
+from graphrag.query.llm.projection import ProjectedTextEmbedding
 from graphrag.query.structured_search.local_search.mixed_context import LocalSearchMixedContext
 from graphrag.query.structured_search.local_search.search import LocalSearch
 from graphrag.query.structured_search.global_search.search import GlobalSearch
 from graphrag.query.structured_search.global_search.community_context import GlobalCommunityContext
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
+from graphrag.vector_stores.projection import EmbeddingProjection
 
 # Import các tiện ích cải tiến
 try:
@@ -86,6 +90,7 @@ def load_search_system():
         COMMUNITY_REPORT_TABLE = "create_final_community_reports"
         ENTITY_TABLE = "create_final_nodes"
         ENTITY_EMBEDDING_TABLE = "create_final_entities"
+        NODE_COMMUNITY_TABLE = "create_final_node_communities"
         RELATIONSHIP_TABLE = "create_final_relationships"
         COVARIATE_TABLE = "create_final_covariates"
         TEXT_UNIT_TABLE = "create_final_text_units"
@@ -94,7 +99,16 @@ def load_search_system():
         # Tải dữ liệu
         entity_df = pd.read_parquet(f"{INPUT_DIR}/{ENTITY_TABLE}.parquet")
         entity_embedding_df = pd.read_parquet(f"{INPUT_DIR}/{ENTITY_EMBEDDING_TABLE}.parquet")
-        entities = read_indexer_entities(entity_df, entity_embedding_df, COMMUNITY_LEVEL)
+        # Chỉ có khi lập chỉ mục với cluster_graph.normalize_nodes
+        node_community_path = f"{INPUT_DIR}/{NODE_COMMUNITY_TABLE}.parquet"
+        node_community_df = (
+            pd.read_parquet(node_community_path)
+            if os.path.exists(node_community_path)
+            else None
+        )
+        entities = read_indexer_entities(
+            entity_df, entity_embedding_df, COMMUNITY_LEVEL, node_community_df
+        )
         
         relationship_df = pd.read_parquet(f"{INPUT_DIR}/{RELATIONSHIP_TABLE}.parquet")
         relationships = read_indexer_relationships(relationship_df)
@@ -104,7 +118,9 @@ def load_search_system():
         covariates = {"claims": claims}
         
         report_df = pd.read_parquet(f"{INPUT_DIR}/{COMMUNITY_REPORT_TABLE}.parquet")
-        reports = read_indexer_reports(report_df, entity_df, COMMUNITY_LEVEL)
+        reports = read_indexer_reports(
+            report_df, entity_df, COMMUNITY_LEVEL, node_community_df
+        )
         
         text_unit_df = pd.read_parquet(f"{INPUT_DIR}/{TEXT_UNIT_TABLE}.parquet")
         text_units = read_indexer_text_units(text_unit_df)
@@ -131,6 +147,9 @@ def load_search_system():
         
         token_encoder = tiktoken.get_encoding("cl100k_base")
         
+        # Bộ nhớ đệm embedding câu hỏi, dùng chung cho tìm kiếm cục bộ, kết hợp và đánh giá
+        query_embedding_cache = QueryEmbeddingCache(persist_dir="cache/query_embeddings")
+        
         text_embedder = OpenAIEmbedding(
             api_key=api_key,
             api_base=None,
@@ -138,7 +157,14 @@ def load_search_system():
             model=embedding_model,
             deployment_name=embedding_model,
             max_retries=20,
+            cache=query_embedding_cache,
+        )
+        # Chiếu embedding câu hỏi giống embedding thực thể nếu chúng đã được nén khi lập chỉ mục
+        projection = EmbeddingProjection.load(
+            f"{INPUT_DIR}/entity_description_embedding_projection.json"
         )
+        if projection is not None:
+            text_embedder = ProjectedTextEmbedding(text_embedder, projection)
         
         # Tạo context builders
         local_context_builder = LocalSearchMixedContext(
@@ -151,6 +177,8 @@ def load_search_system():
             embedding_vectorstore_key=EntityVectorStoreKey.ID,
             text_embedder=text_embedder,
             token_encoder=token_encoder,
+            # Khớp tên thực thể (không phân biệt dấu) trước khi tìm kiếm vector
+            entity_matcher=EntityNameMatcher(entities),
         )
         
         global_context_builder = GlobalCommunityContext(
@@ -211,6 +239,7 @@ def load_search_system():
             "reports": len(report_df),
             "text_units": len(text_unit_df),
             "input_dir": INPUT_DIR,
+            "query_embedding_cache": query_embedding_cache,
         }
         
         return (local_search, global_search, hybrid_search, stats), None
@@ -236,6 +265,12 @@ def main():
                 st.metric("Khẳng định", stats["claims"])
                 st.metric("Báo cáo cộng đồng", stats["reports"])
                 st.metric("Đơn vị văn bản", stats["text_units"])
+                cache_stats = stats["query_embedding_cache"].stats()
+                st.metric(
+                    "Tỉ lệ trúng cache embedding",
+                    f"{cache_stats['hit_rate']:.0%}",
+                    help=f"{cache_stats['hits'] + cache_stats['persistent_hits']} lần trúng, {cache_stats['misses']} lần trượt",
+                )
             else:
                 st.error(st.session_state.error_message)
         
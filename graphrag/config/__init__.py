@@ -13,6 +13,7 @@ from .enums import (
     LLMType,
     ReportingType,
     StorageType,
+    SummarizeReduceMode,
     TextEmbeddingTarget,
 )
 from .errors import (
@@ -113,6 +114,7 @@ __all__ = [
     "StorageType",
     "SummarizeDescriptionsConfig",
     "SummarizeDescriptionsConfigInput",
+    "SummarizeReduceMode",
     "TextEmbeddingConfig",
     "TextEmbeddingConfigInput",
     "TextEmbeddingTarget",
@@ -21,6 +21,7 @@ from .enums import (
     LLMType,
     ReportingType,
     StorageType,
+    SummarizeReduceMode,
     TextEmbeddingTarget,
 )
 from .environment_reader import EnvironmentReader
@@ -294,6 +295,12 @@ def create_graphrag_config(
         embeddings_config = values.get("embeddings") or {}
         with reader.envvar_prefix(Section.embedding), reader.use(embeddings_config):
             embeddings_target = reader.str("target")
+            query_cache_max_entries = reader.int("query_cache_max_entries")
+            query_cache_max_entries = (
+                query_cache_max_entries
+                if query_cache_max_entries is not None
+                else defs.EMBEDDING_QUERY_CACHE_MAX_ENTRIES
+            )
             embeddings_model = TextEmbeddingConfig(
                 llm=hydrate_embeddings_params(embeddings_config, llm_model),
                 parallelization=hydrate_parallelization_params(
@@ -310,6 +317,13 @@ def create_graphrag_config(
                 batch_max_tokens=reader.int("batch_max_tokens")
                 or defs.EMBEDDING_BATCH_MAX_TOKENS,
                 skip=reader.list("skip") or [],
+                compression=reader.str("compression") or defs.EMBEDDING_COMPRESSION,
+                compression_dimensions=reader.int("compression_dimensions")
+                or defs.EMBEDDING_COMPRESSION_DIMENSIONS,
+                quantize=reader.bool("quantize") or defs.EMBEDDING_QUANTIZE,
+                query_cache_max_entries=query_cache_max_entries,
+                query_cache_dir=reader.str("query_cache_dir")
+                or defs.EMBEDDING_QUERY_CACHE_DIR,
             )
         with (
             reader.envvar_prefix(Section.node2vec),
@@ -317,6 +331,8 @@ def create_graphrag_config(
         ):
             embed_graph_model = EmbedGraphConfig(
                 enabled=reader.bool(Fragment.enabled) or defs.NODE2VEC_ENABLED,
+                parallel=reader.bool("parallel") or defs.NODE2VEC_PARALLEL,
+                dimensions=reader.int("dimensions") or defs.NODE2VEC_DIMENSIONS,
                 num_walks=reader.int("num_walks") or defs.NODE2VEC_NUM_WALKS,
                 walk_length=reader.int("walk_length") or defs.NODE2VEC_WALK_LENGTH,
                 window_size=reader.int("window_size") or defs.NODE2VEC_WINDOW_SIZE,
@@ -477,6 +493,7 @@ def create_graphrag_config(
             reader.envvar_prefix(Section.summarize_descriptions),
             reader.use(values.get("summarize_descriptions")),
         ):
+            reduce_mode = reader.str("reduce_mode")
             summarize_descriptions_model = SummarizeDescriptionsConfig(
                 llm=hydrate_llm_params(summarize_description_config, llm_model),
                 parallelization=hydrate_parallelization_params(
@@ -486,11 +503,27 @@ def create_graphrag_config(
                 prompt=reader.str("prompt", Fragment.prompt_file),
                 max_length=reader.int(Fragment.max_length)
                 or defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH,
+                reduce_mode=SummarizeReduceMode(reduce_mode)
+                if reduce_mode
+                else defs.SUMMARIZE_DESCRIPTIONS_REDUCE_MODE,
+                batch_enabled=reader.bool("batch_enabled")
+                or defs.SUMMARIZE_DESCRIPTIONS_BATCH_ENABLED,
+                batch_max_tokens=reader.int("batch_max_tokens")
+                or defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS,
+                batch_max_output_tokens=reader.int("batch_max_output_tokens")
+                or defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_OUTPUT_TOKENS,
             )
 
         with reader.use(values.get("cluster_graph")):
             cluster_graph_model = ClusterGraphConfig(
-                max_cluster_size=reader.int("max_cluster_size") or defs.MAX_CLUSTER_SIZE
+                max_cluster_size=reader.int("max_cluster_size")
+                or defs.MAX_CLUSTER_SIZE,
+                emit_membership=reader.bool("emit_membership")
+                or defs.CLUSTER_GRAPH_EMIT_MEMBERSHIP,
+                all_components=reader.bool("all_components")
+                or defs.CLUSTER_GRAPH_ALL_COMPONENTS,
+                normalize_nodes=reader.bool("normalize_nodes")
+                or defs.CLUSTER_GRAPH_NORMALIZE_NODES,
             )
 
         with (
@@ -12,6 +12,7 @@ from .enums import (
     LLMType,
     ReportingType,
     StorageType,
+    SummarizeReduceMode,
     TextEmbeddingTarget,
 )
 
@@ -42,6 +43,11 @@ EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_BATCH_SIZE = 16
 EMBEDDING_BATCH_MAX_TOKENS = 8191
 EMBEDDING_TARGET = TextEmbeddingTarget.required
+EMBEDDING_COMPRESSION = None
+EMBEDDING_COMPRESSION_DIMENSIONS = 256
+EMBEDDING_QUANTIZE = False
+EMBEDDING_QUERY_CACHE_MAX_ENTRIES = 1024
+EMBEDDING_QUERY_CACHE_DIR = None
 
 CACHE_TYPE = CacheType.file
 CACHE_BASE_DIR = "cache"
@@ -54,6 +60,9 @@ CLAIM_DESCRIPTION = (
 CLAIM_MAX_GLEANINGS = 1
 CLAIM_EXTRACTION_ENABLED = False
 MAX_CLUSTER_SIZE = 10
+CLUSTER_GRAPH_EMIT_MEMBERSHIP = False
+CLUSTER_GRAPH_ALL_COMPONENTS = False
+CLUSTER_GRAPH_NORMALIZE_NODES = False
 COMMUNITY_REPORT_MAX_LENGTH = 2000
 COMMUNITY_REPORT_MAX_INPUT_LENGTH = 8000
 ENTITY_EXTRACTION_ENTITY_TYPES = ["organization", "person", "geo", "event"]
@@ -68,6 +77,8 @@ INPUT_TEXT_PATTERN = ".*\\.txt$"
 PARALLELIZATION_STAGGER = 0.3
 PARALLELIZATION_NUM_THREADS = 50
 NODE2VEC_ENABLED = False
+NODE2VEC_PARALLEL = False
+NODE2VEC_DIMENSIONS = 1536
 NODE2VEC_NUM_WALKS = 10
 NODE2VEC_WALK_LENGTH = 40
 NODE2VEC_WINDOW_SIZE = 2
@@ -81,6 +92,10 @@ SNAPSHOTS_TOP_LEVEL_NODES = False
 STORAGE_BASE_DIR = "output/${timestamp}/artifacts"
 STORAGE_TYPE = StorageType.file
 SUMMARIZE_DESCRIPTIONS_MAX_LENGTH = 500
+SUMMARIZE_DESCRIPTIONS_REDUCE_MODE = SummarizeReduceMode.rolling
+SUMMARIZE_DESCRIPTIONS_BATCH_ENABLED = False
+SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS = 4000
+SUMMARIZE_DESCRIPTIONS_BATCH_MAX_OUTPUT_TOKENS = 4000
 UMAP_ENABLED = False
 
 # Local Search
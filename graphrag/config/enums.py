@@ -92,6 +92,19 @@ class TextEmbeddingTarget(str, Enum):
         return f'"{self.value}"'
 
 
+class SummarizeReduceMode(str, Enum):
+    """The reduction of the descriptions of an entity or relationship."""
+
+    rolling = "rolling"
+    """Fold the descriptions into the summary one chunk at a time."""
+    tree = "tree"
+    """Summarize groups of descriptions concurrently, then merge the summaries."""
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
 class LLMType(str, Enum):
     """LLMType enum class definition."""
 
@@ -10,4 +10,7 @@ class ClusterGraphConfigInput(TypedDict):
     """Configuration section for clustering graphs."""
 
     max_cluster_size: NotRequired[int | None]
+    emit_membership: NotRequired[bool | str | None]
+    all_components: NotRequired[bool | str | None]
+    normalize_nodes: NotRequired[bool | str | None]
     strategy: NotRequired[dict | None]
@@ -10,6 +10,8 @@ class EmbedGraphConfigInput(TypedDict):
     """The default configuration section for Node2Vec."""
 
     enabled: NotRequired[bool | str | None]
+    parallel: NotRequired[bool | str | None]
+    dimensions: NotRequired[int | str | None]
     num_walks: NotRequired[int | str | None]
     walk_length: NotRequired[int | str | None]
     window_size: NotRequired[int | str | None]
@@ -5,6 +5,8 @@
 
 from typing_extensions import NotRequired
 
+from graphrag.config.enums import SummarizeReduceMode
+
 from .llm_config_input import LLMConfigInput
 
 
@@ -13,4 +15,8 @@ class SummarizeDescriptionsConfigInput(LLMConfigInput):
 
     prompt: NotRequired[str | None]
     max_length: NotRequired[int | str | None]
+    reduce_mode: NotRequired[SummarizeReduceMode | str | None]
+    batch_enabled: NotRequired[bool | str | None]
+    batch_max_tokens: NotRequired[int | str | None]
+    batch_max_output_tokens: NotRequired[int | str | None]
     strategy: NotRequired[dict | None]
@@ -19,5 +19,10 @@ class TextEmbeddingConfigInput(LLMConfigInput):
     batch_max_tokens: NotRequired[int | str | None]
     target: NotRequired[TextEmbeddingTarget | str | None]
     skip: NotRequired[list[str] | str | None]
+    compression: NotRequired[str | None]
+    compression_dimensions: NotRequired[int | str | None]
+    quantize: NotRequired[bool | str | None]
+    query_cache_max_entries: NotRequired[int | str | None]
+    query_cache_dir: NotRequired[str | None]
     vector_store: NotRequired[dict | None]
     strategy: NotRequired[dict | None]
@@ -14,6 +14,18 @@ class ClusterGraphConfig(BaseModel):
     max_cluster_size: int = Field(
         description="The maximum cluster size to use.", default=defs.MAX_CLUSTER_SIZE
     )
+    emit_membership: bool = Field(
+        description="Whether to emit one clustered graph with a node community membership table instead of one graph copy per level.",
+        default=defs.CLUSTER_GRAPH_EMIT_MEMBERSHIP,
+    )
+    all_components: bool = Field(
+        description="Whether to cluster every connected component instead of only the largest one.",
+        default=defs.CLUSTER_GRAPH_ALL_COMPONENTS,
+    )
+    normalize_nodes: bool = Field(
+        description="Whether to store each final node once with a separate (node, level, community) membership table instead of one node row per level.",
+        default=defs.CLUSTER_GRAPH_NORMALIZE_NODES,
+    )
     strategy: dict | None = Field(
         description="The cluster strategy to use.", default=None
     )
@@ -25,4 +37,9 @@ class ClusterGraphConfig(BaseModel):
         return self.strategy or {
             "type": GraphCommunityStrategyType.leiden,
             "max_cluster_size": self.max_cluster_size,
+            **(
+                {"use_lcc": False, "all_components": True}
+                if self.all_components
+                else {}
+            ),
         }
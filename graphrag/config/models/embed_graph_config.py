@@ -15,6 +15,14 @@ class EmbedGraphConfig(BaseModel):
         description="A flag indicating whether to enable node2vec.",
         default=defs.NODE2VEC_ENABLED,
     )
+    parallel: bool = Field(
+        description="A flag indicating whether to generate walks and train node2vec in parallel.",
+        default=defs.NODE2VEC_PARALLEL,
+    )
+    dimensions: int = Field(
+        description="The node2vec embedding dimensions.",
+        default=defs.NODE2VEC_DIMENSIONS,
+    )
     num_walks: int = Field(
         description="The node2vec number of walks.", default=defs.NODE2VEC_NUM_WALKS
     )
@@ -39,7 +47,10 @@ class EmbedGraphConfig(BaseModel):
         from graphrag.index.verbs.graph.embed import EmbedGraphStrategyType
 
         return self.strategy or {
-            "type": EmbedGraphStrategyType.node2vec,
+            "type": EmbedGraphStrategyType.node2vec_parallel
+            if self.parallel
+            else EmbedGraphStrategyType.node2vec,
+            "dimensions": self.dimensions,
             "num_walks": self.num_walks,
             "walk_length": self.walk_length,
             "window_size": self.window_size,
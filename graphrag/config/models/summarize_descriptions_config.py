@@ -8,6 +8,7 @@ from pathlib import Path
 from pydantic import Field
 
 import graphrag.config.defaults as defs
+from graphrag.config.enums import SummarizeReduceMode
 
 from .llm_config import LLMConfig
 
@@ -22,6 +23,22 @@ class SummarizeDescriptionsConfig(LLMConfig):
         description="The description summarization maximum length.",
         default=defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH,
     )
+    reduce_mode: SummarizeReduceMode = Field(
+        description="The description reduction mode to use, either 'rolling' or 'tree'.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_REDUCE_MODE,
+    )
+    batch_enabled: bool = Field(
+        description="Whether to pack many small descriptions into one LLM request.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_BATCH_ENABLED,
+    )
+    batch_max_tokens: int = Field(
+        description="The token budget of a single batched summarization request.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS,
+    )
+    batch_max_output_tokens: int = Field(
+        description="The completion token limit of a single batched summarization request.",
+        default=defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_OUTPUT_TOKENS,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.", default=None
     )
@@ -31,7 +48,9 @@ class SummarizeDescriptionsConfig(LLMConfig):
         from graphrag.index.verbs.entities.summarize import SummarizeStrategyType
 
         return self.strategy or {
-            "type": SummarizeStrategyType.graph_intelligence,
+            "type": SummarizeStrategyType.graph_intelligence_batch
+            if self.batch_enabled
+            else SummarizeStrategyType.graph_intelligence,
             "llm": self.llm.model_dump(),
             **self.parallelization.model_dump(),
             "summarize_prompt": (Path(root_dir) / self.prompt)
@@ -40,4 +59,7 @@ class SummarizeDescriptionsConfig(LLMConfig):
             if self.prompt
             else None,
             "max_summary_length": self.max_length,
+            "reduce_mode": self.reduce_mode,
+            "batch_max_tokens": self.batch_max_tokens,
+            "batch_max_output_tokens": self.batch_max_output_tokens,
         }
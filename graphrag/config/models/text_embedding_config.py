@@ -26,6 +26,26 @@ class TextEmbeddingConfig(LLMConfig):
         default=defs.EMBEDDING_TARGET,
     )
     skip: list[str] = Field(description="The specific embeddings to skip.", default=[])
+    compression: str | None = Field(
+        description="The reduction applied to entity description embeddings. 'pca' or 'truncate'.",
+        default=defs.EMBEDDING_COMPRESSION,
+    )
+    compression_dimensions: int = Field(
+        description="The number of dimensions kept by the embedding compression.",
+        default=defs.EMBEDDING_COMPRESSION_DIMENSIONS,
+    )
+    quantize: bool = Field(
+        description="Whether compressed embeddings are stored as int8 codes.",
+        default=defs.EMBEDDING_QUANTIZE,
+    )
+    query_cache_max_entries: int = Field(
+        description="The number of query embeddings cached in memory, 0 to disable the cache.",
+        default=defs.EMBEDDING_QUERY_CACHE_MAX_ENTRIES,
+    )
+    query_cache_dir: str | None = Field(
+        description="The directory the query embedding cache is persisted to, relative to the root.",
+        default=defs.EMBEDDING_QUERY_CACHE_DIR,
+    )
     vector_store: dict | None = Field(
         description="The vector storage configuration", default=None
     )
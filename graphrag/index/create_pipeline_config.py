@@ -58,6 +58,7 @@ from graphrag.index.workflows.default_workflows import (
     create_final_covariates,
     create_final_documents,
     create_final_entities,
+    create_final_node_communities,
     create_final_nodes,
     create_final_relationships,
     create_final_text_units,
@@ -317,6 +318,7 @@ def _graph_workflows(
             config={
                 "graphml_snapshot": settings.snapshots.graphml,
                 "embed_graph_enabled": settings.embed_graph.enabled,
+                "emit_membership": settings.cluster_graph.emit_membership,
                 "cluster_graph": {
                     "strategy": settings.cluster_graph.resolved_strategy()
                 },
@@ -334,6 +336,15 @@ def _graph_workflows(
                 ),
                 "skip_name_embedding": skip_entity_name_embedding,
                 "skip_description_embedding": skip_entity_description_embedding,
+                "description_embedding_compression": (
+                    {
+                        "projection_type": settings.embeddings.compression,
+                        "dimensions": settings.embeddings.compression_dimensions,
+                        "quantize": settings.embeddings.quantize,
+                    }
+                    if settings.embeddings.compression
+                    else None
+                ),
             },
         ),
         PipelineWorkflowReference(
@@ -343,15 +354,23 @@ def _graph_workflows(
                     settings.embeddings, "relationship_description"
                 ),
                 "skip_description_embedding": skip_relationship_description_embedding,
+                "normalize_nodes": settings.cluster_graph.normalize_nodes,
             },
         ),
         PipelineWorkflowReference(
             name=create_final_nodes,
             config={
                 "layout_graph_enabled": settings.umap.enabled,
+                "emit_membership": settings.cluster_graph.emit_membership,
                 "snapshot_top_level_nodes": settings.snapshots.top_level_nodes,
+                "normalize_nodes": settings.cluster_graph.normalize_nodes,
             },
         ),
+        *(
+            [PipelineWorkflowReference(name=create_final_node_communities)]
+            if settings.cluster_graph.normalize_nodes
+            else []
+        ),
     ]
 
 
@@ -371,6 +390,7 @@ def _community_workflows(
             name=create_final_community_reports,
             config={
                 "covariates_enabled": covariates_enabled,
+                "normalize_nodes": settings.cluster_graph.normalize_nodes,
                 "skip_title_embedding": skip_community_title_embedding,
                 "skip_summary_embedding": skip_community_summary_embedding,
                 "skip_full_content_embedding": skip_community_full_content_embedding,
@@ -3,6 +3,16 @@
 
 """The Indexing Engine graph embedding package root."""
 
-from .embedding import NodeEmbeddings, embed_nod2vec
+from .embedding import (
+    NodeEmbeddings,
+    embed_nod2vec,
+    embed_node2vec_parallel,
+    neighbor_overlap,
+)
 
-__all__ = ["NodeEmbeddings", "embed_nod2vec"]
+__all__ = [
+    "NodeEmbeddings",
+    "embed_nod2vec",
+    "embed_node2vec_parallel",
+    "neighbor_overlap",
+]
@@ -3,7 +3,10 @@
 
 """Utilities to generate graph embeddings."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 
 import graspologic as gc
 import networkx as nx
@@ -39,3 +42,200 @@ def embed_nod2vec(
         random_seed=random_seed,
     )
     return NodeEmbeddings(embeddings=lcc_tensors[0], nodes=lcc_tensors[1])
+
+
+# Below this many walks, the walks are generated in-process
+PARALLEL_MIN_WALKS = 10_000
+
+
+def embed_node2vec_parallel(
+    graph: nx.Graph | nx.DiGraph,
+    dimensions: int = 1536,
+    num_walks: int = 10,
+    walk_length: int = 40,
+    window_size: int = 2,
+    iterations: int = 3,
+    random_seed: int = 86,
+    num_processes: int | None = None,
+    workers: int | None = None,
+    interpolate_walk_lengths_by_node_degree: bool = True,
+) -> NodeEmbeddings:
+    """Generate node embeddings using Node2Vec with parallel walks and training.
+
+    The walks are unbiased weighted random walks (node2vec with p = q = 1, the
+    graspologic defaults), generated across processes and trained with a
+    multi-worker skip-gram word2vec.
+    """
+    from gensim.models import Word2Vec
+
+    nodes = list(graph.nodes)
+    node_index = {node: index for index, node in enumerate(nodes)}
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indices: list[int] = []
+    weights: list[float] = []
+    for index, node in enumerate(nodes):
+        for neighbor, edge_data in graph.adj[node].items():
+            indices.append(node_index[neighbor])
+            weights.append(float((edge_data or {}).get("weight", 1.0)))
+        indptr[index + 1] = len(indices)
+    cumulative_weights = np.cumsum(np.array(weights, dtype=np.float64))
+    neighbors = np.array(indices, dtype=np.int64)
+
+    degrees = np.diff(indptr)
+    node_walk_lengths = _walk_lengths(
+        degrees, walk_length, interpolate_walk_lengths_by_node_degree
+    )
+
+    # every node starts num_walks walks, in a shuffled order per round
+    rng = np.random.default_rng(random_seed)
+    starts = np.concatenate([
+        rng.permutation(len(nodes)) for _ in range(num_walks)
+    ]).astype(np.int64)
+
+    num_processes = num_processes or os.cpu_count() or 1
+    if num_processes > 1 and len(starts) >= PARALLEL_MIN_WALKS:
+        chunks = np.array_split(starts, num_processes)
+        seeds = np.random.SeedSequence(random_seed).spawn(len(chunks))
+        with ProcessPoolExecutor(max_workers=num_processes) as executor:
+            walk_chunks = list(
+                executor.map(
+                    _simulate_walks,
+                    repeat(indptr),
+                    repeat(neighbors),
+                    repeat(cumulative_weights),
+                    chunks,
+                    [node_walk_lengths[chunk] for chunk in chunks],
+                    seeds,
+                )
+            )
+    else:
+        walk_chunks = [
+            _simulate_walks(
+                indptr,
+                neighbors,
+                cumulative_weights,
+                starts,
+                node_walk_lengths[starts],
+                np.random.SeedSequence(random_seed),
+            )
+        ]
+
+    tokens = [str(index) for index in range(len(nodes))]
+    walks = [
+        [tokens[step] for step in walk if step >= 0]
+        for walk_chunk in walk_chunks
+        for walk in walk_chunk.tolist()
+    ]
+    model = Word2Vec(
+        walks,
+        vector_size=dimensions,
+        window=window_size,
+        min_count=0,
+        sg=1,
+        workers=workers or os.cpu_count() or 1,
+        epochs=iterations,
+        seed=random_seed,
+    )
+    return NodeEmbeddings(nodes=nodes, embeddings=model.wv[tokens])
+
+
+def _walk_lengths(
+    degrees: np.ndarray, walk_length: int, interpolate_by_degree: bool
+) -> np.ndarray:
+    """Return the walk length of each node, shorter for low degree nodes when interpolating."""
+    if not interpolate_by_degree or len(degrees) == 0:
+        return np.full(len(degrees), walk_length, dtype=np.int64)
+    deciles = np.percentile(degrees, range(10, 100, 10))
+    fractions = (np.searchsorted(deciles, degrees, side="left") + 1) / 10
+    return np.maximum(1, (walk_length * fractions).astype(np.int64))
+
+
+def _simulate_walks(
+    indptr: np.ndarray,
+    neighbors: np.ndarray,
+    cumulative_weights: np.ndarray,
+    starts: np.ndarray,
+    walk_lengths: np.ndarray,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Walk from every start node at once, each step picks a neighbor by edge weight.
+
+    Returns one row per walk, padded with -1 after the walk ends.
+    """
+    rng = np.random.default_rng(seed)
+    max_length = int(walk_lengths.max()) if len(walk_lengths) else 0
+    walks = np.full((len(starts), max_length), -1, dtype=np.int64)
+    if max_length == 0:
+        return walks
+    walks[:, 0] = starts
+    current = starts.copy()
+    active = np.ones(len(starts), dtype=bool)
+    for step in range(1, max_length):
+        active &= walk_lengths > step
+        walkers = np.flatnonzero(active)
+        if len(walkers) == 0:
+            break
+        low = indptr[current[walkers]]
+        high = indptr[current[walkers] + 1]
+        has_neighbors = high > low
+        base = np.where(low > 0, cumulative_weights[np.maximum(low - 1, 0)], 0.0)
+        total = np.where(
+            has_neighbors, cumulative_weights[np.maximum(high - 1, 0)] - base, 0.0
+        )
+        moving = total > 0
+        active[walkers[~moving]] = False
+        walkers, low, high = walkers[moving], low[moving], high[moving]
+        targets = base[moving] + rng.random(len(walkers)) * total[moving]
+        positions = np.searchsorted(cumulative_weights, targets, side="right")
+        positions = np.clip(positions, low, high - 1)
+        current[walkers] = neighbors[positions]
+        walks[walkers, step] = current[walkers]
+    return walks
+
+
+def neighbor_overlap(
+    embeddings: NodeEmbeddings,
+    reference: NodeEmbeddings,
+    k: int = 10,
+    sample_size: int = 1_000,
+    random_seed: int = 86,
+) -> float:
+    """Return the mean overlap of the k nearest cosine neighbours of the nodes in both embeddings.
+
+    Embeddings from different runs are not aligned, comparing neighbourhoods tells whether
+    both capture the same graph structure. 1.0 means identical neighbourhoods.
+    """
+    reference_index = {node: index for index, node in enumerate(reference.nodes)}
+    shared = [
+        (index, reference_index[node])
+        for index, node in enumerate(embeddings.nodes)
+        if node in reference_index
+    ]
+    k = min(k, len(shared) - 1)
+    if k <= 0:
+        return 1.0
+
+    def _normalized(vectors: np.ndarray, rows: list[int]) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float64)[rows]
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    vectors = _normalized(embeddings.embeddings, [index for index, _ in shared])
+    reference_vectors = _normalized(
+        reference.embeddings, [index for _, index in shared]
+    )
+    rng = np.random.default_rng(random_seed)
+    sample = rng.permutation(len(shared))[:sample_size]
+
+    def _top_k(vectors: np.ndarray) -> np.ndarray:
+        similarities = vectors[sample] @ vectors.T
+        similarities[np.arange(len(sample)), sample] = -np.inf
+        return np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+
+    overlaps = [
+        len(set(row) & set(reference_row)) / k
+        for row, reference_row in zip(
+            _top_k(vectors).tolist(), _top_k(reference_vectors).tolist(), strict=True
+        )
+    ]
+    return float(np.mean(overlaps))
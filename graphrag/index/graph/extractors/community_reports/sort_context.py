@@ -2,10 +2,17 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+import csv
+import io
+import os
+from bisect import bisect_left
+from itertools import accumulate
+
+import numpy as np
 import pandas as pd
 
 import graphrag.index.graph.extractors.community_reports.schemas as schemas
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import num_tokens, num_tokens_batch
 
 
 def sort_context(
@@ -28,85 +35,6 @@ def sort_context(
 
     If max tokens is provided, we will return the context string that fits within the token limit.
     """
-
-    def _get_context_string(
-        entities: list[dict],
-        edges: list[dict],
-        claims: list[dict],
-        sub_community_reports: list[dict] | None = None,
-    ) -> str:
-        """Concatenate structured data into a context string."""
-        contexts = []
-        if sub_community_reports:
-            sub_community_reports = [
-                report
-                for report in sub_community_reports
-                if community_id_column in report
-                and report[community_id_column]
-                and str(report[community_id_column]).strip() != ""
-            ]
-            report_df = pd.DataFrame(sub_community_reports).drop_duplicates()
-            if not report_df.empty:
-                if report_df[community_id_column].dtype == float:
-                    report_df[community_id_column] = report_df[
-                        community_id_column
-                    ].astype(int)
-                report_string = (
-                    f"----Reports-----\n{report_df.to_csv(index=False, sep=',')}"
-                )
-                contexts.append(report_string)
-
-        entities = [
-            entity
-            for entity in entities
-            if node_id_column in entity
-            and entity[node_id_column]
-            and str(entity[node_id_column]).strip() != ""
-        ]
-        entity_df = pd.DataFrame(entities).drop_duplicates()
-        if not entity_df.empty:
-            if entity_df[node_id_column].dtype == float:
-                entity_df[node_id_column] = entity_df[node_id_column].astype(int)
-            entity_string = (
-                f"-----Entities-----\n{entity_df.to_csv(index=False, sep=',')}"
-            )
-            contexts.append(entity_string)
-
-        if claims and len(claims) > 0:
-            claims = [
-                claim
-                for claim in claims
-                if claim_id_column in claim
-                and claim[claim_id_column]
-                and str(claim[claim_id_column]).strip() != ""
-            ]
-            claim_df = pd.DataFrame(claims).drop_duplicates()
-            if not claim_df.empty:
-                if claim_df[claim_id_column].dtype == float:
-                    claim_df[claim_id_column] = claim_df[claim_id_column].astype(int)
-                claim_string = (
-                    f"-----Claims-----\n{claim_df.to_csv(index=False, sep=',')}"
-                )
-                contexts.append(claim_string)
-
-        edges = [
-            edge
-            for edge in edges
-            if edge_id_column in edge
-            and edge[edge_id_column]
-            and str(edge[edge_id_column]).strip() != ""
-        ]
-        edge_df = pd.DataFrame(edges).drop_duplicates()
-        if not edge_df.empty:
-            if edge_df[edge_id_column].dtype == float:
-                edge_df[edge_id_column] = edge_df[edge_id_column].astype(int)
-            edge_string = (
-                f"-----Relationships-----\n{edge_df.to_csv(index=False, sep=',')}"
-            )
-            contexts.append(edge_string)
-
-        return "\n\n".join(contexts)
-
     # sort node details by degree in descending order
     edges = []
     node_details = {}
@@ -127,30 +55,188 @@ def sort_context(
     edges = [edge for edge in edges if isinstance(edge, dict)]
     edges = sorted(edges, key=lambda x: x[edge_degree_column], reverse=True)
 
-    sorted_edges = []
+    # lay out the rows contributed by each edge, the context for the first k edges
+    # is made of the first 2k nodes, the first claim_counts[k] claims and the first k edges
     sorted_nodes = []
     sorted_claims = []
-    context_string = ""
+    claim_counts = [0]
     for edge in edges:
         source_details = node_details.get(edge[edge_source_column], {})
         target_details = node_details.get(edge[edge_target_column], {})
         sorted_nodes.extend([source_details, target_details])
-        sorted_edges.append(edge)
         source_claims = claim_details.get(edge[edge_source_column], [])
         target_claims = claim_details.get(edge[edge_target_column], [])
         sorted_claims.extend(source_claims if source_claims else [])
         sorted_claims.extend(target_claims if source_claims else [])
-        if max_tokens:
-            new_context_string = _get_context_string(
-                sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-            )
-            if num_tokens(context_string) > max_tokens:
-                break
-            context_string = new_context_string
+        claim_counts.append(len(sorted_claims))
+
+    report_string = (
+        _frame_section(sub_community_reports, community_id_column, "----Reports-----")
+        if sub_community_reports
+        else ""
+    )
+    entity_section = _CsvSection(sorted_nodes, node_id_column, "-----Entities-----")
+    claim_section = _CsvSection(sorted_claims, claim_id_column, "-----Claims-----")
+    edge_section = _CsvSection(edges, edge_id_column, "-----Relationships-----")
+
+    def _get_context_string(num_edges: int) -> str:
+        """Concatenate the structured data for the first edges into a context string."""
+        contexts = [
+            report_string,
+            entity_section.render(2 * num_edges),
+            claim_section.render(claim_counts[num_edges]),
+            edge_section.render(num_edges),
+        ]
+        return "\n\n".join(context for context in contexts if context)
 
-    if context_string == "":
-        return _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+    num_edges = len(edges)
+    context_string = ""
+    if max_tokens and num_edges > 0:
+        # the context grows one edge at a time until it first exceeds the limit, that
+        # context is kept. Start from the estimate given by the cumulative row token
+        # counts and confirm the cut-off against the exact token counts around it.
+        def _exceeds(num_edges: int) -> bool:
+            return num_tokens(_get_context_string(num_edges)) > max_tokens
+
+        report_tokens = num_tokens(report_string)
+        estimated_tokens = [
+            report_tokens
+            + entity_section.estimate_tokens(2 * k)
+            + claim_section.estimate_tokens(claim_counts[k])
+            + edge_section.estimate_tokens(k)
+            for k in range(num_edges + 1)
+        ]
+        cutoff = next(
+            (k for k in range(1, num_edges + 1) if estimated_tokens[k] > max_tokens),
+            num_edges,
         )
+        while cutoff > 1 and _exceeds(cutoff - 1):
+            cutoff -= 1
+        while cutoff < num_edges and not _exceeds(cutoff):
+            cutoff += 1
+        context_string = _get_context_string(cutoff)
+
+    if context_string == "":
+        return _get_context_string(num_edges)
 
     return context_string
+
+
+class _CsvSection:
+    """A context section whose prefixes render like `DataFrame.drop_duplicates().to_csv()`.
+
+    When every record has the same columns and only string or integer values, each
+    distinct row is rendered and counted once, and a prefix is assembled from those
+    lines. Otherwise each prefix is rendered through pandas.
+    """
+
+    def __init__(self, records: list[dict], id_column: str, title: str):
+        self._records = records
+        self._id_column = id_column
+        self._title = title
+        self._header: str | None = None
+        self._lines: list[str] = []
+        self._first_positions: list[int] = []
+        self._line_tokens: list[int] = []
+
+        rows = [
+            (position, record)
+            for position, record in enumerate(records)
+            if _has_id(record, id_column)
+        ]
+        if not rows:
+            self._header = ""
+            return
+        columns = tuple(rows[0][1].keys())
+        if not all(
+            tuple(record.keys()) == columns
+            and all(_is_plain_value(value) for value in record.values())
+            for _, record in rows
+        ):
+            return
+
+        seen = set()
+        writer = _CsvLineWriter()
+        for position, record in rows:
+            values = tuple(record.values())
+            if values in seen:
+                continue
+            seen.add(values)
+            self._first_positions.append(position)
+            self._lines.append(writer.line(values))
+        self._header = f"{title}\n{writer.line(columns)}"
+
+    def _num_rows(self, num_records: int) -> int:
+        return bisect_left(self._first_positions, num_records)
+
+    def render(self, num_records: int) -> str:
+        """Render the section for the first records, or an empty string if there are none."""
+        if self._header is None:
+            return _frame_section(
+                self._records[:num_records], self._id_column, self._title
+            )
+        num_rows = self._num_rows(num_records)
+        if num_rows == 0:
+            return ""
+        return self._header + "".join(self._lines[:num_rows])
+
+    def estimate_tokens(self, num_records: int) -> int:
+        """Estimate the token count of the section for the first records."""
+        if self._header is None:
+            return num_tokens(self.render(num_records))
+        num_rows = self._num_rows(num_records)
+        if num_rows == 0:
+            return 0
+        if not self._line_tokens:
+            header_tokens, *line_tokens = num_tokens_batch([
+                self._header,
+                *self._lines,
+            ])
+            self._line_tokens = [*accumulate(line_tokens, initial=header_tokens)]
+        return self._line_tokens[num_rows]
+
+
+class _CsvLineWriter:
+    """Render single CSV rows with the dialect used by `DataFrame.to_csv`."""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(
+            self._buffer,
+            lineterminator=os.linesep,
+            delimiter=",",
+            quoting=csv.QUOTE_MINIMAL,
+            doublequote=True,
+            quotechar='"',
+        )
+
+    def line(self, values: tuple) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(values)
+        return self._buffer.getvalue()
+
+
+def _has_id(record: dict, id_column: str) -> bool:
+    return (
+        id_column in record
+        and bool(record[id_column])
+        and str(record[id_column]).strip() != ""
+    )
+
+
+def _is_plain_value(value) -> bool:
+    return isinstance(value, str | np.integer) or (
+        isinstance(value, int) and not isinstance(value, bool)
+    )
+
+
+def _frame_section(records: list[dict], id_column: str, title: str) -> str:
+    """Render records with a valid id as a deduplicated CSV section."""
+    records = [record for record in records if _has_id(record, id_column)]
+    record_df = pd.DataFrame(records).drop_duplicates()
+    if record_df.empty:
+        return ""
+    if record_df[id_column].dtype == float:
+        record_df[id_column] = record_df[id_column].astype(int)
+    return f"{title}\n{record_df.to_csv(index=False, sep=',')}"
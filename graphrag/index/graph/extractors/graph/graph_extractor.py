@@ -5,11 +5,10 @@
 
 import logging
 import numbers
-import re
 import traceback
-from collections.abc import Mapping
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
 
 import networkx as nx
 import tiktoken
@@ -197,109 +196,107 @@ class GraphExtractor:
             - output - unipartite graph in graphML format
         """
         graph = nx.Graph()
-        for source_doc_id, extracted_data in results.items():
-            records = [r.strip() for r in extracted_data.split(record_delimiter)]
+        # descriptions and source ids are gathered as ordered sets while parsing,
+        # and serialized once at the end
+        node_descriptions: dict[str, dict[str, None]] = {}
+        node_source_ids: dict[str, dict[str, None]] = {}
+        edge_descriptions: dict[tuple[str, str], dict[str, None]] = {}
+        edge_source_ids: dict[tuple[str, str], dict[str, None]] = {}
+        cleaned_upper: dict[str, str] = {}
+
+        def clean_upper(value: str) -> str:
+            result = cleaned_upper.get(value)
+            if result is None:
+                result = cleaned_upper[value] = clean_str(value.upper())
+            return result
+
+        def add_node(name: str, entity_type: str, description: str, source_id: str):
+            graph.add_node(
+                name, type=entity_type, description=description, source_id=source_id
+            )
+            node_descriptions[name] = {description: None}
+            node_source_ids[name] = {source_id: None}
 
-            for record in records:
-                record = re.sub(r"^\(|\)$", "", record.strip())
+        for source_doc_id, extracted_data in results.items():
+            doc_id = str(source_doc_id)
+            for record in extracted_data.split(record_delimiter):
+                record = record.strip()
+                if record.startswith("("):
+                    record = record[1:]
+                if record.endswith(")"):
+                    record = record[:-1]
                 record_attributes = record.split(tuple_delimiter)
+                record_type = record_attributes[0]
 
-                if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
+                if record_type == '"entity"' and len(record_attributes) >= 4:
                     # add this record as a node in the G
-                    entity_name = clean_str(record_attributes[1].upper())
-                    entity_type = clean_str(record_attributes[2].upper())
+                    entity_name = clean_upper(record_attributes[1])
+                    entity_type = clean_upper(record_attributes[2])
                     entity_description = clean_str(record_attributes[3])
 
-                    if entity_name in graph.nodes():
+                    if entity_name in graph:
                         node = graph.nodes[entity_name]
                         if self._join_descriptions:
-                            node["description"] = "\n".join(
-                                list({
-                                    *_unpack_descriptions(node),
-                                    entity_description,
-                                })
-                            )
-                        else:
-                            if len(entity_description) > len(node["description"]):
-                                node["description"] = entity_description
-                        node["source_id"] = ", ".join(
-                            list({
-                                *_unpack_source_ids(node),
-                                str(source_doc_id),
-                            })
-                        )
+                            node_descriptions[entity_name][entity_description] = None
+                        elif len(entity_description) > len(node["description"]):
+                            node["description"] = entity_description
+                        node_source_ids[entity_name][doc_id] = None
                         node["entity_type"] = (
                             entity_type if entity_type != "" else node["entity_type"]
                         )
                     else:
-                        graph.add_node(
-                            entity_name,
-                            type=entity_type,
-                            description=entity_description,
-                            source_id=str(source_doc_id),
-                        )
+                        add_node(entity_name, entity_type, entity_description, doc_id)
 
-                if (
-                    record_attributes[0] == '"relationship"'
-                    and len(record_attributes) >= 5
-                ):
+                elif record_type == '"relationship"' and len(record_attributes) >= 5:
                     # add this record as edge
-                    source = clean_str(record_attributes[1].upper())
-                    target = clean_str(record_attributes[2].upper())
+                    source = clean_upper(record_attributes[1])
+                    target = clean_upper(record_attributes[2])
                     edge_description = clean_str(record_attributes[3])
-                    edge_source_id = clean_str(str(source_doc_id))
+                    edge_source_id = clean_str(doc_id)
                     weight = (
                         float(record_attributes[-1])
                         if isinstance(record_attributes[-1], numbers.Number)
                         else 1.0
                     )
-                    if source not in graph.nodes():
-                        graph.add_node(
+                    if source not in graph:
+                        add_node(source, "", "", edge_source_id)
+                    if target not in graph:
+                        add_node(target, "", "", edge_source_id)
+
+                    edge_key = (
+                        (source, target) if source <= target else (target, source)
+                    )
+                    edge_data = graph.get_edge_data(source, target)
+                    if edge_data is not None:
+                        edge_data["weight"] += weight
+                        if self._join_descriptions:
+                            edge_descriptions[edge_key][edge_description] = None
+                        else:
+                            edge_data["description"] = edge_description
+                        edge_source_ids[edge_key][doc_id] = None
+                    else:
+                        graph.add_edge(
                             source,
-                            type="",
-                            description="",
-                            source_id=edge_source_id,
-                        )
-                    if target not in graph.nodes():
-                        graph.add_node(
                             target,
-                            type="",
-                            description="",
+                            weight=weight,
+                            description=edge_description,
                             source_id=edge_source_id,
                         )
-                    if graph.has_edge(source, target):
-                        edge_data = graph.get_edge_data(source, target)
-                        if edge_data is not None:
-                            weight += edge_data["weight"]
-                            if self._join_descriptions:
-                                edge_description = "\n".join(
-                                    list({
-                                        *_unpack_descriptions(edge_data),
-                                        edge_description,
-                                    })
-                                )
-                            edge_source_id = ", ".join(
-                                list({
-                                    *_unpack_source_ids(edge_data),
-                                    str(source_doc_id),
-                                })
-                            )
-                    graph.add_edge(
-                        source,
-                        target,
-                        weight=weight,
-                        description=edge_description,
-                        source_id=edge_source_id,
-                    )
+                        edge_descriptions[edge_key] = {edge_description: None}
+                        edge_source_ids[edge_key] = {edge_source_id: None}
+
+        for name, node in cast(
+            Iterable[tuple[str, dict[str, Any]]], graph.nodes(data=True)
+        ):
+            if self._join_descriptions:
+                node["description"] = "\n".join(node_descriptions[name])
+            node["source_id"] = ", ".join(node_source_ids[name])
+        for source, target, edge_data in cast(
+            Iterable[tuple[str, str, dict[str, Any]]], graph.edges(data=True)
+        ):
+            edge_key = (source, target) if source <= target else (target, source)
+            if self._join_descriptions:
+                edge_data["description"] = "\n".join(edge_descriptions[edge_key])
+            edge_data["source_id"] = ", ".join(edge_source_ids[edge_key])
 
         return graph
-
-
-def _unpack_descriptions(data: Mapping) -> list[str]:
-    value = data.get("description", None)
-    return [] if value is None else value.split("\n")
-
-
-def _unpack_source_ids(data: Mapping) -> list[str]:
-    value = data.get("source_id", None)
-    return [] if value is None else value.split(", ")
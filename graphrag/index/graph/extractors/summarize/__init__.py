@@ -3,10 +3,17 @@
 
 """The Indexing Engine unipartite graph package root."""
 
+from .batch_description_summary_extractor import BatchSummarizeExtractor
 from .description_summary_extractor import (
     SummarizationResult,
     SummarizeExtractor,
 )
-from .prompts import SUMMARIZE_PROMPT
+from .prompts import BATCH_SUMMARIZE_PROMPT, SUMMARIZE_PROMPT
 
-__all__ = ["SUMMARIZE_PROMPT", "SummarizationResult", "SummarizeExtractor"]
+__all__ = [
+    "BATCH_SUMMARIZE_PROMPT",
+    "SUMMARIZE_PROMPT",
+    "BatchSummarizeExtractor",
+    "SummarizationResult",
+    "SummarizeExtractor",
+]
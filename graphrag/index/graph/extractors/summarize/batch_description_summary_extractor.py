@@ -0,0 +1,212 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'BatchSummarizeExtractor' model."""
+
+import asyncio
+import json
+import logging
+import traceback
+
+from graphrag.index.typing import ErrorHandlerFn
+from graphrag.index.utils.tokens import num_tokens_from_string, num_tokens_from_strings
+from graphrag.llm import CompletionLLM
+
+from .description_summary_extractor import SummarizationResult, SummarizeExtractor
+from .prompts import BATCH_SUMMARIZE_PROMPT
+
+log = logging.getLogger(__name__)
+
+# Max token size for a batched input prompt
+DEFAULT_BATCH_MAX_TOKENS = 4_000
+# Max number of items packed into a single request
+DEFAULT_BATCH_MAX_ITEMS = 20
+# Max completion tokens of a batched request, within the usual deployment limit
+DEFAULT_BATCH_MAX_OUTPUT_TOKENS = 4_000
+
+SummarizationItem = tuple[str | tuple[str, str], list[str]]
+
+
+class BatchSummarizeExtractor:
+    """Summarizes many small entities and relationships per LLM call."""
+
+    _llm: CompletionLLM
+    _extractor: SummarizeExtractor
+    _batch_prompt: str
+    _input_items_key: str
+    _on_error: ErrorHandlerFn
+    _max_summary_length: int
+    _batch_max_tokens: int
+    _batch_max_items: int
+    _batch_max_output_tokens: int
+    _max_item_tokens: int
+
+    def __init__(
+        self,
+        llm_invoker: CompletionLLM,
+        extractor: SummarizeExtractor,
+        batch_prompt: str | None = None,
+        input_items_key: str | None = None,
+        on_error: ErrorHandlerFn | None = None,
+        max_summary_length: int | None = None,
+        batch_max_tokens: int | None = None,
+        batch_max_items: int | None = None,
+        max_item_tokens: int | None = None,
+        batch_max_output_tokens: int | None = None,
+    ):
+        """Init method definition."""
+        self._llm = llm_invoker
+        self._extractor = extractor
+        self._batch_prompt = batch_prompt or BATCH_SUMMARIZE_PROMPT
+        self._input_items_key = input_items_key or "input_items"
+        self._on_error = on_error or (lambda _e, _s, _d: None)
+        self._max_summary_length = max_summary_length or 500
+        self._batch_max_tokens = batch_max_tokens or DEFAULT_BATCH_MAX_TOKENS
+        self._batch_max_output_tokens = (
+            batch_max_output_tokens or DEFAULT_BATCH_MAX_OUTPUT_TOKENS
+        )
+        # A batch holds no more summaries than fit in one completion
+        self._batch_max_items = max(
+            1,
+            min(
+                batch_max_items or DEFAULT_BATCH_MAX_ITEMS,
+                self._batch_max_output_tokens // self._max_summary_length,
+            ),
+        )
+        # Items larger than this are summarized on their own
+        self._max_item_tokens = max_item_tokens or self._batch_max_tokens // 4
+
+    async def __call__(
+        self, items: list[SummarizationItem]
+    ) -> list[SummarizationResult]:
+        """Call method definition."""
+        results: dict[int, SummarizationResult] = {}
+        pending: list[int] = []
+        for index, (graph_item, descriptions) in enumerate(items):
+            if len(descriptions) <= 1:
+                results[index] = SummarizationResult(
+                    items=graph_item,
+                    description=descriptions[0] if descriptions else "",
+                )
+            else:
+                pending.append(index)
+
+        # Count every pending description in one batched pass
+        description_tokens = iter(
+            num_tokens_from_strings(
+                description for index in pending for description in items[index][1]
+            )
+        )
+        batchable: list[tuple[int, int]] = []
+        individual: list[int] = []
+        for index in pending:
+            item_tokens = sum(next(description_tokens) for _ in items[index][1])
+            if item_tokens > self._max_item_tokens:
+                individual.append(index)
+            else:
+                batchable.append((index, item_tokens))
+
+        batches = self._pack_batches(batchable)
+        futures = [self._summarize_batch(items, batch) for batch in batches]
+        futures += [self._summarize_individual(items, [index]) for index in individual]
+        for batch_results in await asyncio.gather(*futures):
+            results.update(batch_results)
+
+        return [results[index] for index in range(len(items))]
+
+    def _pack_batches(self, batchable: list[tuple[int, int]]) -> list[list[int]]:
+        """Greedily pack item indices into batches within the token and item budgets."""
+        usable_tokens = self._batch_max_tokens - num_tokens_from_string(
+            self._batch_prompt
+        )
+        batches: list[list[int]] = []
+        batch: list[int] = []
+        remaining = usable_tokens
+        for index, item_tokens in batchable:
+            if batch and (
+                item_tokens > remaining or len(batch) >= self._batch_max_items
+            ):
+                batches.append(batch)
+                batch = []
+                remaining = usable_tokens
+            batch.append(index)
+            remaining -= item_tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _summarize_batch(
+        self, items: list[SummarizationItem], batch: list[int]
+    ) -> dict[int, SummarizationResult]:
+        """Summarize a batch of items in one request, isolating failed items."""
+        if len(batch) == 1:
+            return await self._summarize_individual(items, batch)
+
+        input_items = [
+            {
+                "id": str(index),
+                "entities": sorted(items[index][0])
+                if isinstance(items[index][0], tuple)
+                else items[index][0],
+                "descriptions": sorted(items[index][1]),
+            }
+            for index in batch
+        ]
+        try:
+            response = await self._llm(
+                self._batch_prompt,
+                json=True,
+                name="summarize_batch",
+                variables={self._input_items_key: json.dumps(input_items)},
+                model_parameters={
+                    "max_tokens": min(
+                        self._max_summary_length * len(batch),
+                        self._batch_max_output_tokens,
+                    )
+                },
+            )
+            summaries = (response.json or {}).get("summaries", [])
+        except Exception as e:
+            log.exception("error summarizing description batch")
+            self._on_error(e, traceback.format_exc(), {"batch_size": len(batch)})
+            summaries = []
+
+        keys = {str(index): index for index in batch}
+        results: dict[int, SummarizationResult] = {}
+        for summary in summaries if isinstance(summaries, list) else []:
+            if not isinstance(summary, dict):
+                continue
+            index = keys.get(str(summary.get("id")))
+            description = summary.get("description")
+            if index is None or not isinstance(description, str) or not description:
+                continue
+            results[index] = SummarizationResult(
+                items=items[index][0], description=description
+            )
+
+        # Items missing from the response fall back to individual calls
+        missing = [index for index in batch if index not in results]
+        if missing:
+            results.update(await self._summarize_individual(items, missing))
+        return results
+
+    async def _summarize_individual(
+        self, items: list[SummarizationItem], indices: list[int]
+    ) -> dict[int, SummarizationResult]:
+        """Summarize items one per request, keeping the raw descriptions on failure."""
+
+        async def summarize(index: int) -> SummarizationResult:
+            graph_item, descriptions = items[index]
+            try:
+                return await self._extractor(
+                    items=graph_item, descriptions=descriptions
+                )
+            except Exception as e:
+                log.exception("error summarizing descriptions for %s", graph_item)
+                self._on_error(e, traceback.format_exc(), {"items": graph_item})
+                return SummarizationResult(
+                    items=graph_item, description="\n".join(descriptions)
+                )
+
+        summaries = await asyncio.gather(*[summarize(index) for index in indices])
+        return dict(zip(indices, summaries, strict=True))
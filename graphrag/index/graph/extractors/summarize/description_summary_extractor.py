@@ -3,11 +3,13 @@
 
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
+import asyncio
 import json
 from dataclasses import dataclass
 
+from graphrag.config.enums import SummarizeReduceMode
 from graphrag.index.typing import ErrorHandlerFn
-from graphrag.index.utils.tokens import num_tokens_from_string
+from graphrag.index.utils.tokens import num_tokens_from_string, num_tokens_from_strings
 from graphrag.llm import CompletionLLM
 
 from .prompts import SUMMARIZE_PROMPT
@@ -36,6 +38,7 @@ class SummarizeExtractor:
     _on_error: ErrorHandlerFn
     _max_summary_length: int
     _max_input_tokens: int
+    _reduce_mode: SummarizeReduceMode
 
     def __init__(
         self,
@@ -46,6 +49,7 @@ class SummarizeExtractor:
         on_error: ErrorHandlerFn | None = None,
         max_summary_length: int | None = None,
         max_input_tokens: int | None = None,
+        reduce_mode: SummarizeReduceMode | str | None = None,
     ):
         """Init method definition."""
         # TODO: streamline construction
@@ -57,6 +61,13 @@ class SummarizeExtractor:
         self._on_error = on_error or (lambda _e, _s, _d: None)
         self._max_summary_length = max_summary_length or DEFAULT_MAX_SUMMARY_LENGTH
         self._max_input_tokens = max_input_tokens or DEFAULT_MAX_INPUT_TOKENS
+        try:
+            self._reduce_mode = SummarizeReduceMode(
+                reduce_mode or SummarizeReduceMode.rolling
+            )
+        except ValueError as e:
+            msg = f"Unknown description reduce mode: {reduce_mode}"
+            raise ValueError(msg) from e
 
     async def __call__(
         self,
@@ -69,6 +80,8 @@ class SummarizeExtractor:
             result = ""
         if len(descriptions) == 1:
             result = descriptions[0]
+        elif self._reduce_mode == SummarizeReduceMode.tree:
+            result = await self._summarize_descriptions_tree(items, descriptions)
         else:
             result = await self._summarize_descriptions(items, descriptions)
 
@@ -93,9 +106,10 @@ class SummarizeExtractor:
         )
         descriptions_collected = []
         result = ""
+        description_tokens = num_tokens_from_strings(descriptions)
 
         for i, description in enumerate(descriptions):
-            usable_tokens -= num_tokens_from_string(description)
+            usable_tokens -= description_tokens[i]
             descriptions_collected.append(description)
 
             # If buffer is full, or all descriptions have been added, summarize
@@ -118,6 +132,60 @@ class SummarizeExtractor:
 
         return result
 
+    async def _summarize_descriptions_tree(
+        self, items: str | tuple[str, str], descriptions: list[str]
+    ) -> str:
+        """Summarize descriptions by reducing disjoint groups concurrently."""
+        sorted_items = sorted(items) if isinstance(items, list) else items
+
+        # Safety check, should always be a list
+        if not isinstance(descriptions, list):
+            descriptions = [descriptions]
+
+        usable_tokens = self._max_input_tokens - num_tokens_from_string(
+            self._summarization_prompt
+        )
+        partials = descriptions
+        while len(partials) > 1:
+            groups = self._group_descriptions(partials, usable_tokens)
+            # singleton groups are carried over to the next round as they are
+            summaries = iter(
+                await asyncio.gather(*[
+                    self._summarize_descriptions_with_llm(sorted_items, group)
+                    for group in groups
+                    if len(group) > 1
+                ])
+            )
+            partials = [
+                next(summaries) if len(group) > 1 else group[0] for group in groups
+            ]
+
+        return partials[0] if partials else ""
+
+    @staticmethod
+    def _group_descriptions(
+        descriptions: list[str], usable_tokens: int
+    ) -> list[list[str]]:
+        """Split descriptions into disjoint groups that fit the token budget.
+
+        Like the rolling reduction, a group is closed once it overflows the budget and holds
+        more than one description, so every group but the last reduces at least two inputs.
+        """
+        groups: list[list[str]] = []
+        group: list[str] = []
+        remaining = usable_tokens
+        description_tokens = num_tokens_from_strings(descriptions)
+        for description, tokens in zip(descriptions, description_tokens, strict=True):
+            remaining -= tokens
+            group.append(description)
+            if remaining < 0 and len(group) > 1:
+                groups.append(group)
+                group = []
+                remaining = usable_tokens
+        if group:
+            groups.append(group)
+        return groups
+
     async def _summarize_descriptions_with_llm(
         self, items: str | tuple[str, str] | list[str], descriptions: list[str]
     ):
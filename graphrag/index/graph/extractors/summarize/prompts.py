@@ -17,3 +17,27 @@ Description List: {description_list}
 #######
 Output:
 """
+
+BATCH_SUMMARIZE_PROMPT = """
+You are a helpful assistant responsible for generating comprehensive summaries of the data provided below.
+You are given a list of items. Each item has an id, one or two entities, and a list of descriptions, all related to the same entity or group of entities.
+For each item, concatenate all of its descriptions into a single, comprehensive description. Make sure to include information collected from all of the item's descriptions, and never mix information between items.
+If the provided descriptions are contradictory, please resolve the contradictions and provide a single, coherent summary.
+Make sure each summary is written in third person, and include the entity names so we the have full context.
+
+Return output as a well-formed JSON-formatted string with the following format:
+{{
+    "summaries": [
+        {{
+            "id": "<item id>",
+            "description": "<comprehensive description of the item>"
+        }}
+    ]
+}}
+
+#######
+-Data-
+Items: {input_items}
+#######
+Output:
+"""
@@ -4,6 +4,10 @@
 """The Indexing Engine graph utils package root."""
 
 from .normalize_node_names import normalize_node_names
-from .stable_lcc import stable_largest_connected_component
+from .stable_lcc import stable_connected_components, stable_largest_connected_component
 
-__all__ = ["normalize_node_names", "stable_largest_connected_component"]
+__all__ = [
+    "normalize_node_names",
+    "stable_connected_components",
+    "stable_largest_connected_component",
+]
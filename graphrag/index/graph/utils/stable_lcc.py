@@ -19,6 +19,18 @@ def stable_largest_connected_component(graph: nx.Graph) -> nx.Graph:
     return _stabilize_graph(graph)
 
 
+def stable_connected_components(graph: nx.Graph) -> list[nx.Graph]:
+    """Return every connected component of the graph, largest first, each sorted in a stable way."""
+    graph = normalize_node_names(graph.copy())
+    components = (
+        nx.weakly_connected_components(graph)
+        if isinstance(graph, nx.DiGraph)
+        else nx.connected_components(graph)
+    )
+    ordered = sorted(components, key=lambda nodes: (-len(nodes), min(nodes)))
+    return [_stabilize_graph(graph.subgraph(nodes)) for nodes in ordered]
+
+
 def _stabilize_graph(graph: nx.Graph) -> nx.Graph:
     """Ensure an undirected graph with the same relationships will always be read the same way."""
     fixed_graph = nx.DiGraph() if graph.is_directed() else nx.Graph()
@@ -54,6 +54,11 @@ embeddings:
     # batch_size: {defs.EMBEDDING_BATCH_SIZE} # the number of documents to send in a single request
     # batch_max_tokens: {defs.EMBEDDING_BATCH_MAX_TOKENS} # the maximum number of tokens to send in a single request
     # target: {defs.EMBEDDING_TARGET.value} # or optional
+    # compression: pca # or truncate, reduces the entity description embeddings
+    # compression_dimensions: {defs.EMBEDDING_COMPRESSION_DIMENSIONS}
+    # quantize: {str(defs.EMBEDDING_QUANTIZE).lower()} # store the compressed embeddings as int8 codes
+    # query_cache_max_entries: {defs.EMBEDDING_QUERY_CACHE_MAX_ENTRIES} # query embeddings cached in memory, 0 to disable
+    # query_cache_dir: cache/query_embeddings # persist the query embedding cache
   
 
 
@@ -101,6 +106,10 @@ summarize_descriptions:
   ## async_mode: override the global async_mode settings for this task
   prompt: "prompts/summarize_descriptions.txt"
   max_length: {defs.SUMMARIZE_DESCRIPTIONS_MAX_LENGTH}
+  # reduce_mode: {defs.SUMMARIZE_DESCRIPTIONS_REDUCE_MODE.value} # rolling or tree
+  # batch_enabled: {defs.SUMMARIZE_DESCRIPTIONS_BATCH_ENABLED}
+  # batch_max_tokens: {defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_TOKENS}
+  # batch_max_output_tokens: {defs.SUMMARIZE_DESCRIPTIONS_BATCH_MAX_OUTPUT_TOKENS}
 
 claim_extraction:
   ## llm: override the global llm settings for this task
@@ -121,9 +130,14 @@ community_reports:
 
 cluster_graph:
   max_cluster_size: {defs.MAX_CLUSTER_SIZE}
+  # emit_membership: {str(defs.CLUSTER_GRAPH_EMIT_MEMBERSHIP).lower()} # if true, store one graph and a node community membership table instead of a graph per level
+  # all_components: {str(defs.CLUSTER_GRAPH_ALL_COMPONENTS).lower()} # if true, cluster every connected component rather than only the largest
+  # normalize_nodes: {str(defs.CLUSTER_GRAPH_NORMALIZE_NODES).lower()} # if true, store each final node once plus a create_final_node_communities membership table
 
 embed_graph:
   enabled: false # if true, will generate node2vec embeddings for nodes
+  # parallel: {str(defs.NODE2VEC_PARALLEL).lower()} # if true, will generate walks and train node2vec in parallel
+  # dimensions: {defs.NODE2VEC_DIMENSIONS}
   # num_walks: {defs.NODE2VEC_NUM_WALKS}
   # walk_length: {defs.NODE2VEC_WALK_LENGTH}
   # window_size: {defs.NODE2VEC_WINDOW_SIZE}
@@ -132,6 +146,7 @@ embed_graph:
 
 umap:
   enabled: false # if true, will generate UMAP embeddings for nodes
+  # export NUMBA_CACHE_DIR=<directory> before running the indexer to persist the UMAP JIT compilation cache across runs
 
 snapshots:
   graphml: false
@@ -5,6 +5,7 @@
 
 from .check_token_limit import check_token_limit
 from .text_splitting import (
+    DecodeBatchFn,
     DecodeFn,
     EncodedText,
     EncodeFn,
@@ -19,6 +20,7 @@ from .text_splitting import (
 )
 
 __all__ = [
+    "DecodeBatchFn",
     "DecodeFn",
     "EncodeFn",
     "EncodedText",
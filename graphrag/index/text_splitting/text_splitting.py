@@ -14,10 +14,15 @@ from typing import Any, Literal, cast
 import pandas as pd
 import tiktoken
 
-from graphrag.index.utils import num_tokens_from_string
+from graphrag.index.utils import (
+    get_encoding,
+    num_tokens_from_string,
+    num_tokens_from_strings,
+)
 
 EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
+DecodeBatchFn = Callable[[list[EncodedText]], list[str]]
 EncodeFn = Callable[[str], EncodedText]
 LengthFn = Callable[[str], int]
 
@@ -36,6 +41,8 @@ class Tokenizer:
     """ Function to decode a list of token ids to a string"""
     encode: EncodeFn
     """ Function to encode a string to a list of token ids"""
+    decode_batch: DecodeBatchFn | None = None
+    """ Optional function to decode many lists of token ids at once"""
 
 
 class TextSplitter(ABC):
@@ -101,9 +108,9 @@ class TokenTextSplitter(TextSplitter):
                 enc = tiktoken.encoding_for_model(model_name)
             except KeyError:
                 log.exception("Model %s not found, using %s", model_name, encoding_name)
-                enc = tiktoken.get_encoding(encoding_name)
+                enc = get_encoding(encoding_name=encoding_name)
         else:
-            enc = tiktoken.get_encoding(encoding_name)
+            enc = get_encoding(encoding_name=encoding_name)
         self._tokenizer = enc
         self._allowed_special = allowed_special or set()
         self._disallowed_special = disallowed_special
@@ -168,6 +175,9 @@ class TextListSplitter(TextSplitter):
         self._length_function = lambda x: num_tokens_from_string(
             x, model=model_name, encoding_name=encoding_name
         )
+        self._batch_length_function = lambda xs: num_tokens_from_strings(
+            xs, model=model_name, encoding_name=encoding_name
+        )
 
     def split_text(self, text: str | list[str]) -> Iterable[str]:
         """Split a string list into a list of strings for a given chunk size."""
@@ -186,10 +196,10 @@ class TextListSplitter(TextSplitter):
         if len(string_list) == 1:
             return string_list
 
-        for item in string_list:
-            # Count the length of the item and add comma
-            item_length = self._length_function(f"{item},")
+        # Count the length of every item and its comma in one pass
+        item_lengths = self._batch_length_function([f"{item}," for item in string_list])
 
+        for item, item_length in zip(string_list, item_lengths, strict=True):
             if current_length + item_length > self._chunk_size:
                 if current_chunk and len(current_chunk) > 0:
                     # Add the current chunk to the result
@@ -9,19 +9,30 @@ from .is_null import is_null
 from .json import clean_up_json
 from .load_graph import load_graph
 from .string import clean_str
-from .tokens import num_tokens_from_string, string_from_tokens
+from .tokens import (
+    count_tokens,
+    count_tokens_batch,
+    get_encoding,
+    num_tokens_from_string,
+    num_tokens_from_strings,
+    string_from_tokens,
+)
 from .topological_sort import topological_sort
 from .uuid import gen_uuid
 
 __all__ = [
     "clean_str",
     "clean_up_json",
+    "count_tokens",
+    "count_tokens_batch",
     "dict_has_keys_with_types",
     "gen_md5_hash",
     "gen_uuid",
+    "get_encoding",
     "is_null",
     "load_graph",
     "num_tokens_from_string",
+    "num_tokens_from_strings",
     "string_from_tokens",
     "topological_sort",
 ]
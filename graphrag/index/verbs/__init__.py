@@ -19,7 +19,7 @@ from .overrides import aggregate, concat, merge
 from .snapshot import snapshot
 from .snapshot_rows import snapshot_rows
 from .spread_json import spread_json
-from .text import chunk, text_embed, text_split, text_translate
+from .text import chunk, compress_embeddings, text_embed, text_split, text_translate
 from .unzip import unzip
 from .zip import zip_verb
 
@@ -27,6 +27,7 @@ __all__ = [
     "aggregate",
     "chunk",
     "cluster_graph",
+    "compress_embeddings",
     "concat",
     "create_community_reports",
     "create_graph",
@@ -5,13 +5,13 @@
 
 import asyncio
 import logging
+import time
 from enum import Enum
-from typing import Any, NamedTuple, cast
+from typing import Any, cast
 
 import networkx as nx
 import pandas as pd
 from datashaper import (
-    ProgressTicker,
     TableContainer,
     VerbCallbacks,
     VerbInput,
@@ -19,24 +19,24 @@ from datashaper import (
     verb,
 )
 
+import graphrag.config.defaults as defs
 from graphrag.index.cache import PipelineCache
 from graphrag.index.utils import load_graph
 
-from .strategies.typing import SummarizationStrategy
+from .strategies.typing import (
+    BatchSummarizationStrategy,
+    SummarizationStrategy,
+    SummarizedDescriptionResult,
+)
 
 log = logging.getLogger(__name__)
 
 
-class DescriptionSummarizeRow(NamedTuple):
-    """DescriptionSummarizeRow class definition."""
-
-    graph: Any
-
-
 class SummarizeStrategyType(str, Enum):
     """SummarizeStrategyType class definition."""
 
     graph_intelligence = "graph_intelligence"
+    graph_intelligence_batch = "graph_intelligence_batch"
 
     def __repr__(self):
         """Get a string representation."""
@@ -95,6 +95,7 @@ async def summarize_descriptions(
     strategy:
         type: graph_intelligence
         summarize_prompt: # Optional, the prompt to use for extraction
+        reduce_mode: rolling # Optional, how to reduce many descriptions: rolling (sequential fold) or tree (concurrent group merge)
 
 
         llm: # The configuration for the LLM
@@ -109,90 +110,160 @@ async def summarize_descriptions(
             api_version: !ENV ${GRAPHRAG_OPENAI_API_VERSION} # The api version to use for azure
             proxy: !ENV ${GRAPHRAG_OPENAI_PROXY} # The proxy to use for azure
     ```
+
+    ### graph_intelligence_batch
+
+    This strategy packs many small entities and relationships into a single structured LLM request and reads back a keyed list of summaries. Items that are too large for a batch, or that are missing from a batch response, are summarized individually. It accepts the same config as `graph_intelligence`, plus:
+
+    ```yml
+    strategy:
+        type: graph_intelligence_batch
+        batch_summarize_prompt: # Optional, the prompt to use for batched summarization
+        batch_max_tokens: 4000 # Optional, the token budget of a single batched request
+        batch_max_items: 20 # Optional, the maximum number of items per batched request
+        batch_max_output_tokens: 4000 # Optional, the completion token limit of a batched request, which also bounds the items per batch
+        batch_max_item_tokens: 1000 # Optional, items with more description tokens are summarized individually
+    ```
     """
     log.debug("summarize_descriptions strategy=%s", strategy)
     output = cast(pd.DataFrame, input.get_input())
     strategy = strategy or {}
-    strategy_exec = load_strategy(
-        strategy.get("type", SummarizeStrategyType.graph_intelligence)
-    )
+    strategy_type = strategy.get("type", SummarizeStrategyType.graph_intelligence)
     strategy_config = {**strategy}
 
-    async def get_resolved_entities(row, semaphore: asyncio.Semaphore):
-        graph: nx.Graph = load_graph(cast(str | nx.Graph, getattr(row, column)))
-
-        ticker_length = len(graph.nodes) + len(graph.edges)
+    if strategy_type == SummarizeStrategyType.graph_intelligence_batch:
+        batch_strategy_exec = load_batch_strategy(strategy_type)
 
-        ticker = progress_ticker(callbacks.progress, ticker_length)
-
-        futures = [
-            do_summarize_descriptions(
-                node,
-                sorted(set(graph.nodes[node].get("description", "").split("\n"))),
-                ticker,
-                semaphore,
+        async def get_batch_resolved_entities(row):
+            graph: nx.Graph = load_graph(cast(str | nx.Graph, getattr(row, column)))
+            ticker = progress_ticker(
+                callbacks.progress, len(graph.nodes) + len(graph.edges)
             )
-            for node in graph.nodes()
-        ]
-        futures += [
-            do_summarize_descriptions(
-                edge,
-                sorted(set(graph.edges[edge].get("description", "").split("\n"))),
-                ticker,
-                semaphore,
+            graph_items: list[tuple[str | tuple[str, str], list[str]]] = [
+                (
+                    cast(str, node),
+                    sorted(set(graph.nodes[node].get("description", "").split("\n"))),
+                )
+                for node in graph.nodes()
+            ]
+            graph_items += [
+                (
+                    cast(tuple[str, str], edge),
+                    sorted(set(graph.edges[edge].get("description", "").split("\n"))),
+                )
+                for edge in graph.edges()
+            ]
+            results = await batch_strategy_exec(
+                graph_items, callbacks, cache, strategy_config
             )
-            for edge in graph.edges()
-        ]
+            ticker(len(graph_items))
+            return _apply_summaries(graph, results)
 
-        results = await asyncio.gather(*futures)
+        output[to] = [
+            await get_batch_resolved_entities(row) for row in output.itertuples()
+        ]
+        return TableContainer(table=output)
+
+    strategy_exec = load_strategy(strategy_type)
+    # Parallelism is governed by the LLM's shared concurrency semaphore and rate
+    # limiter, so run as many workers as that limiter admits requests
+    llm_config = strategy_config.get("llm", {})
+    num_workers = (
+        llm_config.get("concurrent_requests")
+        or kwargs.get("num_threads")
+        or defs.LLM_CONCURRENT_REQUESTS
+    )
 
-        for result in results:
-            graph_item = result.items
-            if isinstance(graph_item, str) and graph_item in graph.nodes():
-                graph.nodes[graph_item]["description"] = result.description
-            elif isinstance(graph_item, tuple) and graph_item in graph.edges():
-                graph.edges[graph_item]["description"] = result.description
+    async def get_resolved_entities(row) -> str:
+        graph: nx.Graph = load_graph(cast(str | nx.Graph, getattr(row, column)))
+        ticker_length = len(graph.nodes) + len(graph.edges)
+        ticker = progress_ticker(callbacks.progress, ticker_length)
+        queue: asyncio.Queue[tuple[str | tuple[str, str], list[str]] | None] = (
+            asyncio.Queue(maxsize=num_workers * 2)
+        )
 
-        return DescriptionSummarizeRow(
-            graph="\n".join(nx.generate_graphml(graph)),
+        async def produce():
+            for node in graph.nodes():
+                descriptions = graph.nodes[node].get("description", "").split("\n")
+                await queue.put((cast(str, node), sorted(set(descriptions))))
+            for edge in graph.edges():
+                descriptions = graph.edges[edge].get("description", "").split("\n")
+                await queue.put((
+                    cast(tuple[str, str], edge),
+                    sorted(set(descriptions)),
+                ))
+            for _ in range(num_workers):
+                await queue.put(None)
+
+        async def consume():
+            while (work := await queue.get()) is not None:
+                graph_item, descriptions = work
+                result = await strategy_exec(
+                    graph_item, descriptions, callbacks, cache, strategy_config
+                )
+                # Apply each summary as soon as it arrives
+                _apply_summary(graph, result)
+                ticker(1)
+
+        start = time.time()
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(consume()) for _ in range(num_workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        elapsed = time.time() - start
+        log.info(
+            "summarized %d descriptions in %.2fs (%.2f items/s) using %d workers",
+            ticker_length,
+            elapsed,
+            ticker_length / elapsed if elapsed > 0 else 0.0,
+            num_workers,
         )
 
-    async def do_summarize_descriptions(
-        graph_item: str | tuple[str, str],
-        descriptions: list[str],
-        ticker: ProgressTicker,
-        semaphore: asyncio.Semaphore,
-    ):
-        async with semaphore:
-            results = await strategy_exec(
-                graph_item,
-                descriptions,
-                callbacks,
-                cache,
-                strategy_config,
-            )
-            ticker(1)
-        return results
+        return "\n".join(nx.generate_graphml(graph))
 
     # Graph is always on row 0, so here a derive from rows does not work
     # This iteration will only happen once, but avoids hardcoding a iloc[0]
     # Since parallelization is at graph level (nodes and edges), we can't use
     # the parallelization of the derive_from_rows
-    semaphore = asyncio.Semaphore(kwargs.get("num_threads", 4))
+    output[to] = [await get_resolved_entities(row) for row in output.itertuples()]
+    return TableContainer(table=output)
+
 
-    results = [
-        await get_resolved_entities(row, semaphore) for row in output.itertuples()
-    ]
+def _apply_summary(graph: nx.Graph, result: SummarizedDescriptionResult) -> None:
+    """Write a summarized description back onto the graph."""
+    graph_item = result.items
+    if isinstance(graph_item, str) and graph_item in graph.nodes():
+        graph.nodes[graph_item]["description"] = result.description
+    elif isinstance(graph_item, tuple) and graph_item in graph.edges():
+        graph.edges[graph_item]["description"] = result.description
 
-    to_result = []
 
+def _apply_summaries(
+    graph: nx.Graph, results: list[SummarizedDescriptionResult]
+) -> str:
+    """Write summarized descriptions back onto the graph and serialize it."""
     for result in results:
-        if result:
-            to_result.append(result.graph)
-        else:
-            to_result.append(None)
-    output[to] = to_result
-    return TableContainer(table=output)
+        _apply_summary(graph, result)
+
+    return "\n".join(nx.generate_graphml(graph))
+
+
+def load_batch_strategy(
+    strategy_type: SummarizeStrategyType,
+) -> BatchSummarizationStrategy:
+    """Load batch strategy method definition."""
+    match strategy_type:
+        case SummarizeStrategyType.graph_intelligence_batch:
+            from .strategies.graph_intelligence import run_batch as run_gi_batch
+
+            return run_gi_batch
+        case _:
+            msg = f"Unknown batch strategy: {strategy_type}"
+            raise ValueError(msg)
 
 
 def load_strategy(strategy_type: SummarizeStrategyType) -> SummarizationStrategy:
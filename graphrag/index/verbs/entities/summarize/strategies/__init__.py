@@ -3,6 +3,6 @@
 
 """Indexing Engine - Summarization Strategies Package."""
 
-from .typing import SummarizationStrategy
+from .typing import BatchSummarizationStrategy, SummarizationStrategy
 
-__all__ = ["SummarizationStrategy"]
+__all__ = ["BatchSummarizationStrategy", "SummarizationStrategy"]
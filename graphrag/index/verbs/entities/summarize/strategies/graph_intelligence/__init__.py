@@ -3,6 +3,6 @@
 
 """The Entity Resolution graph intelligence package root."""
 
-from .run_graph_intelligence import run
+from .run_graph_intelligence import run, run_batch
 
-__all__ = ["run"]
+__all__ = ["run", "run_batch"]
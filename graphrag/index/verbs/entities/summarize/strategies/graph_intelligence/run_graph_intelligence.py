@@ -7,7 +7,10 @@ from datashaper import VerbCallbacks
 
 from graphrag.config.enums import LLMType
 from graphrag.index.cache import PipelineCache
-from graphrag.index.graph.extractors.summarize import SummarizeExtractor
+from graphrag.index.graph.extractors.summarize import (
+    BatchSummarizeExtractor,
+    SummarizeExtractor,
+)
 from graphrag.index.llm import load_llm
 from graphrag.index.verbs.entities.summarize.strategies.typing import (
     StrategyConfig,
@@ -36,6 +39,21 @@ async def run(
     )
 
 
+async def run_batch(
+    described_items: list[tuple[str | tuple[str, str], list[str]]],
+    reporter: VerbCallbacks,
+    pipeline_cache: PipelineCache,
+    args: StrategyConfig,
+) -> list[SummarizedDescriptionResult]:
+    """Run the batched graph intelligence description summarization strategy."""
+    llm_config = args.get("llm", DEFAULT_LLM_CONFIG)
+    llm_type = llm_config.get("type", LLMType.StaticResponse)
+    llm = load_llm(
+        "summarize_descriptions", llm_type, reporter, pipeline_cache, llm_config
+    )
+    return await run_batch_summarize_descriptions(llm, described_items, reporter, args)
+
+
 async def run_summarize_descriptions(
     llm: CompletionLLM,
     items: str | tuple[str, str],
@@ -44,13 +62,53 @@ async def run_summarize_descriptions(
     args: StrategyConfig,
 ) -> SummarizedDescriptionResult:
     """Run the entity extraction chain."""
+    extractor = _create_summarize_extractor(llm, reporter, args)
+    result = await extractor(items=items, descriptions=descriptions)
+    return SummarizedDescriptionResult(
+        items=result.items, description=result.description
+    )
+
+
+async def run_batch_summarize_descriptions(
+    llm: CompletionLLM,
+    items: list[tuple[str | tuple[str, str], list[str]]],
+    reporter: VerbCallbacks,
+    args: StrategyConfig,
+) -> list[SummarizedDescriptionResult]:
+    """Run the batched description summarization chain."""
+    extractor = BatchSummarizeExtractor(
+        llm_invoker=llm,
+        extractor=_create_summarize_extractor(llm, reporter, args),
+        batch_prompt=args.get("batch_summarize_prompt", None),
+        on_error=lambda e, stack, details: (
+            reporter.error("Description Summarization Error", e, stack, details)
+            if reporter
+            else None
+        ),
+        max_summary_length=args.get("max_summary_length", None),
+        batch_max_tokens=args.get("batch_max_tokens", None),
+        batch_max_items=args.get("batch_max_items", None),
+        max_item_tokens=args.get("batch_max_item_tokens", None),
+        batch_max_output_tokens=args.get("batch_max_output_tokens", None),
+    )
+
+    results = await extractor(items)
+    return [
+        SummarizedDescriptionResult(items=result.items, description=result.description)
+        for result in results
+    ]
+
+
+def _create_summarize_extractor(
+    llm: CompletionLLM, reporter: VerbCallbacks, args: StrategyConfig
+) -> SummarizeExtractor:
     # Extraction Arguments
     summarize_prompt = args.get("summarize_prompt", None)
     entity_name_key = args.get("entity_name_key", "entity_name")
     input_descriptions_key = args.get("input_descriptions_key", "description_list")
     max_tokens = args.get("max_tokens", None)
 
-    extractor = SummarizeExtractor(
+    return SummarizeExtractor(
         llm_invoker=llm,
         summarization_prompt=summarize_prompt,
         entity_name_key=entity_name_key,
@@ -62,9 +120,5 @@ async def run_summarize_descriptions(
         ),
         max_summary_length=args.get("max_summary_length", None),
         max_input_tokens=max_tokens,
-    )
-
-    result = await extractor(items=items, descriptions=descriptions)
-    return SummarizedDescriptionResult(
-        items=result.items, description=result.description
+        reduce_mode=args.get("reduce_mode", None),
     )
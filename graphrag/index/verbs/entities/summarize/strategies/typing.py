@@ -32,3 +32,13 @@ SummarizationStrategy = Callable[
     ],
     Awaitable[SummarizedDescriptionResult],
 ]
+
+BatchSummarizationStrategy = Callable[
+    [
+        list[tuple[str | tuple[str, str], list[str]]],
+        VerbCallbacks,
+        PipelineCache,
+        StrategyConfig,
+    ],
+    Awaitable[list[SummarizedDescriptionResult]],
+]
@@ -6,6 +6,7 @@
 from .clustering import cluster_graph
 from .compute_edge_combined_degree import compute_edge_combined_degree
 from .create import DEFAULT_EDGE_ATTRIBUTES, DEFAULT_NODE_ATTRIBUTES, create_graph
+from .create_communities import create_communities, create_node_communities
 from .embed import embed_graph
 from .layout import layout_graph
 from .merge import merge_graphs
@@ -23,8 +24,10 @@ __all__ = [
     "DEFAULT_NODE_ATTRIBUTES",
     "cluster_graph",
     "compute_edge_combined_degree",
+    "create_communities",
     "create_community_reports",
     "create_graph",
+    "create_node_communities",
     "embed_graph",
     "layout_graph",
     "merge_graphs",
@@ -27,6 +27,7 @@ def cluster_graph(
     column: str,
     to: str,
     level_to: str | None = None,
+    membership_to: str | None = None,
     **_kwargs,
 ) -> TableContainer:
     """
@@ -39,6 +40,7 @@ def cluster_graph(
         column: entity_graph # The name of the column containing the graph, should be a graphml graph
         to: clustered_graph # The name of the column to output the clustered graph to
         level_to: level # The name of the column to output the level to
+        membership_to: community_membership # Optional, emit one graph per row and a node community membership column instead of one graph per level
         strategy: <strategy config> # See strategies section below
     ```
 
@@ -54,8 +56,17 @@ def cluster_graph(
         use_lcc: true # Optional, if the largest connected component should be used with the leiden algorithm, default: true
         seed: 0xDEADBEEF # Optional, the seed to use for the leiden algorithm, default: 0xDEADBEEF
         levels: [0, 1] # Optional, the levels to output, default: all the levels detected
+        all_components: false # Optional, if every connected component should be clustered rather than only the largest, default: false
+        min_component_size: 1 # Optional, with all_components, components with fewer nodes are left unclustered, default: 1
+        trivial_component_size: 2 # Optional, with all_components, components up to this size become a single community without running leiden, default: 2
+        num_processes: 4 # Optional, with all_components, the number of processes used for the smaller components, default: the cpu count
 
     ```
+
+    ## Membership output
+    When `membership_to` is set the graph is annotated once rather than once per level. Each row keeps a single graph in `to`,
+    the list of levels in `level_to`, and a list of `{node, level, cluster}` records in `membership_to`. `unpack_graph` expands
+    these rows back into per-level nodes and edges, so downstream tables are unchanged.
     """
     output_df = cast(pd.DataFrame, input.get_input())
     results = output_df[column].apply(lambda graph: run_layout(strategy, graph))
@@ -67,9 +78,24 @@ def cluster_graph(
     output_df[level_to] = output_df.apply(
         lambda x: list({level for level, _, _ in x[community_map_to]}), axis=1
     )
-    output_df[to] = [None] * len(output_df)
 
     num_total = len(output_df)
+    if membership_to is not None:
+        graphs: list[str] = []
+        for _, row in progress_iterable(
+            output_df.iterrows(), callbacks.progress, num_total
+        ):
+            graph = apply_clustering(cast(str | nx.Graph, row[column]), [], None)
+            graphs.append("\n".join(nx.generate_graphml(graph)))
+        output_df[to] = graphs
+        output_df[level_to] = output_df[level_to].apply(sorted)
+        output_df[membership_to] = output_df[community_map_to].apply(
+            community_membership
+        )
+        output_df.drop(columns=[community_map_to], inplace=True)
+        return TableContainer(table=output_df)
+
+    output_df[to] = [None] * len(output_df)
 
     # Go through each of the rows
     graph_level_pairs_column: list[list[tuple[int, str]]] = []
@@ -77,6 +103,7 @@ def cluster_graph(
         output_df.iterrows(), callbacks.progress, num_total
     ):
         levels = row[level_to]
+        base_graph = load_graph(cast(str | nx.Graph, row[column]))
         graph_level_pairs: list[tuple[int, str]] = []
 
         # For each of the levels, get the graph and add it to the list
@@ -84,7 +111,7 @@ def cluster_graph(
             graph = "\n".join(
                 nx.generate_graphml(
                     apply_clustering(
-                        cast(str, row[column]),
+                        base_graph,
                         cast(Communities, row[community_map_to]),
                         level,
                     )
@@ -109,19 +136,36 @@ def cluster_graph(
     return TableContainer(table=output_df)
 
 
-# TODO: This should support str | nx.Graph as a graphml param
 def apply_clustering(
-    graphml: str, communities: Communities, level=0, seed=0xF001
+    graphml_or_graph: str | nx.Graph,
+    communities: Communities,
+    level: int | None = 0,
+    seed=0xF001,
 ) -> nx.Graph:
-    """Apply clustering to a graphml string."""
-    random = Random(seed)  # noqa S311
-    graph = nx.parse_graphml(graphml)
+    """Apply clustering to a graphml string or a copy of a graph.
+
+    With no level only the level-independent degree and id attributes are added.
+    """
+    graph = load_graph(graphml_or_graph)
+    if not isinstance(graphml_or_graph, str):
+        graph = graph.copy()
     for community_level, community_id, nodes in communities:
         if level == community_level:
             for node in nodes:
                 graph.nodes[node]["cluster"] = community_id
                 graph.nodes[node]["level"] = level
 
+    annotate_graph(graph, seed)
+    if level is not None:
+        for edge in graph.edges():
+            graph.edges[edge]["level"] = level
+    return graph
+
+
+def annotate_graph(graph: nx.Graph, seed=0xF001) -> nx.Graph:
+    """Add the level-independent degree and id attributes to a graph in place."""
+    random = Random(seed)  # noqa S311
+
     # add node degree
     for node_degree in graph.degree:
         graph.nodes[str(node_degree[0])]["degree"] = int(node_degree[1])
@@ -135,10 +179,18 @@ def apply_clustering(
     for index, edge in enumerate(graph.edges()):
         graph.edges[edge]["id"] = str(gen_uuid(random))
         graph.edges[edge]["human_readable_id"] = index
-        graph.edges[edge]["level"] = level
     return graph
 
 
+def community_membership(communities: Communities) -> list[dict[str, Any]]:
+    """Flatten communities into node to (level, cluster) membership records."""
+    return [
+        {"node": node, "level": level, "cluster": community_id}
+        for level, community_id, nodes in communities
+        for node in nodes
+    ]
+
+
 class GraphCommunityStrategyType(str, Enum):
     """GraphCommunityStrategyType class definition."""
 
@@ -4,12 +4,19 @@
 """A module containing run and _compute_leiden_communities methods definitions."""
 
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Any
 
 import networkx as nx
 from graspologic.partition import hierarchical_leiden
 
-from graphrag.index.graph.utils import stable_largest_connected_component
+from graphrag.index.graph.utils import (
+    stable_connected_components,
+    stable_largest_connected_component,
+)
 
 log = logging.getLogger(__name__)
 
@@ -23,12 +30,22 @@ def run(graph: nx.Graph, args: dict[str, Any]) -> dict[int, dict[str, list[str]]
             "Running leiden with max_cluster_size=%s, lcc=%s", max_cluster_size, use_lcc
         )
 
-    node_id_to_community_map = _compute_leiden_communities(
-        graph=graph,
-        max_cluster_size=max_cluster_size,
-        use_lcc=use_lcc,
-        seed=args.get("seed", 0xDEADBEEF),
-    )
+    if args.get("all_components", False):
+        node_id_to_community_map = _compute_component_leiden_communities(
+            graph=graph,
+            max_cluster_size=max_cluster_size,
+            seed=args.get("seed", 0xDEADBEEF),
+            min_component_size=args.get("min_component_size", 1),
+            trivial_component_size=args.get("trivial_component_size", 2),
+            num_processes=args.get("num_processes"),
+        )
+    else:
+        node_id_to_community_map = _compute_leiden_communities(
+            graph=graph,
+            max_cluster_size=max_cluster_size,
+            use_lcc=use_lcc,
+            seed=args.get("seed", 0xDEADBEEF),
+        )
     levels = args.get("levels")
 
     # If they don't pass in levels, use them all
@@ -67,3 +84,81 @@ def _compute_leiden_communities(
         results[partition.level][partition.node] = partition.cluster
 
     return results
+
+
+def _compute_component_leiden_communities(
+    graph: nx.Graph | nx.DiGraph,
+    max_cluster_size: int,
+    seed=0xDEADBEEF,
+    min_component_size: int = 1,
+    trivial_component_size: int = 2,
+    num_processes: int | None = None,
+) -> dict[int, dict[str, int]]:
+    """Return Leiden communities for every connected component of the graph.
+
+    Components are visited largest first in a stable order and their cluster ids are
+    offset so they stay unique, so the result only depends on the graph and the seed.
+    """
+    start = time.time()
+    components = [
+        component
+        for component in stable_connected_components(graph)
+        if len(component.nodes) >= min_component_size
+    ]
+    clustered = [
+        component
+        for component in components
+        if len(component.nodes) > trivial_component_size
+    ]
+    num_processes = num_processes or os.cpu_count() or 1
+
+    partitions: list[dict[int, dict[str, int]]] = []
+    if num_processes > 1 and len(clustered) > 1:
+        # the largest component runs here while the pool works through the rest
+        rest = clustered[1:]
+        num_workers = min(num_processes, len(rest))
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            rest_partitions = executor.map(
+                _compute_leiden_communities,
+                rest,
+                repeat(max_cluster_size),
+                repeat(False),
+                repeat(seed),
+                chunksize=max(1, len(rest) // (num_workers * 4)),
+            )
+            partitions.append(
+                _compute_leiden_communities(clustered[0], max_cluster_size, False, seed)
+            )
+            partitions.extend(rest_partitions)
+    else:
+        partitions = [
+            _compute_leiden_communities(component, max_cluster_size, False, seed)
+            for component in clustered
+        ]
+
+    results: dict[int, dict[str, int]] = {}
+    next_cluster_id = 0
+    clustered_index = 0
+    for component in components:
+        if len(component.nodes) > trivial_component_size:
+            partition = partitions[clustered_index]
+            clustered_index += 1
+        else:
+            # too small to split, the whole component is a single community
+            partition = {0: dict.fromkeys(component.nodes, 0)}
+
+        max_cluster_id = -1
+        for level, node_clusters in partition.items():
+            level_results = results.setdefault(level, {})
+            for node, cluster in node_clusters.items():
+                level_results[node] = next_cluster_id + cluster
+                max_cluster_id = max(max_cluster_id, cluster)
+        next_cluster_id += max_cluster_id + 1
+
+    log.info(
+        "clustered %d components (%d assigned directly) in %.2fs",
+        len(components),
+        len(components) - len(clustered),
+        time.time() - start,
+    )
+    return results
@@ -0,0 +1,183 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the create_communities and create_node_communities verb definitions."""
+
+from collections.abc import Iterable
+from typing import Any, cast
+
+import networkx as nx
+import pandas as pd
+from datashaper import (
+    FieldAggregateOperation,
+    TableContainer,
+    VerbCallbacks,
+    VerbInput,
+    aggregate_operation_mapping,
+    progress_iterable,
+    verb,
+)
+
+from graphrag.index.utils import load_graph
+
+_array_agg_distinct = aggregate_operation_mapping[
+    FieldAggregateOperation.ArrayAggDistinct
+]
+
+
+@verb(name="create_communities")
+def create_communities(
+    input: VerbInput,
+    callbacks: VerbCallbacks,
+    column: str,
+    level_column: str = "level",
+    membership_column: str = "community_membership",
+    **_kwargs,
+) -> TableContainer:
+    """
+    Create the communities table from clustered graphs.
+
+    Each graph is read once into a node membership table (label, level, cluster) and an edge table, and
+    the relationships of every community are collected with a single join from the edges to the membership.
+    Graphs clustered one level per row and graphs carrying a membership column are both supported.
+
+    ## Usage
+    ```yaml
+    verb: create_communities
+    args:
+        column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        level_column: level # Optional, the name of the column containing the level, default: level
+        membership_column: community_membership # Optional, the name of the node community membership column, default: community_membership
+    ```
+    """
+    input_df = cast(pd.DataFrame, input.get_input())
+    membership, node_source_ids, edges = _graph_tables(
+        input_df, callbacks, column, level_column, membership_column
+    )
+    membership["source_id"] = cast(pd.Series, membership["label"]).map(node_source_ids)
+
+    # a community holds every relationship with at least one endpoint among its members
+    community_edges = pd.concat(
+        [
+            membership.merge(edges, left_on="label", right_on=endpoint)
+            for endpoint in ["source", "target"]
+        ],
+        ignore_index=True,
+    )
+    relationships = (
+        community_edges.groupby(["cluster", "level"], sort=False)
+        .agg(
+            relationship_ids=("id", _array_agg_distinct),
+            text_unit_ids=("source_id", _array_agg_distinct),
+        )
+        .reset_index()
+    )
+
+    # communities without relationships are not reported
+    communities = membership[["cluster", "level"]].drop_duplicates()
+    output = communities.merge(relationships, on=["cluster", "level"])
+    output["id"] = output["cluster"]
+    output["title"] = "Community " + output["id"].astype(str)
+    output["raw_community"] = output["id"]
+    output = cast(
+        pd.DataFrame,
+        output[
+            [
+                "id",
+                "title",
+                "level",
+                "raw_community",
+                "relationship_ids",
+                "text_unit_ids",
+            ]
+        ],
+    )
+    return TableContainer(table=output.reset_index(drop=True))
+
+
+@verb(name="create_node_communities")
+def create_node_communities(
+    input: VerbInput,
+    callbacks: VerbCallbacks,
+    column: str,
+    level_column: str = "level",
+    membership_column: str = "community_membership",
+    **_kwargs,
+) -> TableContainer:
+    """
+    Create a slim node community membership table from clustered graphs.
+
+    The output holds one (title, level, community) row for each level a node belongs to a community at.
+
+    ## Usage
+    ```yaml
+    verb: create_node_communities
+    args:
+        column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        level_column: level # Optional, the name of the column containing the level, default: level
+        membership_column: community_membership # Optional, the name of the node community membership column, default: community_membership
+    ```
+    """
+    input_df = cast(pd.DataFrame, input.get_input())
+    membership, _, _ = _graph_tables(
+        input_df, callbacks, column, level_column, membership_column
+    )
+    output = membership.rename(columns={"label": "title", "cluster": "community"})
+    return TableContainer(table=output)
+
+
+def _graph_tables(
+    input_df: pd.DataFrame,
+    callbacks: VerbCallbacks,
+    column: str,
+    level_column: str,
+    membership_column: str,
+) -> tuple[pd.DataFrame, dict[str, Any], pd.DataFrame]:
+    """Read the clustered graphs into a membership table, node source ids and an edge table."""
+    has_membership = membership_column in input_df.columns
+    membership_records: list[tuple[str, int, str]] = []
+    node_source_ids: dict[str, Any] = {}
+    edge_records: dict[str, tuple[str, str, str]] = {}
+
+    for _, row in progress_iterable(
+        input_df.iterrows(), callbacks.progress, len(input_df)
+    ):
+        graph = load_graph(cast(str | nx.Graph, row[column]))
+        graph_nodes = cast(Iterable[tuple[str, dict[str, Any]]], graph.nodes(data=True))
+        graph_edges = cast(
+            Iterable[tuple[str, str, dict[str, Any]]], graph.edges(data=True)
+        )
+        for label, node_data in graph_nodes:
+            node_source_ids.setdefault(label, node_data.get("source_id"))
+        for source, target, edge_data in graph_edges:
+            edge_id = cast(str, edge_data.get("id"))
+            if edge_id not in edge_records:
+                edge_records[edge_id] = (source, target, edge_id)
+
+        if has_membership:
+            clusters_by_level: dict[int, dict[str, str]] = {}
+            for record in cast(list[dict[str, Any]], row[membership_column]):
+                level_clusters = clusters_by_level.setdefault(int(record["level"]), {})
+                level_clusters[record["node"]] = record["cluster"]
+            for level in sorted(clusters_by_level):
+                level_clusters = clusters_by_level[level]
+                membership_records.extend(
+                    (label, level, level_clusters[label])
+                    for label in graph.nodes
+                    if label in level_clusters
+                )
+        else:
+            level = row[level_column]
+            membership_records.extend(
+                (label, node_data.get("level", level), node_data["cluster"])
+                for label, node_data in graph_nodes
+                if "cluster" in node_data
+            )
+
+    membership = pd.DataFrame(
+        membership_records, columns=cast(Any, ["label", "level", "cluster"])
+    )
+    edges = pd.DataFrame(
+        list(edge_records.values()), columns=cast(Any, ["source", "target", "id"])
+    )
+    return membership, node_source_ids, edges
@@ -3,6 +3,11 @@
 
 """A module containing embed_graph and run_embeddings methods definition."""
 
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
 from enum import Enum
 from typing import Any, cast
 
@@ -10,15 +15,22 @@ import networkx as nx
 import pandas as pd
 from datashaper import TableContainer, VerbCallbacks, VerbInput, derive_from_rows, verb
 
+from graphrag.index.cache import PipelineCache
 from graphrag.index.utils import load_graph
 
 from .typing import NodeEmbeddings
 
+log = logging.getLogger(__name__)
+
+# Strategy arguments that do not change the embeddings, left out of the cache key
+_UNCACHED_ARGS = {"num_processes", "workers", "quality_check", "quality_check_k"}
+
 
 class EmbedGraphStrategyType(str, Enum):
     """EmbedGraphStrategyType class definition."""
 
     node2vec = "node2vec"
+    node2vec_parallel = "node2vec_parallel"
 
     def __repr__(self):
         """Get a string representation."""
@@ -29,9 +41,11 @@ class EmbedGraphStrategyType(str, Enum):
 async def embed_graph(
     input: VerbInput,
     callbacks: VerbCallbacks,
+    cache: PipelineCache,
     strategy: dict[str, Any],
     column: str,
     to: str,
+    use_cache: bool = True,
     **kwargs,
 ) -> TableContainer:
     """
@@ -44,6 +58,7 @@ async def embed_graph(
         column: clustered_graph # The name of the column containing the graph, should be a graphml graph
         to: embeddings # The name of the column to output the embeddings to
         strategy: <strategy config> # See strategies section below
+        use_cache: true # Optional, reuse the embeddings of a graph with the same nodes, edges and strategy, default: true
     ```
 
     ## Strategies
@@ -62,14 +77,47 @@ async def embed_graph(
         iterations: 3 # Optional, The number of iterations to use for the embedding, default: 3
         random_seed: 86 # Optional, The random seed to use for the embedding, default: 86
     ```
+
+    ### node2vec_parallel
+    This strategy generates the node2vec random walks across processes and trains word2vec with multiple workers.
+    It accepts the node2vec options above and the following:
+
+    ```yaml
+    strategy:
+        type: node2vec_parallel
+        num_processes: 8 # Optional, The number of processes generating walks, default: the number of CPUs
+        workers: 8 # Optional, The number of word2vec training workers, default: the number of CPUs
+        quality_check: false # Optional, Log the neighbour overlap with the node2vec strategy, default: false
+        quality_check_k: 10 # Optional, The number of neighbours compared by the quality check, default: 10
+    ```
     """
     output_df = cast(pd.DataFrame, input.get_input())
 
     strategy_type = strategy.get("type", EmbedGraphStrategyType.node2vec)
     strategy_args = {**strategy}
 
-    async def run_strategy(row):  # noqa RUF029 async is required for interface
-        return run_embeddings(strategy_type, cast(Any, row[column]), strategy_args)
+    cache = cache.child("embed_graph")
+    embedded: dict[str, asyncio.Future[NodeEmbeddings]] = {}
+
+    async def embed_cached(graph: nx.Graph, key: str) -> NodeEmbeddings:
+        embeddings = await cache.get(key)
+        if embeddings is not None:
+            log.info("reusing cached graph embeddings %s", key)
+            return embeddings
+        embeddings = run_embeddings(strategy_type, graph, strategy_args)
+        await cache.set(key, embeddings)
+        return embeddings
+
+    async def run_strategy(row):
+        graph = load_graph(cast(Any, row[column]))
+        if not use_cache:
+            return run_embeddings(strategy_type, graph, strategy_args)
+
+        # graphs clustered one level per row share their structure, and so their embeddings
+        key = _cache_key(graph, strategy_type, strategy_args)
+        if key not in embedded:
+            embedded[key] = asyncio.ensure_future(embed_cached(graph, key))
+        return await embedded[key]
 
     results = await derive_from_rows(
         output_df,
@@ -93,6 +141,39 @@ def run_embeddings(
             from .strategies.node_2_vec import run as run_node_2_vec
 
             return run_node_2_vec(graph, args)
+        case EmbedGraphStrategyType.node2vec_parallel:
+            from .strategies.node_2_vec_parallel import run as run_node_2_vec_parallel
+
+            return run_node_2_vec_parallel(graph, args)
         case _:
             msg = f"Unknown strategy {strategy}"
             raise ValueError(msg)
+
+
+def _cache_key(
+    graph: nx.Graph, strategy: EmbedGraphStrategyType, args: dict[str, Any]
+) -> str:
+    """Hash the graph structure and the strategy arguments the embeddings depend on."""
+    nodes = sorted(str(node) for node in graph.nodes)
+    edges = sorted(
+        (
+            *(
+                sorted((str(source), str(target)))
+                if not graph.is_directed()
+                else (str(source), str(target))
+            ),
+            float((edge_data or {}).get("weight", 1.0)),
+        )
+        for source, target, edge_data in cast(
+            Iterable[tuple[Any, Any, dict[str, Any]]], graph.edges(data=True)
+        )
+    )
+    strategy_name = EmbedGraphStrategyType(strategy).value
+    strategy_args = sorted(
+        (key, str(value))
+        for key, value in args.items()
+        if key != "type" and key not in _UNCACHED_ARGS
+    )
+    content = json.dumps([strategy_name, strategy_args, nodes, edges])
+    digest = hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
+    return f"{strategy_name}-{digest}"
@@ -0,0 +1,62 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing run method definition."""
+
+import logging
+import time
+from typing import Any
+
+import networkx as nx
+
+from graphrag.index.graph.embedding import (
+    embed_nod2vec,
+    embed_node2vec_parallel,
+    neighbor_overlap,
+)
+from graphrag.index.graph.utils import stable_largest_connected_component
+from graphrag.index.verbs.graph.embed.typing import NodeEmbeddings
+
+log = logging.getLogger(__name__)
+
+
+def run(graph: nx.Graph, args: dict[str, Any]) -> NodeEmbeddings:
+    """Run method definition."""
+    if args.get("use_lcc", True):
+        graph = stable_largest_connected_component(graph)
+
+    node2vec_args = {
+        "dimensions": args.get("dimensions", 1536),
+        "num_walks": args.get("num_walks", 10),
+        "walk_length": args.get("walk_length", 40),
+        "window_size": args.get("window_size", 2),
+        "iterations": args.get("iterations", 3),
+        "random_seed": args.get("random_seed", 86),
+    }
+    start = time.time()
+    embeddings = embed_node2vec_parallel(
+        graph=graph,
+        **node2vec_args,
+        num_processes=args.get("num_processes"),
+        workers=args.get("workers"),
+    )
+    log.info(
+        "embedded %d nodes with parallel node2vec in %.2fs",
+        len(embeddings.nodes),
+        time.time() - start,
+    )
+
+    if args.get("quality_check", False):
+        # compare the neighbourhoods against the graspologic implementation
+        k = args.get("quality_check_k", 10)
+        reference = embed_nod2vec(graph=graph, **node2vec_args)
+        log.info(
+            "parallel node2vec neighbour overlap with graspologic at k=%d: %.3f",
+            k,
+            neighbor_overlap(embeddings, reference, k=k),
+        )
+
+    pairs = zip(embeddings.nodes, embeddings.embeddings.tolist(), strict=True)
+    sorted_pairs = sorted(pairs, key=lambda x: x[0])
+
+    return dict(sorted_pairs)
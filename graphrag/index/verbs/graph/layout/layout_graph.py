@@ -62,6 +62,9 @@ def layout_graph(
         n_neighbors: 5 # Optional, The number of neighbors to use for the umap algorithm, default: 5
         min_dist: 0.75 # Optional, The min distance to use for the umap algorithm, default: 0.75
     ```
+
+    numba compiles the UMAP kernels on first use in every process. To reuse the compiled kernels across runs,
+    export the NUMBA_CACHE_DIR environment variable before starting the process, as numba reads it when UMAP is imported.
     """
     output_df = cast(pd.DataFrame, input.get_input())
 
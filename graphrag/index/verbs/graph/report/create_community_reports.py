@@ -51,9 +51,15 @@ async def create_community_reports(
     strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    reuse_identical_reports: bool = True,
     **_kwargs,
 ) -> TableContainer:
-    """Generate entities for each row, and optionally a graph of those entities."""
+    """Generate entities for each row, and optionally a graph of those entities.
+
+    A community that repeats a community from a deeper level, with the same members and
+    the same prepared context, reuses that report instead of generating a new one. Set
+    `reuse_identical_reports: false` to always generate a report per community.
+    """
     log.debug("create_community_reports strategy=%s", strategy)
     local_contexts = cast(pd.DataFrame, input.get_input())
     nodes_ctr = get_required_input_table(input, "nodes")
@@ -65,6 +71,9 @@ async def create_community_reports(
     reports: list[CommunityReport | None] = []
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     runner = load_strategy(strategy["type"])
+    community_members = _community_members(nodes)
+    generated_reports: dict[tuple[frozenset[str], str], CommunityReport] = {}
+    num_reused = 0
 
     for level in levels:
         level_contexts = prep_community_report_context(
@@ -90,18 +99,79 @@ async def create_community_reports(
             tick()
             return result
 
-        local_reports = await derive_from_rows(
-            level_contexts,
-            run_generate,
-            callbacks=NoopVerbCallbacks(),
-            num_threads=num_threads,
-            scheduling_type=async_mode,
+        report_keys = [
+            (
+                community_members.get((community, level), frozenset()),
+                context_string,
+            )
+            for community, context_string in zip(
+                level_contexts[schemas.NODE_COMMUNITY],
+                level_contexts[schemas.CONTEXT_STRING],
+                strict=True,
+            )
+        ]
+        reused = [
+            reuse_identical_reports and key in generated_reports for key in report_keys
+        ]
+        for community, community_level, key, is_reused in zip(
+            level_contexts[schemas.NODE_COMMUNITY],
+            level_contexts[schemas.COMMUNITY_LEVEL],
+            report_keys,
+            reused,
+            strict=True,
+        ):
+            if is_reused:
+                reports.append({
+                    **generated_reports[key],
+                    "community": community,
+                    "level": community_level,
+                })
+                tick()
+        num_reused += sum(reused)
+
+        pending_contexts = cast(
+            pd.DataFrame,
+            level_contexts.loc[[not is_reused for is_reused in reused]],
+        )
+        pending_keys = [
+            key
+            for key, is_reused in zip(report_keys, reused, strict=True)
+            if not is_reused
+        ]
+        local_reports = (
+            await derive_from_rows(
+                pending_contexts,
+                run_generate,
+                callbacks=NoopVerbCallbacks(),
+                num_threads=num_threads,
+                scheduling_type=async_mode,
+            )
+            if not pending_contexts.empty
+            else []
         )
+        for key, report in zip(pending_keys, local_reports, strict=True):
+            if report is not None:
+                generated_reports.setdefault(key, report)
         reports.extend([lr for lr in local_reports if lr is not None])
 
+    if num_reused > 0:
+        log.info(
+            "avoided %d LLM calls by reusing reports for communities repeated across levels",
+            num_reused,
+        )
     return TableContainer(table=pd.DataFrame(reports))
 
 
+def _community_members(nodes: pd.DataFrame) -> dict[tuple, frozenset[str]]:
+    """Map each (community, level) to the names of its member nodes."""
+    members = (
+        nodes.groupby([schemas.NODE_COMMUNITY, schemas.NODE_LEVEL])[schemas.NODE_NAME]
+        .agg(frozenset)
+        .to_dict()
+    )
+    return cast(dict[tuple, frozenset[str]], members)
+
+
 async def _generate_report(
     runner: CommunityReportsStrategy,
     cache: PipelineCache,
@@ -145,18 +145,28 @@ def _prepare_reports_at_level(
     )
 
     # concat all node details, including name, degree, node_details, edge_details, and claim_details
-    merged_node_df[schemas.ALL_CONTEXT] = merged_node_df.apply(
-        lambda x: {
-            node_name_column: x[node_name_column],
-            node_degree_column: x[node_degree_column],
-            node_details_column: x[node_details_column],
-            edge_details_column: x[edge_details_column],
-            claim_details_column: x[claim_details_column]
-            if level_claim_df is not None
-            else [],
-        },
-        axis=1,
+    claim_details = (
+        merged_node_df[claim_details_column].tolist()
+        if level_claim_df is not None
+        else [[] for _ in range(len(merged_node_df))]
     )
+    merged_node_df[schemas.ALL_CONTEXT] = [
+        {
+            node_name_column: name,
+            node_degree_column: degree,
+            node_details_column: details,
+            edge_details_column: edge_details,
+            claim_details_column: claims,
+        }
+        for name, degree, details, edge_details, claims in zip(
+            merged_node_df[node_name_column].tolist(),
+            merged_node_df[node_degree_column].tolist(),
+            merged_node_df[node_details_column].tolist(),
+            merged_node_df[edge_details_column].tolist(),
+            claim_details,
+            strict=True,
+        )
+    ]
 
     # group all node details by community
     community_df = (
@@ -4,7 +4,8 @@
 """A module containing create_graph, _get_node_attributes, _get_edge_attributes and _get_attribute_column_mapping methods definition."""
 
 import logging
-from typing import cast
+from itertools import pairwise
+from typing import Any, cast
 
 import pandas as pd
 from datashaper import TableContainer, VerbInput, verb
@@ -29,25 +30,22 @@ def restore_community_hierarchy(
         .agg({name_column: list})
         .reset_index()
     )
-    community_levels = {}
-    for _, row in community_df.iterrows():
-        level = row[level_column]
-        name = row[name_column]
-        community = row[community_column]
-
-        if community_levels.get(level) is None:
-            community_levels[level] = {}
-        community_levels[level][community] = name
+    community_levels: dict[Any, dict[Any, list[str]]] = {}
+    for level, community, names in zip(
+        community_df[level_column],
+        community_df[community_column],
+        community_df[name_column],
+        strict=True,
+    ):
+        community_levels.setdefault(level, {})[community] = names
 
     # get unique levels, sorted in ascending order
     levels = sorted(community_levels.keys())
 
     community_hierarchy = []
 
-    for idx in range(len(levels) - 1):
-        level = levels[idx]
+    for level, next_level in pairwise(levels):
         log.debug("Level: %s", level)
-        next_level = levels[idx + 1]
         current_level_communities = community_levels[level]
         next_level_communities = community_levels[next_level]
         log.debug(
@@ -56,23 +54,46 @@ def restore_community_hierarchy(
             len(current_level_communities),
         )
 
-        for current_community in current_level_communities:
-            current_entities = current_level_communities[current_community]
+        # index the communities that each entity belongs to at the current level
+        entity_communities: dict[str, set[Any]] = {}
+        for current_community, current_entities in current_level_communities.items():
+            for entity in current_entities:
+                entity_communities.setdefault(entity, set()).add(current_community)
+
+        # a next level community is a subcommunity of every current community holding all of its entities
+        subcommunities: dict[Any, list[Any]] = {}
+        for next_level_community, next_entities in next_level_communities.items():
+            for parent in _common_communities(next_entities, entity_communities):
+                subcommunities.setdefault(parent, []).append(next_level_community)
 
-            # loop through next level's communities to find all the subcommunities
+        for current_community, current_entities in current_level_communities.items():
             entities_found = 0
-            for next_level_community in next_level_communities:
+            for next_level_community in subcommunities.get(current_community, []):
                 next_entities = next_level_communities[next_level_community]
-                if set(next_entities).issubset(set(current_entities)):
-                    community_hierarchy.append({
-                        community_column: current_community,
-                        schemas.COMMUNITY_LEVEL: level,
-                        schemas.SUB_COMMUNITY: next_level_community,
-                        schemas.SUB_COMMUNITY_SIZE: len(next_entities),
-                    })
-
-                    entities_found += len(next_entities)
-                    if entities_found == len(current_entities):
-                        break
+                community_hierarchy.append({
+                    community_column: current_community,
+                    schemas.COMMUNITY_LEVEL: level,
+                    schemas.SUB_COMMUNITY: next_level_community,
+                    schemas.SUB_COMMUNITY_SIZE: len(next_entities),
+                })
+
+                entities_found += len(next_entities)
+                if entities_found == len(current_entities):
+                    break
 
     return TableContainer(table=pd.DataFrame(community_hierarchy))
+
+
+def _common_communities(
+    entities: list[str], entity_communities: dict[str, set[Any]]
+) -> set[Any]:
+    """Return the communities that contain every one of the given entities."""
+    common: set[Any] | None = None
+    for entity in entities:
+        communities = entity_communities.get(entity)
+        if not communities:
+            return set()
+        common = set(communities) if common is None else common & communities
+        if not common:
+            return common
+    return common or set()
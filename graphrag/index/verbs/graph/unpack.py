@@ -22,6 +22,7 @@ def unpack_graph(
     type: str,  # noqa A002
     copy: list[str] | None = None,
     embeddings_column: str = "embeddings",
+    membership_column: str = "community_membership",
     **kwargs,
 ) -> TableContainer:
     """
@@ -35,7 +36,11 @@ def unpack_graph(
     args:
         type: node # The type of data to unpack, one of: node, edge. node will create a node list, edge will create an edge list
         column: <column name> # The name of the column containing the graph, should be a graphml graph
+        membership_column: <column name> # Optional, the node community membership column written by cluster_graph, default: community_membership
     ```
+
+    When the membership column is present, each graph is unpacked once and expanded into one set of nodes or edges per
+    level, matching the output for graphs clustered one level per row.
     """
     if copy is None:
         copy = default_copy
@@ -44,6 +49,7 @@ def unpack_graph(
     result = []
     copy = [col for col in copy if col in input_df.columns]
     has_embeddings = embeddings_column in input_df.columns
+    has_membership = membership_column in input_df.columns
 
     for _, row in progress_iterable(input_df.iterrows(), callbacks.progress, num_total):
         # merge the original row with the unpacked graph item
@@ -54,15 +60,18 @@ def unpack_graph(
             else {}
         )
 
-        result.extend([
-            {**cleaned_row, **graph_id}
-            for graph_id in _run_unpack(
-                cast(str | nx.Graph, row[column]),
-                type,
-                embeddings,
-                kwargs,
+        graph_items = _run_unpack(
+            cast(str | nx.Graph, row[column]),
+            type,
+            embeddings,
+            kwargs,
+        )
+        if has_membership:
+            graph_items = _expand_levels(
+                graph_items, type, cast(list[dict[str, Any]], row[membership_column])
             )
-        ])
+
+        result.extend([{**cleaned_row, **graph_id} for graph_id in graph_items])
 
     output_df = pd.DataFrame(result)
     return TableContainer(table=output_df)
@@ -105,3 +114,28 @@ def _unpack_edges(graph: nx.Graph, _args: dict[str, Any]) -> list[dict[str, Any]
         }
         for source_id, target_id, edge_data in graph.edges(data=True)  # type: ignore
     ]
+
+
+def _expand_levels(
+    graph_items: list[dict[str, Any]],
+    unpack_type: str,
+    membership: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    clusters_by_level: dict[int, dict[str, str]] = {}
+    for record in membership:
+        level_clusters = clusters_by_level.setdefault(int(record["level"]), {})
+        level_clusters[record["node"]] = record["cluster"]
+
+    result = []
+    for level in sorted(clusters_by_level):
+        if unpack_type == "edges":
+            result.extend({**item, "level": level} for item in graph_items)
+            continue
+        level_clusters = clusters_by_level[level]
+        for item in graph_items:
+            cluster = level_clusters.get(item["label"])
+            if cluster is None:
+                result.append({**item, "level": level})
+            else:
+                result.append({**item, "cluster": cluster, "level": level})
+    return result
@@ -4,13 +4,14 @@
 """The Indexing Engine text package root."""
 
 from .chunk.text_chunk import chunk
-from .embed import text_embed
+from .embed import compress_embeddings, text_embed
 from .replace import replace
 from .split import text_split
 from .translate import text_translate
 
 __all__ = [
     "chunk",
+    "compress_embeddings",
     "replace",
     "text_embed",
     "text_split",
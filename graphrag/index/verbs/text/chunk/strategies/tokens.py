@@ -3,14 +3,15 @@
 
 """A module containing run and split_text_on_tokens methods definition."""
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
-import tiktoken
+import numpy as np
 from datashaper import ProgressTicker
 
 import graphrag.config.defaults as defs
 from graphrag.index.text_splitting import Tokenizer
+from graphrag.index.utils import get_encoding
 from graphrag.index.verbs.text.chunk.typing import TextChunk
 
 
@@ -21,7 +22,7 @@ def run(
     tokens_per_chunk = args.get("chunk_size", defs.CHUNK_SIZE)
     chunk_overlap = args.get("chunk_overlap", defs.CHUNK_OVERLAP)
     encoding_name = args.get("encoding_name", defs.ENCODING_MODEL)
-    enc = tiktoken.get_encoding(encoding_name)
+    enc = get_encoding(encoding_name=encoding_name)
 
     def encode(text: str) -> list[int]:
         if not isinstance(text, str):
@@ -31,6 +32,9 @@ def run(
     def decode(tokens: list[int]) -> str:
         return enc.decode(tokens)
 
+    def decode_batch(batch: list[list[int]]) -> list[str]:
+        return enc.decode_batch(batch)
+
     return split_text_on_tokens(
         input,
         Tokenizer(
@@ -38,6 +42,7 @@ def run(
             tokens_per_chunk=tokens_per_chunk,
             encode=encode,
             decode=decode,
+            decode_batch=decode_batch,
         ),
         tick,
     )
@@ -46,36 +51,56 @@ def run(
 # Adapted from - https://github.com/langchain-ai/langchain/blob/77b359edf5df0d37ef0d539f678cf64f5557cb54/libs/langchain/langchain/text_splitter.py#L471
 # So we could have better control over the chunking process
 def split_text_on_tokens(
-    texts: list[str], enc: Tokenizer, tick: ProgressTicker
-) -> list[TextChunk]:
-    """Split incoming text and return chunks."""
-    result = []
-    mapped_ids = []
+    texts: Iterable[str], enc: Tokenizer, tick: ProgressTicker
+) -> Iterator[TextChunk]:
+    """Split incoming text and yield chunks.
+
+    Documents are encoded one at a time into contiguous token and document-index arrays.
+    Every window that is complete is emitted and the consumed prefix is dropped, so only
+    the tail of the token stream is held in memory.
+    """
+    step = enc.tokens_per_chunk - enc.chunk_overlap
+    token_ids = np.empty(0, dtype=np.uint32)
+    doc_ids = np.empty(0, dtype=np.int32)
+    start_idx = 0
 
     for source_doc_idx, text in enumerate(texts):
-        encoded = enc.encode(text)
+        encoded = np.asarray(enc.encode(text), dtype=np.uint32)
         tick(1)
-        mapped_ids.append((source_doc_idx, encoded))
+        token_ids = np.concatenate((token_ids[start_idx:], encoded))
+        doc_ids = np.concatenate((
+            doc_ids[start_idx:],
+            np.full(len(encoded), source_doc_idx, dtype=np.int32),
+        ))
 
-    input_ids: list[tuple[int, int]] = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
-    ]
+        # Emit the windows that later documents can no longer extend
+        starts = np.arange(0, len(token_ids) - enc.tokens_per_chunk + 1, step)
+        yield from _decode_windows(token_ids, doc_ids, starts, enc)
+        start_idx = int(starts[-1]) + step if len(starts) > 0 else 0
+
+    # Emit the remaining, possibly partial, windows
+    starts = np.arange(start_idx, len(token_ids), step)
+    yield from _decode_windows(token_ids, doc_ids, starts, enc)
 
-    start_idx = 0
-    cur_idx = min(start_idx + enc.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
-    while start_idx < len(input_ids):
-        chunk_text = enc.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(
-            TextChunk(
-                text_chunk=chunk_text,
-                source_doc_indices=doc_indices,
-                n_tokens=len(chunk_ids),
-            )
-        )
-        start_idx += enc.tokens_per_chunk - enc.chunk_overlap
-        cur_idx = min(start_idx + enc.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
 
-    return result
+def _decode_windows(
+    token_ids: np.ndarray, doc_ids: np.ndarray, starts: np.ndarray, enc: Tokenizer
+) -> Iterator[TextChunk]:
+    """Decode the token windows beginning at each start offset."""
+    if len(starts) == 0:
+        return
+    ends = np.minimum(starts + enc.tokens_per_chunk, len(token_ids))
+    windows = [
+        token_ids[start:end].tolist() for start, end in zip(starts, ends, strict=True)
+    ]
+    texts = (
+        enc.decode_batch(windows)
+        if enc.decode_batch is not None
+        else [enc.decode(window) for window in windows]
+    )
+    for start, end, text in zip(starts, ends, texts, strict=True):
+        yield TextChunk(
+            text_chunk=text,
+            source_doc_indices=np.unique(doc_ids[start:end]).tolist(),
+            n_tokens=int(end - start),
+        )
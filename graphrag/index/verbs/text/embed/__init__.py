@@ -3,6 +3,7 @@
 
 """The Indexing Engine text embed package root."""
 
+from .compress_embeddings import compress_embeddings
 from .text_embed import TextEmbedStrategyType, text_embed
 
-__all__ = ["TextEmbedStrategyType", "text_embed"]
+__all__ = ["TextEmbedStrategyType", "compress_embeddings", "text_embed"]
@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the compress_embeddings verb definition."""
+
+import json
+import logging
+from typing import cast
+
+import numpy as np
+import pandas as pd
+from datashaper import TableContainer, VerbInput, verb
+
+from graphrag.index.storage import PipelineStorage
+from graphrag.vector_stores import EmbeddingProjection, EmbeddingProjectionType
+
+log = logging.getLogger(__name__)
+
+
+@verb(name="compress_embeddings")
+async def compress_embeddings(
+    input: VerbInput,
+    storage: PipelineStorage,
+    column: str,
+    projection_name: str,
+    projection_type: EmbeddingProjectionType | str = EmbeddingProjectionType.pca,
+    dimensions: int = 256,
+    quantize: bool = False,
+    **_kwargs,
+) -> TableContainer:
+    """
+    Reduce the dimensions of an embedding column, and optionally quantize it to int8.
+
+    The projection is fitted on the embeddings of the column and stored as `<projection_name>.json` in the
+    output storage, next to the tables, so that query embeddings can be transformed the same way
+    (see `EmbeddingProjection.transform`). Rows without an embedding are left empty.
+
+    ## Usage
+    ```yaml
+    verb: compress_embeddings
+    args:
+        column: description_embedding # The name of the column containing the embeddings
+        projection_name: entity_description_embedding_projection # The name of the stored projection
+        projection_type: pca # Optional, The reduction to use, available options are: pca, truncate, default: pca
+        dimensions: 256 # Optional, The number of dimensions to keep, default: 256
+        quantize: false # Optional, Whether to store the embeddings as int8 codes, default: false
+    ```
+    """
+    output_df = cast(pd.DataFrame, input.get_input())
+    if column not in output_df.columns:
+        log.warning(
+            "column %s is not in the table, the embeddings are not compressed", column
+        )
+        return TableContainer(table=output_df)
+
+    embedded = [
+        row
+        for row, embedding in enumerate(output_df[column])
+        if isinstance(embedding, list | np.ndarray) and len(embedding) > 0
+    ]
+    if len(embedded) == 0:
+        return TableContainer(table=output_df)
+
+    vectors = np.asarray(
+        [output_df[column].iloc[row] for row in embedded], dtype=np.float32
+    )
+    projection = EmbeddingProjection.fit(vectors, projection_type, dimensions, quantize)
+    codes = projection.encode(vectors)
+    log.info(
+        "compressed %d embeddings from %d to %d dimensions, %d to %d bytes",
+        len(embedded),
+        vectors.shape[1],
+        codes.shape[1],
+        vectors.nbytes,
+        codes.nbytes,
+    )
+
+    compressed: list[np.ndarray | None] = [None] * len(output_df)
+    for row, code in zip(embedded, codes, strict=True):
+        compressed[row] = code
+    output_df[column] = compressed
+    await storage.set(f"{projection_name}.json", json.dumps(projection.to_dict()))
+    return TableContainer(table=output_df)
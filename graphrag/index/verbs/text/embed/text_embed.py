@@ -3,11 +3,12 @@
 
 """A module containing text_embed, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
+import time
 from enum import Enum
 from typing import Any, cast
 
-import numpy as np
 import pandas as pd
 from datashaper import TableContainer, VerbCallbacks, VerbInput, verb
 
@@ -25,6 +26,10 @@ log = logging.getLogger(__name__)
 # Per Azure OpenAI Limits
 # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
 DEFAULT_EMBEDDING_BATCH_SIZE = 500
+# Number of vector store batches being embedded at the same time
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+# Rows embedded or being embedded but not yet written to the vector store
+DEFAULT_MAX_BUFFERED_ROWS = 10_000
 
 
 class TextEmbedStrategyType(str, Enum):
@@ -75,7 +80,10 @@ async def text_embed(
             max_tokens: !ENV ${GRAPHRAG_MAX_TOKENS:6000} # The max tokens to use for openai
             organization: !ENV ${GRAPHRAG_OPENAI_ORGANIZATION} # The organization to use for openai
         vector_store: # The optional configuration for the vector store
-            type: lancedb # The type of vector store to use, available options are: azure_ai_search, lancedb
+            type: lancedb # The type of vector store to use, available options are: azure_ai_search, lancedb, numpy
+            max_concurrent_batches: 4 # Optional, The number of batches embedded at the same time, default: 4
+            max_buffered_rows: 10000 # Optional, The number of embedded rows waiting to be stored before embedding pauses, default: 10000
+            index_type: ivf_pq # Optional, The vector index built once the documents are loaded (lancedb: ivf_pq or hnsw), default: None
             <...>
     ```
     """
@@ -156,6 +164,13 @@ async def _text_embed_with_vector_store(
     title_column: str = vector_store_config.get("title_column", "title")
     id_column: str = vector_store_config.get("id_column", "id")
     overwrite: bool = vector_store_config.get("overwrite", True)
+    max_concurrent_batches: int = (
+        vector_store_config.get("max_concurrent_batches")
+        or DEFAULT_MAX_CONCURRENT_BATCHES
+    )
+    max_buffered_rows: int = (
+        vector_store_config.get("max_buffered_rows") or DEFAULT_MAX_BUFFERED_ROWS
+    )
 
     if column not in output_df.columns:
         msg = f"Column {column} not found in input dataframe with columns {output_df.columns}"
@@ -174,46 +189,84 @@ async def _text_embed_with_vector_store(
         else:
             total_rows += 1
 
-    i = 0
-    starting_index = 0
-
+    # batches are embedded concurrently and written in order by a single writer. The
+    # buffer slots bound the batches held in memory, so embedding pauses while the
+    # writer is behind.
+    embedding_slots = asyncio.Semaphore(max_concurrent_batches)
+    buffer_slots = asyncio.Semaphore(max(1, max_buffered_rows // insert_batch_size))
+    pending: asyncio.Queue[asyncio.Task | None] = asyncio.Queue()
+    input_df = cast(pd.DataFrame, input.get_input())
     all_results = []
 
-    while insert_batch_size * i < input.get_input().shape[0]:
-        batch = input.get_input().iloc[
-            insert_batch_size * i : insert_batch_size * (i + 1)
-        ]
-        texts: list[str] = batch[column].to_numpy().tolist()
-        titles: list[str] = batch[title_column].to_numpy().tolist()
-        ids: list[str] = batch[id_column].to_numpy().tolist()
-        result = await strategy_exec(
-            texts,
-            callbacks,
-            cache,
-            strategy_args,
-        )
-        if store_in_table and result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
-
-        vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for id, text, title, vector in zip(ids, texts, titles, vectors, strict=True):
-            if type(vector) is np.ndarray:
-                vector = vector.tolist()
-            document = VectorStoreDocument(
-                id=id,
-                text=text,
-                vector=vector,
-                attributes={"title": title},
+    async def embed_batch(batch: pd.DataFrame):
+        async with embedding_slots:
+            texts: list[str] = batch[column].to_numpy().tolist()
+            result = await strategy_exec(texts, callbacks, cache, strategy_args)
+            return batch, texts, result
+
+    async def produce() -> None:
+        for start in range(0, input_df.shape[0], insert_batch_size):
+            await buffer_slots.acquire()
+            batch = input_df.iloc[start : start + insert_batch_size]
+            await pending.put(asyncio.create_task(embed_batch(batch)))
+        await pending.put(None)
+
+    async def write() -> int:
+        num_written = 0
+        first_batch = True
+        while (task := await pending.get()) is not None:
+            batch, texts, result = await task
+            if store_in_table and result.embeddings:
+                embeddings = [
+                    embedding
+                    for embedding in result.embeddings
+                    if embedding is not None
+                ]
+                all_results.extend(embeddings)
+
+            titles: list[str] = batch[title_column].to_numpy().tolist()
+            ids: list[str] = batch[id_column].to_numpy().tolist()
+            vectors = result.embeddings or []
+            documents: list[VectorStoreDocument] = []
+            for id, text, title, vector in zip(
+                ids, texts, titles, vectors, strict=True
+            ):
+                document = VectorStoreDocument(
+                    id=id,
+                    text=text,
+                    vector=vector,
+                    attributes={"title": title},
+                )
+                documents.append(document)
+
+            # the insert runs off the event loop so the next batches keep embedding
+            await asyncio.to_thread(
+                vector_store.load_documents, documents, overwrite and first_batch
             )
-            documents.append(document)
-
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+            first_batch = False
+            num_written += len(documents)
+            buffer_slots.release()
+        return num_written
+
+    start_time = time.time()
+    producer = asyncio.create_task(produce())
+    try:
+        num_written = await write()
+        await producer
+    finally:
+        producer.cancel()
+        while not pending.empty():
+            task = pending.get_nowait()
+            if task is not None:
+                task.cancel()
+    elapsed = time.time() - start_time
+    log.info(
+        "embedded and stored %d rows in %.2fs (%.1f rows/s)",
+        num_written,
+        elapsed,
+        num_written / elapsed if elapsed > 0 else 0.0,
+    )
+    await asyncio.to_thread(vector_store.create_index)
 
     if store_in_table:
         output_df[to] = all_results
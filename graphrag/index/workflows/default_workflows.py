@@ -58,6 +58,12 @@ from .v1.create_final_entities import (
 from .v1.create_final_entities import (
     workflow_name as create_final_entities,
 )
+from .v1.create_final_node_communities import (
+    build_steps as build_create_final_node_communities_steps,
+)
+from .v1.create_final_node_communities import (
+    workflow_name as create_final_node_communities,
+)
 from .v1.create_final_nodes import (
     build_steps as build_create_final_nodes_steps,
 )
@@ -108,6 +114,7 @@ default_workflows: WorkflowDefinitions = {
     create_final_text_units: build_create_final_text_units,
     create_final_community_reports: build_create_final_community_reports_steps,
     create_final_nodes: build_create_final_nodes_steps,
+    create_final_node_communities: build_create_final_node_communities_steps,
     create_final_relationships: build_create_final_relationships_steps,
     create_final_documents: build_create_final_documents_steps,
     create_final_covariates: build_create_final_covariates_steps,
@@ -26,6 +26,7 @@ def build_steps(
         {
             "strategy": {
                 "type": "node2vec",
+                "dimensions": config.get("embed_dimensions", 1536),
                 "num_walks": config.get("embed_num_walks", 10),
                 "walk_length": config.get("embed_walk_length", 40),
                 "window_size": config.get("embed_window_size", 2),
@@ -37,6 +38,12 @@ def build_steps(
 
     graphml_snapshot_enabled = config.get("graphml_snapshot", False) or False
     embed_graph_enabled = config.get("embed_graph_enabled", False) or False
+    emit_membership = config.get("emit_membership", False) or False
+    columns = ["level", "clustered_graph"]
+    if emit_membership:
+        columns.append("community_membership")
+    if embed_graph_enabled:
+        columns.append("embeddings")
 
     return [
         {
@@ -46,6 +53,9 @@ def build_steps(
                 "column": "entity_graph",
                 "to": "clustered_graph",
                 "level_to": "level",
+                **(
+                    {"membership_to": "community_membership"} if emit_membership else {}
+                ),
             },
             "input": ({"source": "workflow:create_summarized_entities"}),
         },
@@ -81,11 +91,7 @@ def build_steps(
             "args": {
                 # only selecting for documentation sake, so we know what is contained in
                 # this workflow
-                "columns": (
-                    ["level", "clustered_graph", "embeddings"]
-                    if embed_graph_enabled
-                    else ["level", "clustered_graph"]
-                ),
+                "columns": columns,
             },
         },
     ]
@@ -18,6 +18,7 @@ def build_steps(
     * `workflow:create_base_entity_graph`
     """
     covariates_enabled = config.get("covariates_enabled", False)
+    normalize_nodes = config.get("normalize_nodes", False)
     create_community_reports_config = config.get("create_community_reports", {})
     base_text_embed = config.get("text_embed", {})
     community_report_full_content_embed_config = config.get(
@@ -37,10 +38,25 @@ def build_steps(
         #
         # Subworkflow: Prepare Nodes
         #
+        # normalized nodes are joined back to their memberships, one row per node per community level
+        {
+            "id": "community_nodes",
+            "verb": "join",
+            "enabled": normalize_nodes,
+            "args": {"on": ["title", "title"]},
+            "input": {
+                "source": "workflow:create_final_node_communities",
+                "others": ["workflow:create_final_nodes"],
+            },
+        },
         {
             "id": "nodes",
             "verb": "prepare_community_reports_nodes",
-            "input": {"source": "workflow:create_final_nodes"},
+            "input": {
+                "source": "community_nodes"
+                if normalize_nodes
+                else "workflow:create_final_nodes"
+            },
         },
         #
         # Subworkflow: Prepare Edges
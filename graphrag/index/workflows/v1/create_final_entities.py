@@ -24,6 +24,9 @@ def build_steps(
     )
     skip_name_embedding = config.get("skip_name_embedding", False)
     skip_description_embedding = config.get("skip_description_embedding", False)
+    description_embedding_compression = config.get(
+        "description_embedding_compression", None
+    )
     is_using_vector_store = (
         entity_name_embed_config.get("strategy", {}).get("vector_store", None)
         is not None
@@ -109,6 +112,16 @@ def build_steps(
                 **entity_name_description_embed_config,
             },
         },
+        {
+            "verb": "compress_embeddings",
+            "enabled": not skip_description_embedding
+            and description_embedding_compression is not None,
+            "args": {
+                "column": "description_embedding",
+                "projection_name": "entity_description_embedding_projection",
+                **(description_embedding_compression or {}),
+            },
+        },
         {
             "verb": "drop",
             "enabled": not skip_description_embedding,
@@ -0,0 +1,26 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing build_steps method definition."""
+
+from graphrag.index.config import PipelineWorkflowConfig, PipelineWorkflowStep
+
+workflow_name = "create_final_node_communities"
+
+
+def build_steps(
+    _config: PipelineWorkflowConfig,
+) -> list[PipelineWorkflowStep]:
+    """
+    Create the final node community membership table.
+
+    ## Dependencies
+    * `workflow:create_base_entity_graph`
+    """
+    return [
+        {
+            "verb": "create_node_communities",
+            "args": {"column": "clustered_graph"},
+            "input": {"source": "workflow:create_base_entity_graph"},
+        },
+    ]
@@ -19,12 +19,10 @@ def build_steps(
     """
     snapshot_top_level_nodes = config.get("snapshot_top_level_nodes", False)
     layout_graph_enabled = config.get("layout_graph_enabled", True)
+    normalize_nodes = config.get("normalize_nodes", False)
+    emit_membership = config.get("emit_membership", False)
+    level_for_node_positions = config.get("level_for_node_positions", 0)
     _compute_top_level_node_positions = [
-        {
-            "verb": "unpack_graph",
-            "args": {"column": "positioned_graph", "type": "nodes"},
-            "input": {"source": "laid_out_entity_graph"},
-        },
         {
             "verb": "filter",
             "args": {
@@ -33,14 +31,15 @@ def build_steps(
                     {
                         "type": "value",
                         "operator": "equals",
-                        "value": config.get("level_for_node_positions", 0),
+                        "value": level_for_node_positions,
                     }
                 ],
             },
+            "input": {"source": "positioned_nodes"},
         },
         {
             "verb": "select",
-            "args": {"columns": ["id", "x", "y"]},
+            "args": {"columns": ["id", "x", "y", "size"]},
         },
         {
             "verb": "snapshot",
@@ -77,6 +76,24 @@ def build_steps(
         },
     )
     return [
+        # node positions do not depend on the level, the layout runs on a single graph
+        # and its positions are joined to the nodes of every level
+        {
+            "id": "top_level_graph",
+            "verb": "filter",
+            "enabled": not emit_membership,
+            "args": {
+                "column": "level",
+                "criteria": [
+                    {
+                        "type": "value",
+                        "operator": "equals",
+                        "value": level_for_node_positions,
+                    }
+                ],
+            },
+            "input": {"source": "workflow:create_base_entity_graph"},
+        },
         {
             "id": "laid_out_entity_graph",
             "verb": "layout_graph",
@@ -87,16 +104,22 @@ def build_steps(
                 "graph_to": "positioned_graph",
                 **layout_graph_config,
             },
-            "input": {"source": "workflow:create_base_entity_graph"},
+            "input": {
+                "source": "workflow:create_base_entity_graph"
+                if emit_membership
+                else "top_level_graph"
+            },
         },
         {
+            "id": "positioned_nodes",
             "verb": "unpack_graph",
             "args": {"column": "positioned_graph", "type": "nodes"},
         },
         {
             "id": "nodes_without_positions",
-            "verb": "drop",
-            "args": {"columns": ["x", "y"]},
+            "verb": "unpack_graph",
+            "args": {"column": "clustered_graph", "type": "nodes"},
+            "input": {"source": "workflow:create_base_entity_graph"},
         },
         *_compute_top_level_node_positions,
         {
@@ -113,4 +136,47 @@ def build_steps(
             "verb": "rename",
             "args": {"columns": {"label": "title", "cluster": "community"}},
         },
+        # positions are joined from a separate layout, restore the original column order
+        {
+            "verb": "select",
+            "args": {
+                "columns": [
+                    "level",
+                    "title",
+                    "type",
+                    "description",
+                    "source_id",
+                    "community",
+                    "degree",
+                    "human_readable_id",
+                    "id",
+                    "size",
+                    "graph_embedding",
+                    "entity_type",
+                    "top_level_node_id",
+                    "x",
+                    "y",
+                ]
+            },
+        },
+        # keep each node once, the memberships are in create_final_node_communities
+        {
+            "verb": "filter",
+            "enabled": normalize_nodes,
+            "args": {
+                "column": "level",
+                "criteria": [
+                    {
+                        "type": "value",
+                        "operator": "equals",
+                        "value": level_for_node_positions,
+                    }
+                ],
+            },
+        },
+        {
+            "verb": "drop",
+            "enabled": normalize_nodes,
+            "args": {"columns": ["level", "community"]},
+        },
     ]
@@ -22,6 +22,7 @@ def build_steps(
         "relationship_description_embed", base_text_embed
     )
     skip_description_embedding = config.get("skip_description_embedding", False)
+    normalize_nodes = config.get("normalize_nodes", False)
 
     return [
         {
@@ -61,6 +62,7 @@ def build_steps(
         {
             "id": "filtered_nodes",
             "verb": "filter",
+            "enabled": not normalize_nodes,
             "args": {
                 "column": "level",
                 "criteria": [{"type": "value", "operator": "equals", "value": 0}],
@@ -72,7 +74,10 @@ def build_steps(
             "args": {"to": "rank"},
             "input": {
                 "source": "pruned_edges",
-                "nodes": "filtered_nodes",
+                # normalized nodes are already one row per node
+                "nodes": "workflow:create_final_nodes"
+                if normalize_nodes
+                else "filtered_nodes",
             },
         },
         {
@@ -3,6 +3,7 @@
 
 """Common types for the GraphRAG knowledge model."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 TextEmbedder = Callable[[str], list[float]]
+AsyncTextEmbedder = Callable[[str], Awaitable[list[float]]]
@@ -17,7 +17,11 @@ from graphrag.index.progress import PrintProgressReporter
 from graphrag.query.input.loaders.dfs import (
     store_entity_semantic_embeddings,
 )
-from graphrag.vector_stores import VectorStoreFactory, VectorStoreType
+from graphrag.vector_stores import (
+    EmbeddingProjection,
+    VectorStoreFactory,
+    VectorStoreType,
+)
 
 from .factories import get_global_search_engine, get_local_search_engine
 from .indexer_adapters import (
@@ -73,11 +77,14 @@ def run_global_search(
     final_community_reports: pd.DataFrame = pd.read_parquet(
         data_path / "create_final_community_reports.parquet"
     )
+    final_node_communities = _read_node_communities(data_path)
 
     reports = read_indexer_reports(
-        final_community_reports, final_nodes, community_level
+        final_community_reports, final_nodes, community_level, final_node_communities
+    )
+    entities = read_indexer_entities(
+        final_nodes, final_entities, community_level, final_node_communities
     )
-    entities = read_indexer_entities(final_nodes, final_entities, community_level)
     search_engine = get_global_search_engine(
         config,
         reports=reports,
@@ -103,6 +110,7 @@ def run_local_search(
     data_path = Path(data_dir)
 
     final_nodes = pd.read_parquet(data_path / "create_final_nodes.parquet")
+    final_node_communities = _read_node_communities(data_path)
     final_community_reports = pd.read_parquet(
         data_path / "create_final_community_reports.parquet"
     )
@@ -127,7 +135,9 @@ def run_local_search(
         vector_store_type=vector_store_type,
         config_args=vector_store_args,
     )
-    entities = read_indexer_entities(final_nodes, final_entities, community_level)
+    entities = read_indexer_entities(
+        final_nodes, final_entities, community_level, final_node_communities
+    )
     store_entity_semantic_embeddings(
         entities=entities, vectorstore=description_embedding_store
     )
@@ -140,13 +150,19 @@ def run_local_search(
     search_engine = get_local_search_engine(
         config,
         reports=read_indexer_reports(
-            final_community_reports, final_nodes, community_level
+            final_community_reports,
+            final_nodes,
+            community_level,
+            final_node_communities,
         ),
         text_units=read_indexer_text_units(final_text_units),
         entities=entities,
         relationships=read_indexer_relationships(final_relationships),
         covariates={"claims": covariates},
         description_embedding_store=description_embedding_store,
+        description_embedding_projection=EmbeddingProjection.load(
+            data_path / "entity_description_embedding_projection.json"
+        ),
         response_type=response_type,
     )
 
@@ -155,6 +171,16 @@ def run_local_search(
     return result.response
 
 
+def _read_node_communities(data_path: Path) -> pd.DataFrame | None:
+    """Read the node community membership table written for normalized nodes."""
+    node_communities_path = data_path / "create_final_node_communities.parquet"
+    return (
+        pd.read_parquet(node_communities_path)
+        if node_communities_path.exists()
+        else None
+    )
+
+
 def _configure_paths_and_settings(
     data_dir: str | None, root_dir: str | None
 ) -> tuple[str, str | None, GraphRagConfig]:
@@ -11,7 +11,7 @@ import pandas as pd
 import tiktoken
 
 from graphrag.model import CommunityReport, Entity
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import iter_num_tokens, num_tokens
 
 log = logging.getLogger(__name__)
 
@@ -94,6 +94,7 @@ def build_community_context(
     all_context_text = []
     all_context_records = []
 
+    candidate_records = []
     for report in selected_reports:
         new_context = [
             report.short_id,
@@ -108,9 +109,15 @@ def build_community_context(
         )
         if include_community_rank:
             new_context.append(str(report.rank))
-        new_context_text = column_delimiter.join(new_context) + "\n"
+        candidate_records.append(new_context)
 
-        new_tokens = num_tokens(new_context_text, token_encoder)
+    candidate_texts = [
+        column_delimiter.join(record) + "\n" for record in candidate_records
+    ]
+    candidate_tokens = iter_num_tokens(candidate_texts, token_encoder)
+    for new_context, new_context_text, new_tokens in zip(
+        candidate_records, candidate_texts, candidate_tokens, strict=True
+    ):
         if current_tokens + new_tokens > max_tokens:
             # convert the current context records to pandas dataframe and sort by weight and rank if exist
             if len(current_context_records) > 1:
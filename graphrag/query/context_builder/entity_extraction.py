@@ -3,15 +3,20 @@
 
 """Orchestration Context Builders."""
 
+import asyncio
 from enum import Enum
 
 from graphrag.model import Entity, Relationship
+from graphrag.query.context_builder.entity_matcher import EntityNameMatcher
 from graphrag.query.input.retrieval.entities import (
     get_entity_by_key,
     get_entity_by_name,
 )
 from graphrag.query.llm.base import BaseTextEmbedding
-from graphrag.vector_stores import BaseVectorStore
+from graphrag.vector_stores import BaseVectorStore, VectorStoreSearchResult
+
+# Share of a query covered by entity names above which the query is not embedded
+DEFAULT_LEXICAL_COVERAGE_THRESHOLD = 0.8
 
 
 class EntityVectorStoreKey(str, Enum):
@@ -42,28 +47,159 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    entity_matcher: EntityNameMatcher | None = None,
+    lexical_coverage_threshold: float = DEFAULT_LEXICAL_COVERAGE_THRESHOLD,
+) -> list[Entity]:
+    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions.
+
+    With an entity_matcher, the entities named in the query are ranked ahead of the semantic matches, and
+    the query is not embedded when the names cover at least lexical_coverage_threshold of it.
+    """
+    search_results = None
+    lexical_entities: list[Entity] = []
+    if query != "":
+        lexical_coverage = 0.0
+        if entity_matcher is not None:
+            matches = entity_matcher.find(query)
+            lexical_entities = [match.entity for match in matches]
+            lexical_coverage = entity_matcher.coverage(query, matches)
+        if lexical_entities and lexical_coverage >= lexical_coverage_threshold:
+            search_results = []
+        else:
+            # get entities with highest semantic similarity to query
+            # oversample to account for excluded entities
+            search_results = text_embedding_vectorstore.similarity_search_by_text(
+                text=query,
+                text_embedder=lambda t: text_embedder.embed(t),
+                k=k * oversample_scaler,
+            )
+    return _select_entities(
+        search_results,
+        all_entities,
+        embedding_vectorstore_key,
+        include_entity_names,
+        exclude_entity_names,
+        k,
+        lexical_entities,
+        oversample_scaler,
+    )
+
+
+def map_queries_to_entities(
+    queries: list[str],
+    text_embedding_vectorstore: BaseVectorStore,
+    text_embedder: BaseTextEmbedding,
+    all_entities: list[Entity],
+    embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+    include_entity_names: list[str] | None = None,
+    exclude_entity_names: list[str] | None = None,
+    k: int = 10,
+    oversample_scaler: int = 2,
+) -> list[list[Entity]]:
+    """Extract the entities matching each query, searching the vectorstore once for all the queries.
+
+    The result of each query is the same as map_query_to_entities would return for it.
+    """
+    query_embeddings = [
+        text_embedder.embed(query) if query != "" else None for query in queries
+    ]
+    return _select_batch_entities(
+        query_embeddings,
+        text_embedding_vectorstore.similarity_search_by_vectors(
+            [embedding for embedding in query_embeddings if embedding],
+            k=k * oversample_scaler,
+        ),
+        all_entities,
+        embedding_vectorstore_key,
+        include_entity_names,
+        exclude_entity_names,
+        k,
+    )
+
+
+async def amap_queries_to_entities(
+    queries: list[str],
+    text_embedding_vectorstore: BaseVectorStore,
+    text_embedder: BaseTextEmbedding,
+    all_entities: list[Entity],
+    embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+    include_entity_names: list[str] | None = None,
+    exclude_entity_names: list[str] | None = None,
+    k: int = 10,
+    oversample_scaler: int = 2,
+) -> list[list[Entity]]:
+    """Extract the entities matching each query, embedding the queries concurrently."""
+    query_embeddings = await asyncio.gather(*[
+        text_embedder.aembed(query) for query in queries if query != ""
+    ])
+    embeddings = iter(query_embeddings)
+    return _select_batch_entities(
+        [next(embeddings) if query != "" else None for query in queries],
+        await text_embedding_vectorstore.asimilarity_search_by_vectors(
+            [embedding for embedding in query_embeddings if embedding],
+            k=k * oversample_scaler,
+        ),
+        all_entities,
+        embedding_vectorstore_key,
+        include_entity_names,
+        exclude_entity_names,
+        k,
+    )
+
+
+def _select_batch_entities(
+    query_embeddings: list[list[float] | None],
+    batch_results: list[list[VectorStoreSearchResult]],
+    all_entities: list[Entity],
+    embedding_vectorstore_key: str,
+    include_entity_names: list[str] | None,
+    exclude_entity_names: list[str] | None,
+    k: int,
+) -> list[list[Entity]]:
+    """Select the entities of each query from the results of the queries that were embedded."""
+    results = iter(batch_results)
+    return [
+        _select_entities(
+            next(results) if embedding else [] if embedding is not None else None,
+            all_entities,
+            embedding_vectorstore_key,
+            include_entity_names,
+            exclude_entity_names,
+            k,
+        )
+        for embedding in query_embeddings
+    ]
+
+
+def _select_entities(
+    search_results: list[VectorStoreSearchResult] | None,
+    all_entities: list[Entity],
+    embedding_vectorstore_key: str,
+    include_entity_names: list[str] | None,
+    exclude_entity_names: list[str] | None,
+    k: int,
+    lexical_entities: list[Entity] | None = None,
+    oversample_scaler: int = 1,
 ) -> list[Entity]:
-    """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    """Turn the search results of a query into entities, the top ranked entities without a query.
+
+    Entities matched by name come first, followed by the search results not among them, up to the
+    k * oversample_scaler entities a search alone returns.
+    """
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
         exclude_entity_names = []
-    matched_entities = []
-    if query != "":
-        # get entities with highest semantic similarity to query
-        # oversample to account for excluded entities
-        search_results = text_embedding_vectorstore.similarity_search_by_text(
-            text=query,
-            text_embedder=lambda t: text_embedder.embed(t),
-            k=k * oversample_scaler,
-        )
+    matched_entities = list(lexical_entities or [])
+    if search_results is not None:
+        lexical_ids = {entity.id for entity in matched_entities}
         for result in search_results:
             matched = get_entity_by_key(
                 entities=all_entities,
                 key=embedding_vectorstore_key,
                 value=result.document.id,
             )
-            if matched:
+            if matched and matched.id not in lexical_ids:
                 matched_entities.append(matched)
     else:
         all_entities.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
@@ -77,6 +213,10 @@ def map_query_to_entities(
             if entity.title not in exclude_entity_names
         ]
 
+    # entities matched by name take the place of the weakest search results
+    if lexical_entities:
+        matched_entities = matched_entities[: k * oversample_scaler]
+
     # add entities in the include_entity list
     included_entities = []
     for entity_name in include_entity_names:
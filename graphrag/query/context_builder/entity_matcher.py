@@ -0,0 +1,177 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Lexical matching of entity names in queries."""
+
+import unicodedata
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from graphrag.model import Entity
+
+# Names shorter than this, once normalized, are too ambiguous to match
+DEFAULT_MIN_NAME_LENGTH = 3
+# Attribute holding the alternative names of an entity
+ALIASES_ATTRIBUTE = "aliases"
+
+
+def fold_text(text: str) -> str:
+    """Casefold text and strip its diacritics, e.g. 'Sở Giao Dịch' becomes 'so giao dich'.
+
+    Punctuation is replaced by spaces and whitespace collapsed, so that matches can be
+    restricted to whole words.
+    """
+    decomposed = unicodedata.normalize("NFD", text.casefold().replace("đ", "d"))
+    characters = [
+        character if character.isalnum() else " "
+        for character in decomposed
+        if not unicodedata.combining(character)
+    ]
+    return " ".join("".join(characters).split())
+
+
+def _casefold_text(text: str) -> str:
+    """Casefold text keeping its diacritics, with the same word splitting as fold_text."""
+    composed = unicodedata.normalize("NFC", text.casefold())
+    return " ".join(
+        "".join(
+            character if character.isalnum() else " " for character in composed
+        ).split()
+    )
+
+
+@dataclass
+class EntityMatch:
+    """An entity name found in a query."""
+
+    entity: Entity
+    name: str
+    """The entity title or alias that was matched."""
+    start: int
+    """The start of the match in the folded query (see fold_text)."""
+    end: int
+    """The end of the match in the folded query (see fold_text)."""
+    exact: bool
+    """Whether the name also appears in the query with the same diacritics."""
+
+
+class EntityNameMatcher:
+    """An Aho-Corasick automaton over the folded titles and aliases of entities.
+
+    The automaton is built once for an index. A query is scanned in a single pass and
+    every whole-word occurrence of a name is found whatever its case, punctuation or
+    Vietnamese diacritics. Overlapping matches are resolved in favour of exact spellings,
+    then of longer names.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[Entity],
+        min_name_length: int = DEFAULT_MIN_NAME_LENGTH,
+    ):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[str]] = [[]]
+        self._entities_by_name: dict[str, list[tuple[Entity, str]]] = {}
+
+        for entity in entities:
+            for name in _entity_names(entity):
+                folded = fold_text(name)
+                if len(folded) < min_name_length:
+                    continue
+                named_entities = self._entities_by_name.setdefault(folded, [])
+                if not named_entities:
+                    self._add_pattern(folded)
+                if all(other.id != entity.id for other, _ in named_entities):
+                    named_entities.append((entity, name))
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str) -> None:
+        state = 0
+        # pad with spaces so that only whole words match
+        for character in f" {pattern} ":
+            next_state = self._goto[state].get(character)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][character] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and character not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(character, 0)
+                self._outputs[next_state] = (
+                    self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                )
+
+    def find(self, query: str) -> list[EntityMatch]:
+        """Find the entity names in a query, best matches first."""
+        folded_query = fold_text(query)
+        casefolded_query = f" {_casefold_text(query)} "
+        candidates: list[EntityMatch] = []
+        state = 0
+        for position, character in enumerate(f" {folded_query} "):
+            while state and character not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(character, 0)
+            for pattern in self._outputs[state]:
+                # the padded pattern ends at this position of the padded query
+                start = position - len(pattern) - 1
+                candidates.extend(
+                    EntityMatch(
+                        entity=entity,
+                        name=name,
+                        start=start,
+                        end=start + len(pattern),
+                        exact=f" {_casefold_text(name)} " in casefolded_query,
+                    )
+                    for entity, name in self._entities_by_name[pattern]
+                )
+
+        # keep the best of overlapping matches, entities sharing a name are all kept
+        candidates.sort(key=lambda match: (not match.exact, match.start - match.end))
+        matches: list[EntityMatch] = []
+        for match in candidates:
+            if any(
+                match.start < other.end
+                and other.start < match.end
+                and (match.start, match.end) != (other.start, other.end)
+                for other in matches
+            ) or any(match.entity.id == other.entity.id for other in matches):
+                continue
+            matches.append(match)
+        return matches
+
+    def coverage(self, query: str, matches: list[EntityMatch]) -> float:
+        """Get the share of the folded query, spaces aside, covered by the matches."""
+        folded_query = fold_text(query)
+        covered = {
+            position
+            for match in matches
+            for position in range(match.start, match.end)
+            if folded_query[position] != " "
+        }
+        length = len(folded_query.replace(" ", ""))
+        return len(covered) / length if length else 0.0
+
+
+def _entity_names(entity: Entity) -> list[str]:
+    """Get the title and aliases of an entity."""
+    names = [entity.title] if entity.title else []
+    aliases = (entity.attributes or {}).get(ALIASES_ATTRIBUTE)
+    if isinstance(aliases, str):
+        aliases = aliases.split(",")
+    if aliases:
+        names.extend(str(alias) for alias in aliases if alias)
+    return names
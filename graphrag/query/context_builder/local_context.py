@@ -22,7 +22,7 @@ from graphrag.query.input.retrieval.relationships import (
     get_out_network_relationships,
     to_relationship_dataframe,
 )
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import iter_num_tokens, num_tokens
 
 
 def build_entity_context(
@@ -53,6 +53,7 @@ def build_entity_context(
     current_tokens = num_tokens(current_context_text, token_encoder)
 
     all_context_records = [header]
+    candidate_records = []
     for entity in selected_entities:
         new_context = [
             entity.short_id if entity.short_id else "",
@@ -68,8 +69,15 @@ def build_entity_context(
                 else ""
             )
             new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
+        candidate_records.append(new_context)
+
+    candidate_texts = [
+        column_delimiter.join(record) + "\n" for record in candidate_records
+    ]
+    candidate_tokens = iter_num_tokens(candidate_texts, token_encoder)
+    for new_context, new_context_text, new_tokens in zip(
+        candidate_records, candidate_texts, candidate_tokens, strict=True
+    ):
         if current_tokens + new_tokens > max_tokens:
             break
         current_context_text += new_context_text
@@ -119,6 +127,7 @@ def build_covariates_context(
             cov for cov in covariates if cov.subject_id == entity.title
         ])
 
+    candidate_records = []
     for covariate in selected_covariates:
         new_context = [
             covariate.short_id if covariate.short_id else "",
@@ -131,9 +140,15 @@ def build_covariates_context(
                 else ""
             )
             new_context.append(field_value)
+        candidate_records.append(new_context)
 
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
+    candidate_texts = [
+        column_delimiter.join(record) + "\n" for record in candidate_records
+    ]
+    candidate_tokens = iter_num_tokens(candidate_texts, token_encoder)
+    for new_context, new_context_text, new_tokens in zip(
+        candidate_records, candidate_texts, candidate_tokens, strict=True
+    ):
         if current_tokens + new_tokens > max_tokens:
             break
         current_context_text += new_context_text
@@ -189,6 +204,7 @@ def build_relationship_context(
     current_tokens = num_tokens(current_context_text, token_encoder)
 
     all_context_records = [header]
+    candidate_records = []
     for rel in selected_relationships:
         new_context = [
             rel.short_id if rel.short_id else "",
@@ -205,8 +221,15 @@ def build_relationship_context(
                 else ""
             )
             new_context.append(field_value)
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
+        candidate_records.append(new_context)
+
+    candidate_texts = [
+        column_delimiter.join(record) + "\n" for record in candidate_records
+    ]
+    candidate_tokens = iter_num_tokens(candidate_texts, token_encoder)
+    for new_context, new_context_text, new_tokens in zip(
+        candidate_records, candidate_texts, candidate_tokens, strict=True
+    ):
         if current_tokens + new_tokens > max_tokens:
             break
         current_context_text += new_context_text
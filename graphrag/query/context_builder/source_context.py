@@ -10,7 +10,7 @@ import pandas as pd
 import tiktoken
 
 from graphrag.model import Entity, Relationship, TextUnit
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.query.llm.text_utils import iter_num_tokens, num_tokens
 
 """
 Contain util functions to build text unit context for the search's system prompt
@@ -49,8 +49,8 @@ def build_text_unit_context(
     current_tokens = num_tokens(current_context_text, token_encoder)
     all_context_records = [header]
 
-    for unit in text_units:
-        new_context = [
+    candidate_records = [
+        [
             unit.short_id,
             unit.text,
             *[
@@ -58,9 +58,16 @@ def build_text_unit_context(
                 for field in attribute_cols
             ],
         ]
-        new_context_text = column_delimiter.join(new_context) + "\n"
-        new_tokens = num_tokens(new_context_text, token_encoder)
-
+        for unit in text_units
+    ]
+    candidate_texts = [
+        column_delimiter.join(record) + "\n" for record in candidate_records
+    ]
+    candidate_tokens = iter_num_tokens(candidate_texts, token_encoder)
+
+    for new_context, new_context_text, new_tokens in zip(
+        candidate_records, candidate_texts, candidate_tokens, strict=True
+    ):
         if current_tokens + new_tokens > max_tokens:
             break
 
@@ -3,6 +3,8 @@
 
 """Query Factory methods to support CLI."""
 
+from pathlib import Path
+
 import tiktoken
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
@@ -18,9 +20,12 @@ from graphrag.model import (
     TextUnit,
 )
 from graphrag.query.context_builder.entity_extraction import EntityVectorStoreKey
+from graphrag.query.context_builder.entity_matcher import EntityNameMatcher
+from graphrag.query.llm.embedding_cache import QueryEmbeddingCache
 from graphrag.query.llm.oai.chat_openai import ChatOpenAI
 from graphrag.query.llm.oai.embedding import OpenAIEmbedding
 from graphrag.query.llm.oai.typing import OpenaiApiType
+from graphrag.query.llm.projection import ProjectedTextEmbedding
 from graphrag.query.structured_search.global_search.community_context import (
     GlobalCommunityContext,
 )
@@ -29,7 +34,7 @@ from graphrag.query.structured_search.local_search.mixed_context import (
     LocalSearchMixedContext,
 )
 from graphrag.query.structured_search.local_search.search import LocalSearch
-from graphrag.vector_stores import BaseVectorStore
+from graphrag.vector_stores import BaseVectorStore, EmbeddingProjection
 
 
 def get_llm(config: GraphRagConfig) -> ChatOpenAI:
@@ -96,6 +101,14 @@ def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
         deployment_name=config.embeddings.llm.deployment_name,
         api_version=config.embeddings.llm.api_version,
         max_retries=config.embeddings.llm.max_retries,
+        cache=QueryEmbeddingCache(
+            max_entries=config.embeddings.query_cache_max_entries,
+            persist_dir=(
+                Path(config.root_dir) / config.embeddings.query_cache_dir
+                if config.embeddings.query_cache_dir
+                else None
+            ),
+        ),
     )
 
 
@@ -108,10 +121,15 @@ def get_local_search_engine(
     covariates: dict[str, list[Covariate]],
     response_type: str,
     description_embedding_store: BaseVectorStore,
+    description_embedding_projection: EmbeddingProjection | None = None,
 ) -> LocalSearch:
     """Create a local search engine based on data + configuration."""
     llm = get_llm(config)
     text_embedder = get_text_embedder(config)
+    if description_embedding_projection is not None:
+        text_embedder = ProjectedTextEmbedding(
+            text_embedder, description_embedding_projection
+        )
     token_encoder = tiktoken.get_encoding(config.encoding_model)
 
     ls_config = config.local_search
@@ -128,6 +146,7 @@ def get_local_search_engine(
             embedding_vectorstore_key=EntityVectorStoreKey.ID,  # if the vectorstore uses entity title as ids, set this to EntityVectorStoreKey.TITLE
             text_embedder=text_embedder,
             token_encoder=token_encoder,
+            entity_matcher=EntityNameMatcher(entities),
         ),
         token_encoder=token_encoder,
         llm_params={
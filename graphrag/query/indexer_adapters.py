@@ -63,13 +63,22 @@ def read_indexer_reports(
     final_community_reports: pd.DataFrame,
     final_nodes: pd.DataFrame,
     community_level: int,
+    final_node_communities: pd.DataFrame | None = None,
 ) -> list[CommunityReport]:
-    """Read in the Community Reports from the raw indexing outputs."""
+    """Read in the Community Reports from the raw indexing outputs.
+
+    Pass `final_node_communities` when the nodes were indexed with `normalize_nodes`.
+    """
     report_df = final_community_reports
-    entity_df = final_nodes
-    entity_df = _filter_under_community_level(entity_df, community_level)
-    entity_df["community"] = entity_df["community"].fillna(-1)
-    entity_df["community"] = entity_df["community"].astype(int)
+    if final_node_communities is not None:
+        entity_df = _max_node_communities(
+            final_nodes, final_node_communities, community_level
+        )
+    else:
+        entity_df = final_nodes
+        entity_df = _filter_under_community_level(entity_df, community_level)
+        entity_df["community"] = entity_df["community"].fillna(-1)
+        entity_df["community"] = entity_df["community"].astype(int)
 
     entity_df = entity_df.groupby(["title"]).agg({"community": "max"}).reset_index()
     entity_df["community"] = entity_df["community"].astype(str)
@@ -91,12 +100,21 @@ def read_indexer_entities(
     final_nodes: pd.DataFrame,
     final_entities: pd.DataFrame,
     community_level: int,
+    final_node_communities: pd.DataFrame | None = None,
 ) -> list[Entity]:
-    """Read in the Entities from the raw indexing outputs."""
+    """Read in the Entities from the raw indexing outputs.
+
+    Pass `final_node_communities` when the nodes were indexed with `normalize_nodes`.
+    """
     entity_df = final_nodes
     entity_embedding_df = final_entities
 
-    entity_df = _filter_under_community_level(entity_df, community_level)
+    if final_node_communities is not None:
+        entity_df = _max_node_communities(
+            entity_df, final_node_communities, community_level
+        )
+    else:
+        entity_df = _filter_under_community_level(entity_df, community_level)
     entity_df = cast(pd.DataFrame, entity_df[["title", "degree", "community"]]).rename(
         columns={"title": "name", "degree": "rank"}
     )
@@ -139,3 +157,23 @@ def _filter_under_community_level(
         pd.DataFrame,
         df[df.level <= community_level],
     )
+
+
+def _max_node_communities(
+    final_nodes: pd.DataFrame,
+    final_node_communities: pd.DataFrame,
+    community_level: int,
+) -> pd.DataFrame:
+    """Attach each node's deepest community up to the level, -1 when it has none."""
+    membership_df = _filter_under_community_level(
+        final_node_communities, community_level
+    )
+    max_communities = cast(
+        pd.Series,
+        membership_df["community"].astype(int).groupby(membership_df["title"]).max(),
+    )
+    entity_df = cast(pd.DataFrame, final_nodes[["title", "degree"]]).copy()
+    entity_df["community"] = (
+        cast(pd.Series, entity_df["title"]).map(max_communities).fillna(-1).astype(int)
+    )
+    return entity_df
@@ -89,6 +89,7 @@ def store_entity_semantic_embeddings(
         for entity in entities
     ]
     vectorstore.load_documents(documents=documents)
+    vectorstore.create_index()
     return vectorstore
 
 
@@ -111,6 +112,7 @@ def store_entity_behavior_embeddings(
         for entity in entities
     ]
     vectorstore.load_documents(documents=documents)
+    vectorstore.create_index()
     return vectorstore
 
 
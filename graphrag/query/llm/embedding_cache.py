@@ -0,0 +1,140 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A bounded cache of query embeddings, optionally persisted to a directory."""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+# Number of query embeddings kept in memory
+DEFAULT_QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """Normalize a query so that trivially different spellings share an embedding."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip().casefold()
+
+
+class QueryEmbeddingCache:
+    """A thread-safe LRU cache of query embeddings keyed by normalized text and model.
+
+    One cache can be shared by every embedder of a process (local search, hybrid search,
+    evaluation runs) so that repeated questions are embedded once. With a persist_dir,
+    each embedding is also written to `<persist_dir>/<key>.json` and read back after a
+    memory miss, so the cache survives restarts.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_QUERY_EMBEDDING_CACHE_SIZE,
+        persist_dir: str | Path | None = None,
+    ):
+        self.max_entries = max_entries
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, model: str, **kwargs: Any) -> str:
+        """Get the cache key of a query embedded by a model with the request arguments."""
+        key_data = {"text": normalize_query(text), "model": model, **kwargs}
+        return hashlib.md5(
+            json.dumps(key_data, sort_keys=True, default=str).encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    def get(self, key: str) -> list[float] | None:
+        """Get a cached embedding, or None on a miss."""
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(embedding)
+
+        embedding = self._read(key)
+        with self._lock:
+            if embedding is None:
+                self.misses += 1
+                return None
+            self.persistent_hits += 1
+            self._remember(key, embedding)
+        return list(embedding)
+
+    def set(self, key: str, embedding: list[float]) -> None:
+        """Cache an embedding, evicting the least recently used ones past the bound."""
+        if not embedding:
+            return
+        with self._lock:
+            self._remember(key, list(embedding))
+        self._write(key, embedding)
+
+    def clear(self) -> None:
+        """Clear the in-memory entries and the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.persistent_hits = self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups served from memory or the persisted cache."""
+        lookups = self.hits + self.persistent_hits + self.misses
+        return (self.hits + self.persistent_hits) / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Get the cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def _remember(self, key: str, embedding: list[float]) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read(self, key: str) -> list[float] | None:
+        if self.persist_dir is None:
+            return None
+        path = self.persist_dir / f"{key}.json"
+        try:
+            with path.open(encoding="utf-8") as cache_file:
+                return json.load(cache_file)["result"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError):
+            log.warning("ignoring unreadable query embedding cache entry %s", path)
+            return None
+
+    def _write(self, key: str, embedding: list[float]) -> None:
+        if self.persist_dir is None:
+            return
+        try:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+            path = self.persist_dir / f"{key}.json"
+            tmp_path = self.persist_dir / f"{key}.{threading.get_ident()}.tmp"
+            with tmp_path.open("w", encoding="utf-8") as cache_file:
+                json.dump({"result": list(embedding)}, cache_file)
+            tmp_path.replace(path)
+        except OSError:
+            log.warning("failed to persist query embedding cache entry %s", key)
@@ -19,14 +19,18 @@ from tenacity import (
 )
 
 from graphrag.query.llm.base import BaseTextEmbedding
+from graphrag.query.llm.embedding_cache import QueryEmbeddingCache
 from graphrag.query.llm.oai.base import OpenAILLMImpl
 from graphrag.query.llm.oai.typing import (
     OPENAI_RETRY_ERROR_TYPES,
     OpenaiApiType,
 )
-from graphrag.query.llm.text_utils import chunk_text
+from graphrag.query.llm.text_utils import batched, chunk_text
 from graphrag.query.progress import StatusReporter
 
+# Number of chunks of a long text embedded in a single request
+DEFAULT_MAX_BATCH_SIZE = 16
+
 
 class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
     """Wrapper for OpenAI Embedding models."""
@@ -43,10 +47,12 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         organization: str | None = None,
         encoding_name: str = "cl100k_base",
         max_tokens: int = 8191,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
         max_retries: int = 10,
         request_timeout: float = 180.0,
         retry_error_types: tuple[type[BaseException]] = OPENAI_RETRY_ERROR_TYPES,  # type: ignore
         reporter: StatusReporter | None = None,
+        cache: QueryEmbeddingCache | None = None,
     ):
         OpenAILLMImpl.__init__(
             self=self,
@@ -65,26 +71,48 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         self.model = model
         self.encoding_name = encoding_name
         self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
         self.token_encoder = tiktoken.get_encoding(self.encoding_name)
         self.retry_error_types = retry_error_types
+        # pass the same cache to several embedders to share it,
+        # max_entries=0 disables it unless it is persisted
+        self.cache = cache if cache is not None else QueryEmbeddingCache()
 
     def embed(self, text: str, **kwargs: Any) -> list[float]:
         """
         Embed text using OpenAI Embedding's sync function.
 
-        For text longer than max_tokens, chunk texts into max_tokens, embed each chunk, then combine using weighted average.
+        For text longer than max_tokens, chunk texts into max_tokens, embed the chunks in requests of up to max_batch_size chunks, then combine using weighted average.
         Please refer to: https://github.com/openai/openai-cookbook/blob/main/examples/Embedding_long_inputs.ipynb
+        Embeddings are cached by normalized text, model and request arguments.
         """
-        token_chunks = chunk_text(
-            text=text, token_encoder=self.token_encoder, max_tokens=self.max_tokens
-        )
-        chunk_embeddings = []
-        chunk_lens = []
-        for chunk in token_chunks:
+        cache_key = self.cache.key(text, self.model, **kwargs)
+        embedding = self.cache.get(cache_key)
+        if embedding is None:
+            embedding = self._embed(text, **kwargs)
+            self.cache.set(cache_key, embedding)
+        return embedding
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        """
+        Embed text using OpenAI Embedding's async function.
+
+        For text longer than max_tokens, chunk texts into max_tokens, embed the chunks in concurrent requests of up to max_batch_size chunks, then combine using weighted average.
+        Embeddings are cached by normalized text, model and request arguments.
+        """
+        cache_key = self.cache.key(text, self.model, **kwargs)
+        embedding = self.cache.get(cache_key)
+        if embedding is None:
+            embedding = await self._aembed(text, **kwargs)
+            self.cache.set(cache_key, embedding)
+        return embedding
+
+    def _embed(self, text: str, **kwargs: Any) -> list[float]:
+        chunk_batches = self._chunk_batches(text)
+        embedding_results = []
+        for chunk_batch in chunk_batches:
             try:
-                embedding, chunk_len = self._embed_with_retry(chunk, **kwargs)
-                chunk_embeddings.append(embedding)
-                chunk_lens.append(chunk_len)
+                embedding_results.extend(self._embed_with_retry(chunk_batch, **kwargs))
             # TODO: catch a more specific exception
             except Exception as e:  # noqa BLE001
                 self._reporter.error(
@@ -93,24 +121,29 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
                 )
 
                 continue
-        chunk_embeddings = np.average(chunk_embeddings, axis=0, weights=chunk_lens)
-        chunk_embeddings = chunk_embeddings / np.linalg.norm(chunk_embeddings)
-        return chunk_embeddings.tolist()
+        return self._combine_chunk_embeddings(embedding_results)
 
-    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
-        """
-        Embed text using OpenAI Embedding's async function.
+    async def _aembed(self, text: str, **kwargs: Any) -> list[float]:
+        chunk_batches = self._chunk_batches(text)
+        batch_results = await asyncio.gather(*[
+            self._aembed_with_retry(chunk_batch, **kwargs)
+            for chunk_batch in chunk_batches
+        ])
+        return self._combine_chunk_embeddings([
+            result for batch_result in batch_results for result in batch_result
+        ])
 
-        For text longer than max_tokens, chunk texts into max_tokens, embed each chunk, then combine using weighted average.
-        """
+    def _chunk_batches(self, text: str) -> list[tuple[tuple[int, ...], ...]]:
+        """Split text into max_tokens chunks, grouped by max_batch_size per request."""
         token_chunks = chunk_text(
             text=text, token_encoder=self.token_encoder, max_tokens=self.max_tokens
         )
-        chunk_embeddings = []
-        chunk_lens = []
-        embedding_results = await asyncio.gather(*[
-            self._aembed_with_retry(chunk, **kwargs) for chunk in token_chunks
-        ])
+        return list(batched(token_chunks, self.max_batch_size))
+
+    def _combine_chunk_embeddings(
+        self, embedding_results: list[tuple[list[float], int]]
+    ) -> list[float]:
+        """Average the chunk embeddings weighted by their lengths, then normalize."""
         embedding_results = [result for result in embedding_results if result[0]]
         chunk_embeddings = [result[0] for result in embedding_results]
         chunk_lens = [result[1] for result in embedding_results]
@@ -119,8 +152,8 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         return chunk_embeddings.tolist()
 
     def _embed_with_retry(
-        self, text: str | tuple, **kwargs: Any
-    ) -> tuple[list[float], int]:
+        self, chunks: tuple[tuple[int, ...], ...], **kwargs: Any
+    ) -> list[tuple[list[float], int]]:
         try:
             retryer = Retrying(
                 stop=stop_after_attempt(self.max_retries),
@@ -130,30 +163,25 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
             )
             for attempt in retryer:
                 with attempt:
-                    embedding = (
-                        self.sync_client.embeddings.create(  # type: ignore
-                            input=text,
-                            model=self.model,
-                            **kwargs,  # type: ignore
-                        )
-                        .data[0]
-                        .embedding
-                        or []
+                    response = self.sync_client.embeddings.create(  # type: ignore
+                        input=[list(chunk) for chunk in chunks],
+                        model=self.model,
+                        **kwargs,  # type: ignore
                     )
-                    return (embedding, len(text))
+                    return _chunk_results(response.data, chunks)
         except RetryError as e:
             self._reporter.error(
                 message="Error at embed_with_retry()",
                 details={self.__class__.__name__: str(e)},
             )
-            return ([], 0)
+            return []
         else:
             # TODO: why not just throw in this case?
-            return ([], 0)
+            return []
 
     async def _aembed_with_retry(
-        self, text: str | tuple, **kwargs: Any
-    ) -> tuple[list[float], int]:
+        self, chunks: tuple[tuple[int, ...], ...], **kwargs: Any
+    ) -> list[tuple[list[float], int]]:
         try:
             retryer = AsyncRetrying(
                 stop=stop_after_attempt(self.max_retries),
@@ -163,20 +191,31 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
             )
             async for attempt in retryer:
                 with attempt:
-                    embedding = (
-                        await self.async_client.embeddings.create(  # type: ignore
-                            input=text,
-                            model=self.model,
-                            **kwargs,  # type: ignore
-                        )
-                    ).data[0].embedding or []
-                    return (embedding, len(text))
+                    response = await self.async_client.embeddings.create(  # type: ignore
+                        input=[list(chunk) for chunk in chunks],
+                        model=self.model,
+                        **kwargs,  # type: ignore
+                    )
+                    return _chunk_results(response.data, chunks)
         except RetryError as e:
             self._reporter.error(
                 message="Error at embed_with_retry()",
                 details={self.__class__.__name__: str(e)},
             )
-            return ([], 0)
+            return []
         else:
             # TODO: why not just throw in this case?
-            return ([], 0)
+            return []
+
+
+def _chunk_results(
+    data: list[Any], chunks: tuple[tuple[int, ...], ...]
+) -> list[tuple[list[float], int]]:
+    """Pair the embeddings of a batched request with their chunk lengths."""
+    embeddings = [
+        item.embedding or [] for item in sorted(data, key=lambda item: item.index)
+    ]
+    return [
+        (embedding, len(chunk))
+        for embedding, chunk in zip(embeddings, chunks, strict=True)
+    ]
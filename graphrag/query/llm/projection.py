@@ -0,0 +1,34 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Text embedding wrapper matching query embeddings to compressed index embeddings."""
+
+from typing import Any
+
+import numpy as np
+
+from graphrag.query.llm.base import BaseTextEmbedding
+from graphrag.vector_stores import EmbeddingProjection
+
+
+class ProjectedTextEmbedding(BaseTextEmbedding):
+    """Apply the projection fitted on the indexed embeddings to the embedded text."""
+
+    def __init__(
+        self, text_embedder: BaseTextEmbedding, projection: EmbeddingProjection
+    ):
+        self.text_embedder = text_embedder
+        self.projection = projection
+
+    def embed(self, text: str, **kwargs: Any) -> list[float]:
+        """Embed a text string into the space of the indexed embeddings."""
+        return self._transform(self.text_embedder.embed(text, **kwargs))
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        """Embed a text string into the space of the indexed embeddings asynchronously."""
+        return self._transform(await self.text_embedder.aembed(text, **kwargs))
+
+    def _transform(self, embedding: list[float]) -> list[float]:
+        if not embedding:
+            return embedding
+        return self.projection.transform(np.asarray([embedding]))[0].tolist()
@@ -3,17 +3,43 @@
 
 """Text Utilities for LLM."""
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from itertools import islice
 
 import tiktoken
 
+from graphrag.utils.tokens import (
+    ENCODE_BATCH_MIN_SIZE,
+    count_tokens,
+    count_tokens_batch,
+    get_encoding,
+)
+
 
 def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
     """Return the number of tokens in the given text."""
-    if token_encoder is None:
-        token_encoder = tiktoken.get_encoding("cl100k_base")
-    return len(token_encoder.encode(text))  # type: ignore
+    return count_tokens(text, token_encoder or get_encoding())
+
+
+def num_tokens_batch(
+    texts: list[str], token_encoder: tiktoken.Encoding | None = None
+) -> list[int]:
+    """Return the number of tokens in each of the given texts."""
+    return count_tokens_batch(texts, token_encoder or get_encoding())
+
+
+def iter_num_tokens(
+    texts: Iterable[str],
+    token_encoder: tiktoken.Encoding | None = None,
+    batch_size: int = ENCODE_BATCH_MIN_SIZE,
+) -> Iterator[int]:
+    """Yield the number of tokens in each of the given texts.
+
+    Texts are counted a batch at a time, so a consumer that stops at a token budget
+    only pays for the texts up to the end of the current batch.
+    """
+    for batch in batched(iter(texts), batch_size):
+        yield from num_tokens_batch(list(batch), token_encoder)
 
 
 def batched(iterable: Iterator, n: int):
@@ -35,8 +61,7 @@ def chunk_text(
     text: str, max_tokens: int, token_encoder: tiktoken.Encoding | None = None
 ):
     """Chunk text by token length."""
-    if token_encoder is None:
-        token_encoder = tiktoken.get_encoding("cl100k_base")
-    tokens = token_encoder.encode(text)  # type: ignore
+    token_encoder = token_encoder or get_encoding()
+    tokens = token_encoder.encode(text)
     chunk_iterator = batched(iter(tokens), max_tokens)
     yield from chunk_iterator
@@ -22,9 +22,11 @@ from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
 from graphrag.query.context_builder.entity_extraction import (
+    DEFAULT_LEXICAL_COVERAGE_THRESHOLD,
     EntityVectorStoreKey,
     map_query_to_entities,
 )
+from graphrag.query.context_builder.entity_matcher import EntityNameMatcher
 from graphrag.query.context_builder.local_context import (
     build_covariates_context,
     build_entity_context,
@@ -61,6 +63,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         covariates: dict[str, list[Covariate]] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
+        entity_matcher: EntityNameMatcher | None = None,
     ):
         if community_reports is None:
             community_reports = []
@@ -83,6 +86,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         self.text_embedder = text_embedder
         self.token_encoder = token_encoder
         self.embedding_vectorstore_key = embedding_vectorstore_key
+        self.entity_matcher = entity_matcher
 
     def filter_by_entity_keys(self, entity_keys: list[int] | list[str]):
         """Filter entity text embeddings by entity keys."""
@@ -111,6 +115,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         min_community_rank: int = 0,
         community_context_name: str = "Reports",
         column_delimiter: str = "|",
+        lexical_coverage_threshold: float = DEFAULT_LEXICAL_COVERAGE_THRESHOLD,
         **kwargs: dict[str, Any],
     ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
         """
@@ -146,6 +151,8 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            entity_matcher=self.entity_matcher,
+            lexical_coverage_threshold=lexical_coverage_threshold,
         )
 
         # build context
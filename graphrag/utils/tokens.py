@@ -0,0 +1,80 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Utilities for working with tokens."""
+
+import logging
+from collections.abc import Iterable
+from functools import cache, lru_cache
+
+import tiktoken
+
+DEFAULT_ENCODING_NAME = "cl100k_base"
+# Number of distinct strings whose token counts are memoized
+TOKEN_COUNT_CACHE_SIZE = 16_384
+# Strings longer than this are counted but not memoized
+TOKEN_COUNT_CACHE_MAX_LENGTH = 4_096
+# Below this many strings, batch encoding is not worth a thread pool
+ENCODE_BATCH_MIN_SIZE = 64
+log = logging.getLogger(__name__)
+
+
+@cache
+def get_encoding(
+    model: str | None = None, encoding_name: str | None = None
+) -> tiktoken.Encoding:
+    """Return the process-wide encoder for a model or encoding name."""
+    if model is not None:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            msg = f"Failed to get encoding for {model} when getting num_tokens_from_string. Fall back to default encoding {DEFAULT_ENCODING_NAME}"
+            log.warning(msg)
+            return get_encoding(encoding_name=DEFAULT_ENCODING_NAME)
+    return tiktoken.get_encoding(encoding_name or DEFAULT_ENCODING_NAME)
+
+
+@lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
+def _count_tokens_cached(encoding: tiktoken.Encoding, string: str) -> int:
+    return len(encoding.encode(string))
+
+
+def count_tokens(string: str, encoding: tiktoken.Encoding) -> int:
+    """Return the number of tokens in a text string for the given encoder."""
+    if len(string) > TOKEN_COUNT_CACHE_MAX_LENGTH:
+        return len(encoding.encode(string))
+    return _count_tokens_cached(encoding, string)
+
+
+def count_tokens_batch(
+    strings: Iterable[str], encoding: tiktoken.Encoding
+) -> list[int]:
+    """Return the number of tokens in each text string for the given encoder."""
+    strings = list(strings)
+    if len(strings) < ENCODE_BATCH_MIN_SIZE:
+        return [count_tokens(string, encoding) for string in strings]
+    return [len(tokens) for tokens in encoding.encode_batch(strings)]
+
+
+def num_tokens_from_string(
+    string: str, model: str | None = None, encoding_name: str | None = None
+) -> int:
+    """Return the number of tokens in a text string."""
+    return count_tokens(string, get_encoding(model, encoding_name))
+
+
+def num_tokens_from_strings(
+    strings: Iterable[str], model: str | None = None, encoding_name: str | None = None
+) -> list[int]:
+    """Return the number of tokens in each text string."""
+    return count_tokens_batch(strings, get_encoding(model, encoding_name))
+
+
+def string_from_tokens(
+    tokens: list[int], model: str | None = None, encoding_name: str | None = None
+) -> str:
+    """Return a text string from a list of tokens."""
+    if model is None and encoding_name is None:
+        msg = "Either model or encoding_name must be specified."
+        raise ValueError(msg)
+    return get_encoding(model, encoding_name).decode(tokens)
@@ -6,12 +6,17 @@
 from .azure_ai_search import AzureAISearch
 from .base import BaseVectorStore, VectorStoreDocument, VectorStoreSearchResult
 from .lancedb import LanceDBVectorStore
+from .numpy_store import NumpyVectorStore
+from .projection import EmbeddingProjection, EmbeddingProjectionType
 from .typing import VectorStoreFactory, VectorStoreType
 
 __all__ = [
     "AzureAISearch",
     "BaseVectorStore",
+    "EmbeddingProjection",
+    "EmbeddingProjectionType",
     "LanceDBVectorStore",
+    "NumpyVectorStore",
     "VectorStoreDocument",
     "VectorStoreFactory",
     "VectorStoreSearchResult",
@@ -3,12 +3,18 @@
 
 """A package containing the Azure AI Search  vector store implementation."""
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import numpy as np
 from azure.core.credentials import AzureKeyCredential
 from azure.identity import DefaultAzureCredential
+from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
 from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient as AsyncSearchClient
 from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import (
     HnswAlgorithmConfiguration,
@@ -60,6 +66,10 @@ class AzureAISearch(BaseVectorStore):
                 else DefaultAzureCredential(),
                 **audience_arg,
             )
+            # async clients are opened per request, see _async_client
+            self._url = url
+            self._api_key = api_key
+            self._audience_arg = audience_arg
             self.index_client = SearchIndexClient(
                 endpoint=url,
                 credential=AzureKeyCredential(api_key)
@@ -128,7 +138,9 @@ class AzureAISearch(BaseVectorStore):
         batch = [
             {
                 "id": doc.id,
-                "vector": doc.vector,
+                "vector": doc.vector.tolist()
+                if isinstance(doc.vector, np.ndarray)
+                else doc.vector,
                 "text": doc.text,
                 "attributes": json.dumps(doc.attributes),
             }
@@ -167,20 +179,61 @@ class AzureAISearch(BaseVectorStore):
             vector_queries=[vectorized_query],
         )
 
-        return [
-            VectorStoreSearchResult(
-                document=VectorStoreDocument(
-                    id=doc.get("id", ""),
-                    text=doc.get("text", ""),
-                    vector=doc.get("vector", []),
-                    attributes=(json.loads(doc.get("attributes", "{}"))),
-                ),
-                # Cosine similarity between 0.333 and 1.000
-                # https://learn.microsoft.com/en-us/azure/search/hybrid-search-ranking#scores-in-a-hybrid-search-results
-                score=doc["@search.score"],
+        return [_to_search_result(doc) for doc in response]
+
+    async def asimilarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a vector-based similarity search with the async client."""
+        async with self._async_client() as client:
+            return await _asearch(client, query_embedding, k)
+
+    async def asimilarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for each query vector concurrently.
+
+        Vector queries sent in one request are fused into a single ranking, so each query is its own request.
+        """
+        async with self._async_client() as client:
+            return list(
+                await asyncio.gather(*[
+                    _asearch(
+                        client,
+                        query_embedding.tolist()
+                        if isinstance(query_embedding, np.ndarray)
+                        else query_embedding,
+                        k,
+                    )
+                    for query_embedding in query_embeddings
+                ])
             )
-            for doc in response
-        ]
+
+    @asynccontextmanager
+    async def _async_client(self) -> AsyncIterator[AsyncSearchClient]:
+        """Open an async search client, closing it and its credential on exit."""
+        if self._api_key:
+            async with AsyncSearchClient(
+                endpoint=self._url,
+                index_name=self.collection_name,
+                credential=AzureKeyCredential(self._api_key),
+                **self._audience_arg,
+            ) as client:
+                yield client
+        else:
+            async with (
+                AsyncDefaultAzureCredential() as credential,
+                AsyncSearchClient(
+                    endpoint=self._url,
+                    index_name=self.collection_name,
+                    credential=credential,
+                    **self._audience_arg,
+                ) as client,
+            ):
+                yield client
 
     def similarity_search_by_text(
         self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
@@ -192,3 +245,31 @@ class AzureAISearch(BaseVectorStore):
                 query_embedding=query_embedding, k=k
             )
         return []
+
+
+async def _asearch(
+    client: AsyncSearchClient, query_embedding: list[float], k: int
+) -> list[VectorStoreSearchResult]:
+    vectorized_query = VectorizedQuery(
+        vector=query_embedding, k_nearest_neighbors=k, fields="vector"
+    )
+
+    response = await client.search(
+        vector_queries=[vectorized_query],
+    )
+
+    return [_to_search_result(doc) async for doc in response]
+
+
+def _to_search_result(doc: dict[str, Any]) -> VectorStoreSearchResult:
+    return VectorStoreSearchResult(
+        document=VectorStoreDocument(
+            id=doc.get("id", ""),
+            text=doc.get("text", ""),
+            vector=doc.get("vector", []),
+            attributes=(json.loads(doc.get("attributes", "{}"))),
+        ),
+        # Cosine similarity between 0.333 and 1.000
+        # https://learn.microsoft.com/en-us/azure/search/hybrid-search-ranking#scores-in-a-hybrid-search-results
+        score=doc["@search.score"],
+    )
@@ -3,11 +3,14 @@
 
 """Base classes for vector stores."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
-from graphrag.model.types import TextEmbedder
+import numpy as np
+
+from graphrag.model.types import AsyncTextEmbedder, TextEmbedder
 
 DEFAULT_VECTOR_SIZE: int = 1536
 
@@ -20,7 +23,7 @@ class VectorStoreDocument:
     """unique id for the document"""
 
     text: str | None
-    vector: list[float] | None
+    vector: list[float] | np.ndarray | None
 
     attributes: dict[str, Any] = field(default_factory=dict)
     """store any additional metadata, e.g. title, date ranges, etc"""
@@ -64,6 +67,12 @@ class BaseVectorStore(ABC):
     ) -> None:
         """Load documents into the vector-store."""
 
+    def create_index(self) -> None:
+        """Build the search index once the documents are loaded, if the store has one to build."""
+        # an optional hook rather than an abstract method, stores searched by a flat
+        # scan have no index to build and keep this no-op
+        return
+
     @abstractmethod
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
@@ -79,3 +88,43 @@ class BaseVectorStore(ABC):
     @abstractmethod
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
         """Build a query filter to filter documents by id."""
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for each query vector, returning the top k results of each query."""
+        return [
+            self.similarity_search_by_vector(query_embedding, k, **kwargs)
+            for query_embedding in query_embeddings
+        ]
+
+    async def asimilarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform ANN search by vector without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.similarity_search_by_vector, query_embedding, k, **kwargs
+        )
+
+    async def asimilarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform ANN search for each query vector without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.similarity_search_by_vectors, query_embeddings, k, **kwargs
+        )
+
+    async def asimilarity_search_by_text(
+        self, text: str, text_embedder: AsyncTextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform ANN search by text, embedding it with an async embedder."""
+        query_embedding = await text_embedder(text)
+        if query_embedding:
+            return await self.asimilarity_search_by_vector(query_embedding, k, **kwargs)
+        return []
@@ -7,19 +7,57 @@ import lancedb as lancedb  # noqa: I001 (Ruff was breaking on this file imports,
 from graphrag.model.types import TextEmbedder
 
 import json
-from typing import Any
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+from uuid import uuid4
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
+from lancedb.table import LanceTable
 
 from .base import (
+    DEFAULT_VECTOR_SIZE,
     BaseVectorStore,
     VectorStoreDocument,
     VectorStoreSearchResult,
 )
 
+log = logging.getLogger(__name__)
+
+# Tables with fewer rows are searched by brute force rather than indexed
+DEFAULT_INDEX_MIN_ROWS = 100_000
+# Above this many ids, filter_by_id searches a table of the matching documents
+# instead of applying an `id in (...)` prefilter to every search
+DEFAULT_FILTER_TABLE_MIN_IDS = 1_000
+# Index types accepted by index_type, as named by LanceDB
+INDEX_TYPES = {
+    "ivf_pq": "IVF_PQ",
+    "hnsw": "IVF_HNSW_SQ",
+    "ivf_hnsw_sq": "IVF_HNSW_SQ",
+    "ivf_hnsw_pq": "IVF_HNSW_PQ",
+}
+
 
 class LanceDBVectorStore(BaseVectorStore):
-    """The LanceDB vector storage implementation."""
+    """The LanceDB vector storage implementation.
+
+    Besides db_uri, the following optional settings tune the vector index:
+    - index_type: ivf_pq or hnsw (IVF_HNSW_SQ), no index is built by default
+    - index_min_rows: collections with fewer rows are not indexed, default 100000
+    - num_partitions: the number of IVF partitions, default the square root of the row count
+    - num_sub_vectors: the number of PQ sub-vectors, default a divisor of the vector size near size / 16
+    - nprobes: the number of partitions searched per query
+    - refine_factor: re-rank this many times k candidates with the full vectors
+    - search_threads: the number of threads running the queries of a batch search
+    - filter_table_min_ids: id filters at least this long are applied by searching a table
+      of the matching documents, default 1000
+    """
+
+    filtered_collection: Any | None = None
 
     def connect(self, **kwargs: Any) -> Any:
         """Connect to the vector storage."""
@@ -30,74 +68,217 @@ class LanceDBVectorStore(BaseVectorStore):
         self, documents: list[VectorStoreDocument], overwrite: bool = True
     ) -> None:
         """Load documents into vector storage."""
-        data = [
-            {
-                "id": document.id,
-                "text": document.text,
-                "vector": document.vector,
-                "attributes": json.dumps(document.attributes),
-            }
-            for document in documents
-            if document.vector is not None
-        ]
-
-        if len(data) == 0:
-            data = None
-
-        schema = pa.schema([
-            pa.field("id", pa.string()),
-            pa.field("text", pa.string()),
-            pa.field("vector", pa.list_(pa.float64())),
-            pa.field("attributes", pa.string()),
+        self._drop_filtered_documents()
+        data = _documents_to_arrow([
+            document for document in documents if document.vector is not None
         ])
+
         if overwrite:
-            if data:
+            if data is not None:
                 self.document_collection = self.db_connection.create_table(
                     self.collection_name, data=data, mode="overwrite"
                 )
             else:
                 self.document_collection = self.db_connection.create_table(
-                    self.collection_name, schema=schema, mode="overwrite"
+                    self.collection_name,
+                    schema=_schema(self.kwargs.get("vector_size", DEFAULT_VECTOR_SIZE)),
+                    mode="overwrite",
                 )
         else:
             # add data to existing table
-            self.document_collection = self.db_connection.open_table(
-                self.collection_name
-            )
-            if data:
+            self.migrate_vectors()
+            if data is None:
+                return
+            if self.document_collection.count_rows() == 0:
+                # the vector size of an empty table is a guess, let the data decide
+                self.document_collection = self.db_connection.create_table(
+                    self.collection_name, data=data, mode="overwrite"
+                )
+            else:
                 self.document_collection.add(data)
 
+    def migrate_vectors(self) -> bool:
+        """Open the collection and rewrite its vectors as float32 if they are stored with another type.
+
+        Returns True when the collection was migrated.
+        """
+        self.document_collection = self.db_connection.open_table(self.collection_name)
+        vector_type = self.document_collection.schema.field("vector").type
+        if _is_float32_vector(vector_type):
+            return False
+
+        log.info(
+            "migrating %s vectors from %s to float32", self.collection_name, vector_type
+        )
+        table = self.document_collection.to_arrow()
+        vectors = _to_float32_vectors(table.column("vector").combine_chunks())
+        table = table.set_column(
+            table.schema.get_field_index("vector"), "vector", vectors
+        )
+        self.document_collection = self.db_connection.create_table(
+            self.collection_name, data=table, mode="overwrite"
+        )
+        return True
+
+    def create_index(self) -> None:
+        """Build the configured vector index over the loaded documents."""
+        index_type = self.kwargs.get("index_type")
+        if not index_type or self.document_collection is None:
+            return
+        if not isinstance(self.document_collection, LanceTable):
+            log.warning(
+                "not indexing %s, only local LanceDB tables take an index type",
+                self.collection_name,
+            )
+            return
+        if str(index_type).lower() not in INDEX_TYPES:
+            msg = f"Unknown LanceDB index type: {index_type}"
+            raise ValueError(msg)
+
+        num_rows = self.document_collection.count_rows()
+        index_min_rows = self.kwargs.get("index_min_rows", DEFAULT_INDEX_MIN_ROWS)
+        if num_rows < index_min_rows:
+            log.info(
+                "not indexing %s, %d rows is below the %d rows threshold",
+                self.collection_name,
+                num_rows,
+                index_min_rows,
+            )
+            return
+        vector_type = self.document_collection.schema.field("vector").type
+        if not pa.types.is_fixed_size_list(vector_type):
+            log.warning(
+                "not indexing %s, its vectors do not have a fixed size",
+                self.collection_name,
+            )
+            return
+
+        vector_size = vector_type.list_size
+        num_partitions = self.kwargs.get("num_partitions") or max(
+            1, int(math.sqrt(num_rows))
+        )
+        num_sub_vectors = self.kwargs.get("num_sub_vectors") or next(
+            size
+            for size in (vector_size // 16, vector_size // 8, vector_size // 4, 1)
+            if size > 0 and vector_size % size == 0
+        )
+        start = time.time()
+        self.document_collection.create_index(
+            metric="L2",
+            vector_column_name="vector",
+            num_partitions=num_partitions,
+            num_sub_vectors=num_sub_vectors,
+            index_type=INDEX_TYPES[str(index_type).lower()],
+            replace=True,
+        )
+        log.info(
+            "built %s index on %s (%d rows, %d partitions, %d sub-vectors) in %.2fs",
+            index_type,
+            self.collection_name,
+            num_rows,
+            num_partitions,
+            num_sub_vectors,
+            time.time() - start,
+        )
+
     def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
-        """Build a query filter to filter documents by id."""
+        """Build a query filter to filter documents by id.
+
+        Short id lists become an `id in (...)` SQL prefilter. Longer lists are kept as an
+        Arrow array, and searches run against a table of the matching documents.
+        """
+        self._drop_filtered_documents()
+        filter_table_min_ids = self.kwargs.get(
+            "filter_table_min_ids", DEFAULT_FILTER_TABLE_MIN_IDS
+        )
         if len(include_ids) == 0:
             self.query_filter = None
+        elif len(include_ids) >= filter_table_min_ids:
+            self.query_filter = pa.array(include_ids)
         else:
-            if isinstance(include_ids[0], str):
-                id_filter = ", ".join([f"'{id}'" for id in include_ids])
-                self.query_filter = f"id in ({id_filter})"
-            else:
-                self.query_filter = (
-                    f"id in ({', '.join([str(id) for id in include_ids])})"
-                )
+            id_filter = ", ".join([
+                "'" + id.replace("'", "''") + "'" if isinstance(id, str) else str(id)
+                for id in include_ids
+            ])
+            self.query_filter = f"id in ({id_filter})"
         return self.query_filter
 
+    def _filtered_documents(self) -> Any:
+        """Return the table of the documents whose id is in the filter, creating it if needed."""
+        if self.filtered_collection is None:
+            # only the id column is scanned, the matching rows are then taken by position
+            dataset = cast(LanceTable, self.document_collection).to_lance()
+            ids = dataset.to_table(columns=["id"]).column("id")
+            value_set = cast(pa.Array, self.query_filter).cast(ids.type)
+            # pyarrow.compute functions are generated at import time, the stubs lack them
+            is_included = pc.is_in(ids, value_set=value_set)  # pyright: ignore[reportAttributeAccessIssue]
+            positions = pc.indices_nonzero(is_included.fill_null(False))  # pyright: ignore[reportAttributeAccessIssue]
+            # the table name is unique so that stores sharing a database do not
+            # overwrite each other's filtered documents
+            self.filtered_collection = self.db_connection.create_table(
+                f"{self.collection_name}_filtered_{uuid4().hex}",
+                data=dataset.take(positions.to_pylist()),
+            )
+        return self.filtered_collection
+
+    def _drop_filtered_documents(self) -> None:
+        """Drop the table of the documents matching the previous filter, if any."""
+        if self.filtered_collection is not None:
+            self.db_connection.drop_table(self.filtered_collection.name)
+            self.filtered_collection = None
+
     def similarity_search_by_vector(
         self, query_embedding: list[float], k: int = 10, **kwargs: Any
     ) -> list[VectorStoreSearchResult]:
         """Perform a vector-based similarity search."""
-        if self.query_filter:
-            docs = (
-                self.document_collection.search(query=query_embedding)
-                .where(self.query_filter, prefilter=True)
-                .limit(k)
-                .to_list()
-            )
-        else:
-            docs = (
-                self.document_collection.search(query=query_embedding)
-                .limit(k)
-                .to_list()
+        return self._search(self._search_collection(), query_embedding, k)
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform a vector-based similarity search for each query vector.
+
+        LanceDB releases the GIL while searching, so the queries run on a thread pool.
+        """
+        collection = self._search_collection()
+        if len(query_embeddings) <= 1:
+            return [
+                self._search(collection, query_embedding, k)
+                for query_embedding in query_embeddings
+            ]
+        with ThreadPoolExecutor(
+            max_workers=self.kwargs.get("search_threads")
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda query_embedding: self._search(
+                        collection, query_embedding, k
+                    ),
+                    query_embeddings,
+                )
             )
+
+    def _search_collection(self) -> Any:
+        return (
+            self._filtered_documents()
+            if isinstance(self.query_filter, pa.Array)
+            else self.document_collection
+        )
+
+    def _search(
+        self, collection: Any, query_embedding: list[float] | np.ndarray, k: int
+    ) -> list[VectorStoreSearchResult]:
+        query = collection.search(query=query_embedding)
+        if self.kwargs.get("nprobes"):
+            query = query.nprobes(self.kwargs["nprobes"])
+        if self.kwargs.get("refine_factor"):
+            query = query.refine_factor(self.kwargs["refine_factor"])
+        if isinstance(self.query_filter, str):
+            query = query.where(self.query_filter, prefilter=True)
+        docs = query.limit(k).to_list()
         return [
             VectorStoreSearchResult(
                 document=VectorStoreDocument(
@@ -119,3 +300,61 @@ class LanceDBVectorStore(BaseVectorStore):
         if query_embedding:
             return self.similarity_search_by_vector(query_embedding, k)
         return []
+
+
+def _schema(vector_size: int) -> pa.Schema:
+    return pa.schema([
+        pa.field("id", pa.string()),
+        pa.field("text", pa.string()),
+        pa.field("vector", pa.list_(pa.float32(), vector_size)),
+        pa.field("attributes", pa.string()),
+    ])
+
+
+def _documents_to_arrow(documents: list[VectorStoreDocument]) -> pa.Table | None:
+    """Build an Arrow table of the documents, with float32 fixed size vectors."""
+    if len(documents) == 0:
+        return None
+
+    vectors = [document.vector for document in documents]
+    try:
+        # numpy vectors are stacked without going through python lists
+        matrix = np.asarray(vectors, dtype=np.float32)
+    except ValueError:
+        matrix = None
+    if matrix is not None and matrix.ndim == 2:
+        vector_array = pa.FixedSizeListArray.from_arrays(
+            pa.array(matrix.ravel()), matrix.shape[1]
+        )
+    else:
+        # vectors of different sizes cannot share a fixed size list
+        vector_array = pa.array(
+            [np.asarray(vector, dtype=np.float32) for vector in vectors],
+            type=pa.list_(pa.float32()),
+        )
+
+    return pa.table({
+        "id": pa.array([document.id for document in documents]),
+        "text": pa.array([document.text for document in documents], pa.string()),
+        "vector": vector_array,
+        "attributes": pa.array(
+            [json.dumps(document.attributes) for document in documents], pa.string()
+        ),
+    })
+
+
+def _is_float32_vector(vector_type: pa.DataType) -> bool:
+    return (
+        pa.types.is_fixed_size_list(vector_type) or pa.types.is_list(vector_type)
+    ) and vector_type.value_type == pa.float32()
+
+
+def _to_float32_vectors(vectors: pa.Array) -> pa.Array:
+    """Convert list vectors of any float type to float32, fixed size when they all have the same size."""
+    # pyarrow.compute functions are generated at import time, the stubs lack them
+    value_lengths = pc.list_value_length(vectors)  # pyright: ignore[reportAttributeAccessIssue]
+    lengths = value_lengths.to_numpy(zero_copy_only=False)
+    if len(lengths) > 0 and vectors.null_count == 0 and (lengths == lengths[0]).all():
+        values = vectors.flatten().to_numpy(zero_copy_only=False).astype(np.float32)
+        return pa.FixedSizeListArray.from_arrays(pa.array(values), int(lengths[0]))
+    return vectors.cast(pa.list_(pa.float32()))
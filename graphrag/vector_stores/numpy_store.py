@@ -0,0 +1,209 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The in-process NumPy flat vector storage implementation package."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from graphrag.model.types import TextEmbedder
+
+from .base import (
+    BaseVectorStore,
+    VectorStoreDocument,
+    VectorStoreSearchResult,
+)
+
+
+class NumpyVectorStore(BaseVectorStore):
+    """An exact, in-process vector store over a contiguous float32 matrix.
+
+    Vectors are normalized when loaded, so a search is a single matrix-vector product
+    scored by cosine similarity. With a db_uri, the collection is written to
+    `<db_uri>/<collection_name>.npy` and `.json` files and memory-mapped when connecting.
+    """
+
+    _ids: list[str | int]
+    _texts: list[str | None]
+    _attributes: list[dict[str, Any]]
+    _vectors: np.ndarray
+    _row_by_id: dict[str | int, int]
+    _filter_ids: list[str] | list[int] | None
+
+    def connect(self, **kwargs: Any) -> Any:
+        """Connect to the vector storage, loading the persisted collection if there is one."""
+        db_uri = kwargs.get("db_uri")
+        self.db_connection = Path(db_uri) if db_uri else None
+        self._filter_ids = None
+        self._set_documents([], [], [], np.zeros((0, 0), dtype=np.float32))
+
+        if self.db_connection is not None and self._vectors_path.exists():
+            with self._metadata_path.open() as metadata_file:
+                metadata = json.load(metadata_file)
+            vectors = np.load(
+                self._vectors_path, mmap_mode="r" if kwargs.get("mmap", True) else None
+            )
+            self._set_documents(
+                metadata["ids"], metadata["texts"], metadata["attributes"], vectors
+            )
+
+    @property
+    def _vectors_path(self) -> Path:
+        return Path(self.db_connection or ".") / f"{self.collection_name}.npy"
+
+    @property
+    def _metadata_path(self) -> Path:
+        return Path(self.db_connection or ".") / f"{self.collection_name}.json"
+
+    def load_documents(
+        self, documents: list[VectorStoreDocument], overwrite: bool = True
+    ) -> None:
+        """Load documents into vector storage."""
+        documents = [document for document in documents if document.vector is not None]
+        vectors = _normalize(
+            np.asarray([document.vector for document in documents], dtype=np.float32)
+        )
+        ids = [document.id for document in documents]
+        texts = [document.text for document in documents]
+        attributes = [document.attributes for document in documents]
+        if not overwrite and len(self._ids) > 0:
+            if len(documents) > 0:
+                vectors = np.concatenate([self._vectors, vectors])
+            else:
+                vectors = self._vectors
+            ids = self._ids + ids
+            texts = self._texts + texts
+            attributes = self._attributes + attributes
+        elif len(documents) == 0:
+            vectors = np.zeros((0, 0), dtype=np.float32)
+
+        self._set_documents(ids, texts, attributes, vectors)
+        if self.db_connection is not None:
+            self._persist()
+
+    def _set_documents(
+        self,
+        ids: list[str | int],
+        texts: list[str | None],
+        attributes: list[dict[str, Any]],
+        vectors: np.ndarray,
+    ) -> None:
+        self._ids = ids
+        self._texts = texts
+        self._attributes = attributes
+        self._vectors = vectors.reshape(len(ids), -1) if len(ids) > 0 else vectors
+        self._row_by_id = {id: row for row, id in enumerate(ids)}
+        self.document_collection = self._vectors
+        self._update_filter()
+
+    def _persist(self) -> None:
+        """Write the collection, replacing the previous files once they are complete."""
+        directory = Path(self.db_connection or ".")
+        directory.mkdir(parents=True, exist_ok=True)
+        vectors_tmp = directory / f"{self.collection_name}.tmp.npy"
+        metadata_tmp = directory / f"{self.collection_name}.tmp.json"
+        np.save(vectors_tmp, np.ascontiguousarray(self._vectors))
+        with metadata_tmp.open("w") as metadata_file:
+            json.dump(
+                {
+                    "ids": self._ids,
+                    "texts": self._texts,
+                    "attributes": self._attributes,
+                },
+                metadata_file,
+            )
+        vectors_tmp.replace(self._vectors_path)
+        metadata_tmp.replace(self._metadata_path)
+
+    def filter_by_id(self, include_ids: list[str] | list[int]) -> Any:
+        """Build a query filter to filter documents by id."""
+        self._filter_ids = include_ids if len(include_ids) > 0 else None
+        self._update_filter()
+        return self.query_filter
+
+    def _update_filter(self) -> None:
+        """Build the boolean row mask of the id filter for the loaded documents."""
+        if self._filter_ids is None:
+            self.query_filter = None
+            return
+        mask = np.zeros(len(self._ids), dtype=bool)
+        rows = [self._row_by_id[id] for id in self._filter_ids if id in self._row_by_id]
+        mask[rows] = True
+        self.query_filter = mask
+
+    def similarity_search_by_vector(
+        self, query_embedding: list[float], k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform an exact vector-based similarity search."""
+        return self.similarity_search_by_vectors([query_embedding], k)[0]
+
+    def similarity_search_by_vectors(
+        self,
+        query_embeddings: list[list[float]] | np.ndarray,
+        k: int = 10,
+        **kwargs: Any,
+    ) -> list[list[VectorStoreSearchResult]]:
+        """Perform an exact vector-based similarity search for a matrix of query vectors."""
+        if len(self._ids) == 0 or k <= 0 or len(query_embeddings) == 0:
+            return [[] for _ in query_embeddings]
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32))
+
+        if self.query_filter is None:
+            candidates = None
+            scores = queries @ self._vectors.T
+        else:
+            candidates = np.flatnonzero(self.query_filter)
+            scores = queries @ self._vectors[candidates].T
+
+        k = min(k, scores.shape[1])
+        if k == 0:
+            return [[] for _ in query_embeddings]
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        rows = top if candidates is None else candidates[top]
+
+        return [
+            self._results(query_rows, query_scores)
+            for query_rows, query_scores in zip(
+                rows.tolist(), top_scores.tolist(), strict=True
+            )
+        ]
+
+    def _results(
+        self, rows: list[int], scores: list[float]
+    ) -> list[VectorStoreSearchResult]:
+        return [
+            VectorStoreSearchResult(
+                document=VectorStoreDocument(
+                    id=self._ids[row],
+                    text=self._texts[row],
+                    vector=self._vectors[row].tolist(),
+                    attributes=self._attributes[row],
+                ),
+                score=score,
+            )
+            for row, score in zip(rows, scores, strict=True)
+        ]
+
+    def similarity_search_by_text(
+        self, text: str, text_embedder: TextEmbedder, k: int = 10, **kwargs: Any
+    ) -> list[VectorStoreSearchResult]:
+        """Perform a similarity search using a given input text."""
+        query_embedding = text_embedder(text)
+        if query_embedding:
+            return self.similarity_search_by_vector(query_embedding, k)
+        return []
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length, leaving zero rows as they are."""
+    if vectors.size == 0:
+        return vectors
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
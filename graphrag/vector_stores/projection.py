@@ -0,0 +1,143 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the EmbeddingProjection model, a reduction fitted on an indexed corpus."""
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Largest int8 code used by the symmetric quantization
+INT8_MAX = 127
+
+
+class EmbeddingProjectionType(str, Enum):
+    """EmbeddingProjectionType class definition."""
+
+    pca = "pca"
+    truncate = "truncate"
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
+@dataclass
+class EmbeddingProjection:
+    """A dimensionality reduction, and optional int8 quantization, shared by indexed and query vectors.
+
+    Projected vectors are unit length, so cosine scores are kept by any of the vector stores.
+    Quantized vectors are stored as int8 codes of `projected / scale`. Query vectors are
+    transformed into the same units without rounding, which keeps their rankings against
+    the codes for both cosine and L2 distances.
+    """
+
+    type: EmbeddingProjectionType
+    dimensions: int
+    mean: np.ndarray | None = None
+    """The corpus mean removed before a PCA projection."""
+    components: np.ndarray | None = None
+    """The (dimensions, input dimensions) PCA components."""
+    scale: float | None = None
+    """The value of one int8 step, None if the vectors are not quantized."""
+
+    @classmethod
+    def fit(
+        cls,
+        vectors: np.ndarray,
+        projection_type: EmbeddingProjectionType | str = EmbeddingProjectionType.pca,
+        dimensions: int = 256,
+        quantize: bool = False,
+    ) -> "EmbeddingProjection":
+        """Fit a projection to the rows of a corpus matrix.
+
+        Truncation keeps the leading dimensions, which is only meaningful for embeddings
+        trained to be truncated (Matryoshka embeddings such as text-embedding-3-*).
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        projection = cls(
+            type=EmbeddingProjectionType(projection_type),
+            dimensions=min(dimensions, vectors.shape[1]),
+        )
+        if projection.type == EmbeddingProjectionType.pca:
+            mean = vectors.mean(axis=0)
+            centered = vectors - mean
+            # the components are the top eigenvectors of the covariance matrix, which
+            # is much smaller than the corpus for any realistic number of entities
+            eigenvalues, eigenvectors = np.linalg.eigh(
+                centered.T.astype(np.float64) @ centered
+            )
+            order = np.argsort(eigenvalues)[::-1][: projection.dimensions]
+            projection.mean = mean
+            projection.components = eigenvectors[:, order].T.astype(np.float32)
+        if quantize:
+            max_value = float(np.abs(projection.project(vectors)).max(initial=0.0))
+            projection.scale = (max_value or 1.0) / INT8_MAX
+        return projection
+
+    def project(self, vectors: np.ndarray) -> np.ndarray:
+        """Reduce the rows of a matrix to unit length vectors of the projected dimensions."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.type == EmbeddingProjectionType.pca:
+            reduced = (vectors - self.mean) @ np.asarray(self.components).T
+        else:
+            reduced = vectors[:, : self.dimensions]
+        norms = np.linalg.norm(reduced, axis=1, keepdims=True)
+        return (reduced / np.where(norms == 0, 1, norms)).astype(np.float32)
+
+    def transform(self, vectors: np.ndarray) -> np.ndarray:
+        """Transform query vectors into the space of the stored vectors."""
+        projected = self.project(vectors)
+        return projected / self.scale if self.scale else projected
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Encode corpus vectors for storage, as int8 codes when quantized."""
+        projected = self.project(vectors)
+        if not self.scale:
+            return projected
+        codes = np.rint(projected / self.scale)
+        return np.clip(codes, -INT8_MAX, INT8_MAX).astype(np.int8)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get a JSON serializable representation of the projection."""
+        return {
+            "type": self.type.value,
+            "dimensions": self.dimensions,
+            "mean": self.mean.tolist() if self.mean is not None else None,
+            "components": (
+                self.components.tolist() if self.components is not None else None
+            ),
+            "scale": self.scale,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EmbeddingProjection":
+        """Create a projection from its dict representation."""
+        return cls(
+            type=EmbeddingProjectionType(data["type"]),
+            dimensions=int(data["dimensions"]),
+            mean=(
+                np.asarray(data["mean"], dtype=np.float32)
+                if data.get("mean") is not None
+                else None
+            ),
+            components=(
+                np.asarray(data["components"], dtype=np.float32)
+                if data.get("components") is not None
+                else None
+            ),
+            scale=data.get("scale"),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EmbeddingProjection | None":
+        """Load a projection stored next to the index, None if there is none."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with path.open() as projection_file:
+            return cls.from_dict(json.load(projection_file))
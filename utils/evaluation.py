@@ -23,9 +23,15 @@ class TestCase:
 class QAEvaluator:
     """Evaluator for QA system performance."""
     
-    def __init__(self):
+    def __init__(self, embedding_cache=None):
+        """
+        Args:
+            embedding_cache: Optional QueryEmbeddingCache shared with the search engine,
+                its hit rate is included in the report
+        """
         self.test_cases: List[TestCase] = []
         self.results: List[Dict[str, Any]] = []
+        self.embedding_cache = embedding_cache
     
     def add_test_case(self, test_case: TestCase):
         """Add a test case."""
@@ -160,6 +166,13 @@ class QAEvaluator:
         report.append(f"Average Entity Match Score: {df['entity_match_score'].mean():.2f}")
         report.append(f"Average Source Match Score: {df['source_match_score'].mean():.2f}")
         
+        if self.embedding_cache is not None:
+            cache_stats = self.embedding_cache.stats()
+            report.append(
+                f"Query Embedding Cache Hit Rate: {cache_stats['hit_rate']:.2%} "
+                f"({cache_stats['hits'] + cache_stats['persistent_hits']} hits, {cache_stats['misses']} misses)"
+            )
+        
         # By category
         if 'category' in df.columns:
             report.append("\nScores by Category:")